@@ -8,13 +8,18 @@ import os
 
 from flask import Flask, abort, request
 
-from stockalert import WebhooksResource
+from stockalert import WebhookDispatcher, WebhookPayload, WebhookVerifier
 
 app = Flask(__name__)
 
 # Your webhook secret from StockAlert.pro
 WEBHOOK_SECRET = os.environ.get("STOCKALERT_WEBHOOK_SECRET", "your_webhook_secret")
 
+verifier = WebhookVerifier(WEBHOOK_SECRET, tolerance=300)
+
+# Handlers run on a thread pool, so the request is answered right away
+dispatcher = WebhookDispatcher(max_workers=4)
+
 
 @app.route("/webhook", methods=["POST"])
 def handle_webhook():
@@ -27,39 +32,47 @@ def handle_webhook():
         abort(401, "Missing signature")
 
     # Verify signature
-    if not WebhooksResource.verify_signature(raw_body, signature, WEBHOOK_SECRET):
+    if not verifier.verify(raw_body, signature, request.headers.get("X-StockAlert-Timestamp")):
         abort(401, "Invalid signature")
 
     # Parse the payload
     try:
-        payload = request.json
-    except json.JSONDecodeError:
-        abort(400, "Invalid JSON")
+        payload = WebhookPayload(json.loads(raw_body))
+    except (ValueError, KeyError, TypeError):
+        abort(400, "Invalid payload")
 
-    # Handle different event types
-    event_type = payload.get("event")
-
-    if event_type == "alert.triggered":
-        handle_alert_triggered(payload["data"])
-    else:
-        print(f"Unknown event type: {event_type}")
+    # Run every handler registered for this event
+    dispatcher.dispatch(payload)
 
     # Always return 200 OK
     return "", 200
 
 
-def handle_alert_triggered(data):
+@dispatcher.on("alert.triggered")
+def handle_alert_triggered(payload):
     """Handle alert triggered event"""
+    alert = payload.data["alert"]
+    stock = payload.data.get("stock", {})
     print("🚨 Alert Triggered!")
-    print(f"Symbol: {data['symbol']}")
-    print(f"Condition: {data['condition']} at ${data['threshold']}")
-    print(f"Current: ${data['current_value']}")
-    print(f"Reason: {data['reason']}")
+    print(f"Symbol: {alert['symbol']}")
+    print(f"Condition: {alert['condition']} at ${alert.get('threshold')}")
+    print(f"Current: ${stock.get('price')}")
 
     # Your custom logic here
     # e.g., send notification, execute trade, update database, etc.
 
 
+@dispatcher.on("alert.triggered", symbol="TSLA", concurrency=1)
+def handle_tsla(payload):
+    """Handlers can be narrowed to a symbol or condition and rate-limited"""
+    print(f"TSLA alert {payload.data['alert']['id']} triggered")
+
+
+@dispatcher.on("*")
+def log_event(payload):
+    print(f"Received {payload.event} ({payload.id})")
+
+
 if __name__ == "__main__":
     # For development only
     # In production, use a proper WSGI server like Gunicorn
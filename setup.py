@@ -44,6 +44,8 @@ setup(
     ],
     extras_require={
         "async": ["httpx>=0.24.0"],
+        "http2": ["httpx[http2]>=0.24.0"],
+        "orjson": ["orjson>=3.9.0"],
         "dev": [
             "pre-commit>=3.0.0",
             "pytest>=7.0.0",
@@ -2,7 +2,10 @@
 from typing import Any, Type
 
 from .__version__ import __version__
+from .batch import AlertBatch
+from .cache import ResponseCache
 from .client import StockAlert
+from .codec import JSONCodec
 from .exceptions import (
     APIError,
     AuthenticationError,
@@ -11,15 +14,28 @@ from .exceptions import (
     StockAlertError,
     ValidationError,
 )
+from .mirror import AlertMirror, AsyncAlertMirror
+from .rate_limit import RateLimiter
+from .streaming import AsyncStreamedPage, StreamedPage
 from .types import (
     Alert,
     AlertCondition,
     AlertStatus,
+    BulkResult,
     NotificationChannel,
     PaginatedResponse,
     UserSubscription,
     WebhookPayload,
 )
+from .webhooks import (
+    MemorySeenEvents,
+    RotatingWebhookVerifier,
+    SQLiteSeenEvents,
+    WebhookDispatcher,
+    WebhookEventStore,
+    WebhookReceiver,
+    WebhookVerifier,
+)
 
 
 def _build_missing_async_client(import_error: ImportError) -> Type[Any]:
@@ -51,12 +67,28 @@ __all__ = [
     "AuthenticationError",
     "ValidationError",
     "NetworkError",
+    "RateLimiter",
+    "ResponseCache",
+    "JSONCodec",
+    "AlertMirror",
+    "AsyncAlertMirror",
     "Alert",
+    "AlertBatch",
     "AlertCondition",
     "NotificationChannel",
     "AlertStatus",
     "PaginatedResponse",
+    "StreamedPage",
+    "AsyncStreamedPage",
+    "BulkResult",
     "UserSubscription",
     "WebhookPayload",
+    "WebhookReceiver",
+    "WebhookDispatcher",
+    "WebhookEventStore",
+    "WebhookVerifier",
+    "RotatingWebhookVerifier",
+    "MemorySeenEvents",
+    "SQLiteSeenEvents",
     "__version__",
 ]
@@ -1,5 +1,7 @@
 """Async client for StockAlert SDK."""
-from typing import Any, Optional, cast
+import asyncio
+import importlib.util
+from typing import Any, AsyncIterator, Dict, Optional, Tuple, Union, cast
 
 # Import httpx at runtime to make it optional
 try:
@@ -11,13 +13,32 @@ except ImportError as e:
     ) from e
 
 from .__version__ import __version__
-from .exceptions import APIError, AuthenticationError, ValidationError
+from .cache import (
+    DEFAULT_VALIDATOR_CACHE_SIZE,
+    ResponseCache,
+    ValidatorCache,
+    request_key,
+    resolve_response_cache,
+)
+from .codec import JSONCodec, resolve_codec
+from .exceptions import APIError, AuthenticationError, NetworkError, RateLimitError, ValidationError
+from .rate_limit import RateLimiter
 from .resources.async_alerts import AsyncAlertsResource
 from .resources.async_user import AsyncUserResource
 from .resources.async_webhooks import AsyncWebhooksResource
+from .retry import IDEMPOTENT_METHODS, RETRY_STATUS_CODES, backoff_delay, parse_retry_after
+from .singleflight import AsyncSingleFlight
 
 DEFAULT_BASE_URL = "https://stockalert.pro/api/v1"
 DEFAULT_TIMEOUT = 30
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[int]:
+    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+    return int(retry_after) if retry_after is not None else None
 
 
 class AsyncStockAlert:
@@ -27,6 +48,23 @@ class AsyncStockAlert:
     Example:
         >>> async with AsyncStockAlert(api_key="sk_your_api_key") as client:
         ...     alerts = await client.alerts.list()
+
+    Args:
+        http2: Multiplex concurrent requests over a single HTTP/2 connection.
+            Requires the ``h2`` package (``pip install stockalert[http2]``).
+        max_connections: Maximum number of open connections
+        max_keepalive_connections: Maximum number of idle pooled connections
+        keepalive_expiry: Seconds an idle connection is kept open
+        etag_cache_size: Number of GET responses kept for ETag /
+            Last-Modified revalidation (0 disables it)
+        cache: In-memory response cache for alerts.get, alerts.list and
+            user.get_subscription. ``True`` uses a default ResponseCache;
+            disabled by default.
+        codec: JSON backend for request and response bodies: ``"json"``
+            (default), ``"orjson"``, ``"ujson"``, ``"auto"`` for the fastest
+            installed one, or a JSONCodec instance
+        coalesce_requests: Share one in-flight request between concurrent
+            identical GETs (default: True)
     """
 
     def __init__(
@@ -36,6 +74,15 @@ class AsyncStockAlert:
         timeout: Optional[int] = None,
         max_retries: int = 3,
         bearer_token: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        http2: bool = False,
+        max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+        etag_cache_size: int = DEFAULT_VALIDATOR_CACHE_SIZE,
+        cache: Union[ResponseCache, bool, None] = None,
+        codec: Union[JSONCodec, str, None] = None,
+        coalesce_requests: bool = True,
     ):
         if not api_key:
             raise ValidationError("API key is required")
@@ -50,7 +97,25 @@ class AsyncStockAlert:
             "bearer_token": bearer_token,
         }
 
+        if http2 and importlib.util.find_spec("h2") is None:
+            raise ImportError(
+                "HTTP/2 support requires the h2 package. "
+                "Install it with: pip install stockalert[http2]"
+            )
+
+        self._http2 = http2
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+
         self._client: Optional[httpx.AsyncClient] = None
+        self._rate_limiter = rate_limiter or RateLimiter()
+        self._validators = ValidatorCache(etag_cache_size)
+        self._codec = resolve_codec(codec)
+        self._cache = resolve_response_cache(cache, self._codec)
+        self._flights = AsyncSingleFlight() if coalesce_requests else None
 
         # Initialize resources
         self.alerts = AsyncAlertsResource(self._config)
@@ -66,6 +131,8 @@ class AsyncStockAlert:
         self._client = httpx.AsyncClient(
             base_url=base_url,
             timeout=timeout,
+            http2=self._http2,
+            limits=self._limits,
             headers={
                 "X-API-Key": api_key,
                 "User-Agent": f"stockalert-python/{__version__}",
@@ -85,6 +152,11 @@ class AsyncStockAlert:
         if self._client:
             await self._client.aclose()
 
+    @property
+    def rate_limit(self) -> Dict[str, Any]:
+        """Current client-side view of the rate limit budget."""
+        return self._rate_limiter.state
+
     @property
     def client(self) -> httpx.AsyncClient:
         if not self._client:
@@ -104,6 +176,34 @@ class AsyncStockAlert:
         auth_mode: Optional[str] = None,
     ) -> Any:
         """Make an HTTP request to the API."""
+        if self._flights is None or method.upper() != "GET":
+            result, _ = await self._send_request(method, path, params, json, auth_mode)
+        else:
+            # Identical GETs issued concurrently share one HTTP call; each
+            # waiter decodes the shared body into its own objects
+            codec = self._codec
+            key = (request_key(path, params), auth_mode)
+            result, _ = await self._flights.do(
+                key,
+                lambda: self._send_request(method, path, params, json, auth_mode),
+                share=lambda sent: (codec.loads(sent[1]), sent[1]),
+            )
+
+        if return_full_response:
+            return result
+        if "data" in result:
+            return result["data"]
+        return result
+
+    async def _send_request(
+        self,
+        method: str,
+        path: str,
+        params: Any,
+        json: Any,
+        auth_mode: Optional[str],
+    ) -> Tuple[Any, bytes]:
+        """Send a request and return the decoded response with its raw body."""
         headers = None
         if auth_mode == 'bearer':
             bearer = self._config.get("bearer_token")
@@ -118,14 +218,140 @@ class AsyncStockAlert:
             base_headers["Authorization"] = f"Bearer {bearer}"
             headers = base_headers
 
-        response = await self.client.request(method, path, params=params, json=json, headers=headers)
+        # Revalidate cached GET responses instead of downloading them again
+        cache_key = request_key(path, params) if method.upper() == "GET" else None
+        conditional_headers = self._validators.conditional_headers(cache_key) if cache_key is not None else {}
+        request_headers = {**(headers or {}), **conditional_headers} if conditional_headers else headers
+
+        response = await self._send_with_retries(method, path, params, json, request_headers)
 
+        if cache_key is None:
+            return self._handle_response(response, return_full_response=True), response.content
+
+        cached = None
+        if response.status_code == 304:
+            cached = self._validators.get(cache_key)
+            if cached is None:
+                # The entry was evicted meanwhile, or a proxy answered: fetch the full body
+                response = await self._send_with_retries(method, path, params, json, headers)
+                if response.status_code == 304:
+                    raise APIError("Unexpected 304 Not Modified without a cached response", 304)
+        if cached is not None:
+            return self._codec.loads(cached), cached
+
+        result = self._handle_response(response, return_full_response=True)
+        self._validators.store(cache_key, response.headers, response.content)
+        return result, response.content
+
+    async def _send_with_retries(
+        self,
+        method: str,
+        path: str,
+        params: Any,
+        json: Any,
+        headers: Optional[Dict[str, str]],
+        stream: bool = False,
+    ) -> httpx.Response:
+        """
+        Send a request, retrying transient failures.
+
+        429 responses are retried after ``Retry-After`` for any method.
+        Timeouts and 5xx responses are retried with jittered exponential
+        backoff for idempotent methods only; connection failures are retried
+        for every method since the request never reached the server.
+
+        With ``stream`` the returned response body has not been read yet.
+        """
+        max_retries = cast(int, self._config["max_retries"])
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        content = self._codec.dumps(json) if json is not None else None
+        attempt = 0
+
+        while True:
+            await self._rate_limiter.acquire_async()
+            try:
+                request = self.client.build_request(
+                    method, path, params=params, content=content, headers=headers
+                )
+                response = await self.client.send(request, stream=stream)
+            except httpx.TransportError as e:
+                retryable = idempotent or isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+                if not retryable or attempt >= max_retries:
+                    if isinstance(e, httpx.TimeoutException):
+                        raise NetworkError("Request timeout") from e
+                    raise NetworkError(f"Connection error: {e}") from e
+                delay = backoff_delay(attempt)
+            else:
+                self._rate_limiter.update(response.headers)
+                if response.status_code == 429:
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    self._rate_limiter.penalize(retry_after)
+                elif response.status_code in RETRY_STATUS_CODES and idempotent:
+                    retry_after = None
+                else:
+                    return response
+                if attempt >= max_retries:
+                    return response
+                if stream:
+                    await response.aclose()
+                if retry_after is not None and self._rate_limiter.pace:
+                    # The limiter now holds this and every other request
+                    # until Retry-After has passed.
+                    delay = 0.0
+                elif retry_after is not None:
+                    delay = retry_after
+                else:
+                    delay = backoff_delay(attempt)
+
+            attempt += 1
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+    async def _open_stream(self, path: str, params: Any = None) -> httpx.Response:
+        """
+        Send a GET whose body is read incrementally by the caller.
+
+        Error responses are read and raised here; a successful response is
+        returned unread. Streamed bodies bypass the ETag and response caches.
+        """
+        response = await self._send_with_retries("GET", path, params, None, None, stream=True)
+        if not response.is_success:
+            try:
+                await response.aread()
+                self._handle_response(response, return_full_response=True)
+            finally:
+                await response.aclose()
+        return response
+
+    async def _stream_chunks(self, response: httpx.Response, chunk_size: int) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+        except httpx.TransportError as e:
+            raise NetworkError(f"Connection lost while streaming: {e}") from e
+
+    def _handle_response(self, response: httpx.Response, return_full_response: bool) -> Any:
+        """Translate an API response into data or an SDK exception."""
         # Parse response
         try:
-            result = response.json()
+            result = self._codec.decode(response)
         except Exception as e:
+            if response.status_code == 429:
+                raise RateLimitError(
+                    "Rate limit exceeded",
+                    retry_after=_retry_after_seconds(response),
+                ) from e
             raise APIError(f"Invalid JSON response: {response.text}", response.status_code) from e
 
+        # Handle rate limits
+        if response.status_code == 429:
+            error_data = result.get("error", {})
+            if isinstance(error_data, dict):
+                error_msg = error_data.get("message", "Rate limit exceeded")
+            else:
+                error_msg = str(error_data) if error_data else "Rate limit exceeded"
+            raise RateLimitError(error_msg, retry_after=_retry_after_seconds(response))
+
         # Handle errors
         if response.status_code == 401:
             error_data = result.get("error", {})
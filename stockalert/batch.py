@@ -0,0 +1,223 @@
+"""Columnar alert storage for StockAlert SDK."""
+import math
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union, overload
+
+from .types import Alert, _parse_datetime
+
+# Low-cardinality string fields, stored as codes into a per-column dictionary
+STRING_COLUMNS = ("symbol", "condition", "notification", "status")
+# Numeric fields, stored as doubles with NaN for "missing"
+FLOAT_COLUMNS = ("threshold", "initial_price", "last_metric_value")
+# Datetime fields, stored as epoch seconds with NaN for "missing"
+TIME_COLUMNS = ("created_at", "triggered_at", "last_evaluated_at")
+
+COLUMNS = ("id",) + STRING_COLUMNS + FLOAT_COLUMNS + TIME_COLUMNS
+
+_NAN = float("nan")
+
+
+def _to_float(value: Any) -> float:
+    return _NAN if value is None else float(value)
+
+
+def _to_epoch(value: Any) -> float:
+    parsed = _parse_datetime(value)
+    return _NAN if parsed is None else parsed.timestamp()
+
+
+def _from_epoch(value: float) -> Optional[datetime]:
+    return None if math.isnan(value) else datetime.fromtimestamp(value, tz=timezone.utc)
+
+
+def _isoformat(value: float) -> Optional[str]:
+    parsed = _from_epoch(value)
+    return None if parsed is None else parsed.isoformat().replace("+00:00", "Z")
+
+
+class _DictColumn:
+    """Dictionary-encoded string column."""
+
+    __slots__ = ("values", "codes", "_lookup")
+
+    def __init__(self) -> None:
+        self.values: List[Optional[str]] = []
+        self.codes = array("I")
+        self._lookup: Dict[Optional[str], int] = {}
+
+    def encode(self, value: Optional[str]) -> int:
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def append(self, value: Optional[str]) -> None:
+        self.codes.append(self.encode(value))
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        return self.values[self.codes[index]]
+
+
+class AlertBatch:
+    """
+    Columnar container for many alerts.
+
+    Each field is held as a compact array instead of one ``Alert`` per row:
+    string fields (``symbol``, ``condition``, ``notification``, ``status``) are
+    dictionary-encoded, numbers and datetimes are packed doubles. Fields
+    without a column (``parameters``, ``stock``, ...) are kept per row only
+    when present. ``Alert`` objects are built only when a row is accessed.
+
+    Example:
+        >>> batch = AlertBatch.concat(client.alerts.iterate_batches())
+        >>> batch.value_counts("status")
+        {'active': 812, 'paused': 40}
+        >>> nvda = batch.where(symbol="NVDA", status="active")
+        >>> thresholds = nvda.column("threshold")
+    """
+
+    def __init__(self, records: Iterable[Dict[str, Any]] = ()) -> None:
+        self._ids: List[str] = []
+        self._strings = {name: _DictColumn() for name in STRING_COLUMNS}
+        self._floats = {name: array("d") for name in FLOAT_COLUMNS}
+        self._times = {name: array("d") for name in TIME_COLUMNS}
+        self._extras: List[Optional[Dict[str, Any]]] = []
+        self.extend(records)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "AlertBatch":
+        """Build a batch from raw alert payloads."""
+        return cls(records)
+
+    @classmethod
+    def concat(cls, batches: Iterable["AlertBatch"]) -> "AlertBatch":
+        """Join batches (e.g. the pages of ``iterate_batches``) into one."""
+        combined = cls()
+        for batch in batches:
+            combined._extend_batch(batch, range(len(batch)))
+        return combined
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Append raw alert payloads."""
+        for record in records:
+            self._ids.append(record["id"])
+            for name, column in self._strings.items():
+                column.append(record.get(name))
+            for name, values in self._floats.items():
+                values.append(_to_float(record.get(name)))
+            for name, values in self._times.items():
+                values.append(_to_epoch(record.get(name)))
+            extra = {key: value for key, value in record.items() if key not in COLUMNS}
+            self._extras.append(extra or None)
+
+    def _extend_batch(self, other: "AlertBatch", indices: Iterable[int]) -> None:
+        indices = list(indices)
+        self._ids.extend(other._ids[i] for i in indices)
+        for name, column in self._strings.items():
+            source = other._strings[name]
+            remap = [column.encode(value) for value in source.values]
+            column.codes.extend(remap[source.codes[i]] for i in indices)
+        for name, values in self._floats.items():
+            source_values = other._floats[name]
+            values.extend(source_values[i] for i in indices)
+        for name, values in self._times.items():
+            source_values = other._times[name]
+            values.extend(source_values[i] for i in indices)
+        self._extras.extend(other._extras[i] for i in indices)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @overload
+    def __getitem__(self, index: int) -> Alert: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "AlertBatch": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Alert, "AlertBatch"]:
+        if isinstance(index, slice):
+            return self.take(range(len(self))[index])
+        return Alert(self.row(index), keep_raw=False)
+
+    def __iter__(self) -> Iterator[Alert]:
+        for index in range(len(self)):
+            yield Alert(self.row(index), keep_raw=False)
+
+    def __repr__(self) -> str:
+        return f"<AlertBatch {len(self)} alerts>"
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Rebuild the payload dict for one row; datetimes come back as UTC ISO strings."""
+        if index < 0:
+            index += len(self)
+        data: Dict[str, Any] = {"id": self._ids[index]}
+        for name, column in self._strings.items():
+            data[name] = column[index]
+        for name, values in self._floats.items():
+            value = values[index]
+            data[name] = None if math.isnan(value) else value
+        for name, values in self._times.items():
+            data[name] = _isoformat(values[index])
+        extra = self._extras[index]
+        if extra:
+            data.update(extra)
+        return {key: value for key, value in data.items() if value is not None}
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Rebuild every row as a payload dict."""
+        return [self.row(index) for index in range(len(self))]
+
+    def column(self, name: str) -> List[Any]:
+        """
+        Decode one field for every row.
+
+        Missing numbers and datetimes are returned as ``None``; datetimes are
+        timezone-aware UTC values.
+        """
+        if name == "id":
+            return list(self._ids)
+        if name in self._strings:
+            column = self._strings[name]
+            return [column.values[code] for code in column.codes]
+        if name in self._floats:
+            return [None if math.isnan(value) else value for value in self._floats[name]]
+        if name in self._times:
+            return [_from_epoch(value) for value in self._times[name]]
+        return [(extra or {}).get(name) for extra in self._extras]
+
+    def value_counts(self, name: str) -> Dict[Optional[str], int]:
+        """Count rows per value of a dictionary-encoded column."""
+        column = self._strings[name]
+        counts = [0] * len(column.values)
+        for code in column.codes:
+            counts[code] += 1
+        return {value: count for value, count in zip(column.values, counts) if count}
+
+    def take(self, indices: Sequence[int]) -> "AlertBatch":
+        """Return a new batch holding the given rows."""
+        batch = AlertBatch()
+        batch._extend_batch(self, indices)
+        return batch
+
+    def where(self, **equals: Optional[str]) -> "AlertBatch":
+        """
+        Select rows by exact match on dictionary-encoded columns.
+
+        Filters are compared against the column codes, so no row is decoded.
+        """
+        wanted = []
+        for name, value in equals.items():
+            if name not in self._strings:
+                raise KeyError(f"{name!r} is not a dictionary-encoded column")
+            if name == "symbol" and value is not None:
+                value = value.upper()
+            code = self._strings[name]._lookup.get(value)
+            if code is None:
+                return AlertBatch()
+            wanted.append((self._strings[name].codes, code))
+
+        return self.take(
+            [index for index in range(len(self)) if all(codes[index] == code for codes, code in wanted)]
+        )
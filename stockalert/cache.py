@@ -0,0 +1,193 @@
+"""Response caching for StockAlert SDK."""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Mapping, Optional, Set, Tuple, Union
+
+from .codec import JSONCodec, resolve_codec
+
+DEFAULT_VALIDATOR_CACHE_SIZE = 256
+
+# Sentinel for "every key" in ResponseCache.invalidate
+_ALL: Any = object()
+
+
+def request_key(path: str, params: Optional[Mapping[str, Any]] = None) -> Hashable:
+    """Build a hashable cache key for a GET request."""
+    if not params:
+        return (path, ())
+    return (path, tuple(sorted((str(k), str(v)) for k, v in params.items() if v is not None)))
+
+
+def _header(headers: Mapping[str, Any], name: str) -> Optional[str]:
+    value = headers.get(name)
+    return value if isinstance(value, str) and value else None
+
+
+class ValidatorCache:
+    """
+    Bounded LRU of GET response bodies and their validators.
+
+    Responses carrying an ``ETag`` or ``Last-Modified`` header are kept so the
+    next identical GET can be sent as a conditional request. When the API
+    answers ``304 Not Modified`` the stored body is decoded again instead of
+    being downloaded; since the raw bytes are kept, every caller gets its own
+    objects.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_VALIDATOR_CACHE_SIZE) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, Tuple[Optional[str], Optional[str], bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def conditional_headers(self, key: Hashable) -> Dict[str, str]:
+        """Headers that make a request conditional on the cached entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return {}
+
+        etag, last_modified, _ = entry
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """Return the cached response body for ``key`` (after a 304)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[2]
+
+    def store(self, key: Hashable, headers: Mapping[str, Any], body: bytes) -> None:
+        """Remember the response ``body`` if the response carried validators."""
+        if self.max_entries <= 0:
+            return
+
+        etag = _header(headers, "ETag")
+        last_modified = _header(headers, "Last-Modified")
+        if not etag and not last_modified:
+            with self._lock:
+                self._entries.pop(key, None)
+            return
+
+        with self._lock:
+            self._entries[key] = (etag, last_modified, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+DEFAULT_RESPONSE_CACHE_SIZE = 1024
+DEFAULT_RESPONSE_CACHE_TTL = 30.0
+
+
+class ResponseCache:
+    """
+    Opt-in in-memory TTL/LRU cache for read endpoints.
+
+    Entries are grouped by endpoint name (``"alerts.get"``, ``"alerts.list"``,
+    ``"user.subscription"``) so each endpoint can have its own TTL and be
+    invalidated as a whole. The least recently used entry is evicted once
+    ``max_entries`` is reached. Payloads are stored encoded and decoded on
+    every hit, so callers may mutate what they get back.
+
+    Args:
+        max_entries: Maximum number of cached responses (default: 1024)
+        ttl: Default time-to-live in seconds (default: 30)
+        ttls: Per-endpoint TTL overrides, e.g. ``{"user.subscription": 300}``
+        codec: JSON codec for stored payloads (default: the client's codec
+            with ``cache=True``, otherwise the standard library)
+
+    Example:
+        >>> client = StockAlert(api_key="sk_...", cache=ResponseCache(ttls={"alerts.list": 10}))
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_RESPONSE_CACHE_SIZE,
+        ttl: float = DEFAULT_RESPONSE_CACHE_TTL,
+        ttls: Optional[Mapping[str, float]] = None,
+        codec: Union[JSONCodec, str, None] = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.ttls: Dict[str, float] = dict(ttls or {})
+        self.codec = resolve_codec(codec)
+        self._entries: OrderedDict[Tuple[str, Hashable], Tuple[float, bytes]] = OrderedDict()
+        self._keys_by_endpoint: Dict[str, Set[Hashable]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, endpoint: str, key: Hashable = None) -> Optional[Any]:
+        """Return the cached payload, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get((endpoint, key))
+            if entry is None:
+                return None
+            expires_at, body = entry
+            if expires_at <= time.monotonic():
+                self._remove(endpoint, key)
+                return None
+            self._entries.move_to_end((endpoint, key))
+        return self.codec.loads(body)
+
+    def set(self, endpoint: str, key: Hashable, value: Any) -> None:
+        """Cache ``value`` for the endpoint's TTL."""
+        ttl = self.ttls.get(endpoint, self.ttl)
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+
+        body = self.codec.dumps(value)
+        with self._lock:
+            self._entries[(endpoint, key)] = (time.monotonic() + ttl, body)
+            self._entries.move_to_end((endpoint, key))
+            self._keys_by_endpoint.setdefault(endpoint, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                (old_endpoint, old_key), _ = self._entries.popitem(last=False)
+                self._keys_by_endpoint[old_endpoint].discard(old_key)
+
+    def invalidate(self, endpoint: str, key: Hashable = _ALL) -> None:
+        """Drop one entry, or every entry of ``endpoint`` when no key is given."""
+        with self._lock:
+            if key is _ALL:
+                for old_key in self._keys_by_endpoint.pop(endpoint, set()):
+                    self._entries.pop((endpoint, old_key), None)
+            else:
+                self._remove(endpoint, key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_endpoint.clear()
+
+    def _remove(self, endpoint: str, key: Hashable) -> None:
+        self._entries.pop((endpoint, key), None)
+        keys = self._keys_by_endpoint.get(endpoint)
+        if keys is not None:
+            keys.discard(key)
+
+
+def resolve_response_cache(
+    cache: Union[ResponseCache, bool, None], codec: Optional[JSONCodec] = None
+) -> Optional[ResponseCache]:
+    """Turn a client's ``cache`` argument into a ResponseCache (or None)."""
+    if cache is True:
+        return ResponseCache(codec=codec)
+    if isinstance(cache, ResponseCache):
+        return cache
+    return None
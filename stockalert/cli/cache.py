@@ -0,0 +1,214 @@
+"""On-disk alert cache for the StockAlert CLI."""
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS alerts (
+    id TEXT PRIMARY KEY,
+    symbol TEXT,
+    status TEXT,
+    data TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_alerts_symbol ON alerts (symbol);
+CREATE INDEX IF NOT EXISTS idx_alerts_status ON alerts (status);
+CREATE TABLE IF NOT EXISTS listings (
+    key TEXT PRIMARY KEY,
+    symbol TEXT,
+    status TEXT,
+    complete INTEGER NOT NULL,
+    ids TEXT NOT NULL,
+    meta TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+"""
+
+
+def default_cache_dir() -> str:
+    """Return the per-user cache directory for the CLI."""
+    override = os.environ.get("STOCKALERT_CACHE_DIR")
+    if override:
+        return override
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "stockalert")
+
+
+def default_cache_path(api_key: str) -> str:
+    """Cache file for one account; the API key is hashed, never stored."""
+    account = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(default_cache_dir(), f"alerts-{account}.sqlite3")
+
+
+def _listing_key(params: Dict[str, Any]) -> str:
+    return json.dumps({k: v for k, v in params.items() if v is not None}, sort_keys=True)
+
+
+class AlertCache:
+    """
+    SQLite-backed cache of alerts indexed by id, symbol and status.
+
+    Args:
+        path: Database file
+        max_age: Seconds a cached entry is served before it is considered stale
+    """
+
+    def __init__(self, path: str, max_age: float) -> None:
+        self.path = path
+        self.max_age = max_age
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "AlertCache":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def _fresh_after(self) -> float:
+        return time.time() - self.max_age
+
+    def get_alert(self, alert_id: str) -> Optional[Dict[str, Any]]:
+        """Return a fresh cached alert payload."""
+        row = self._conn.execute(
+            "SELECT data FROM alerts WHERE id = ? AND fetched_at >= ?",
+            (alert_id, self._fresh_after()),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_alerts(self, alerts: Iterable[Dict[str, Any]], fetched_at: Optional[float] = None) -> None:
+        """Store alert payloads."""
+        fetched_at = fetched_at or time.time()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO alerts (id, symbol, status, data, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (alert["id"], alert.get("symbol"), alert.get("status"), json.dumps(alert), fetched_at)
+                    for alert in alerts
+                ],
+            )
+
+    def get_listing(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Return a fresh cached ``alerts.list`` response for ``params``.
+
+        An identical earlier listing is replayed as-is. Otherwise a fresh,
+        complete listing of a broader filter (e.g. every alert) answers the
+        query through the symbol/status indexes.
+        """
+        fresh_after = self._fresh_after()
+        row = self._conn.execute(
+            "SELECT ids, meta FROM listings WHERE key = ? AND fetched_at >= ?",
+            (_listing_key(params), fresh_after),
+        ).fetchone()
+        if row:
+            ids = json.loads(row[0])
+            alerts = self._alerts_by_id(ids)
+            if alerts is not None:
+                return {"data": alerts, "meta": json.loads(row[1])}
+
+        if params.get("page", 1) != 1:
+            return None
+        return self._derive_listing(params, fresh_after)
+
+    def _alerts_by_id(self, ids: List[str]) -> Optional[List[Dict[str, Any]]]:
+        if not ids:
+            return []
+        placeholders = ", ".join("?" for _ in ids)
+        rows = self._conn.execute(
+            f"SELECT id, data FROM alerts WHERE id IN ({placeholders})", ids
+        ).fetchall()
+        by_id = {alert_id: data for alert_id, data in rows}
+        if len(by_id) != len(ids):
+            return None
+        return [json.loads(by_id[alert_id]) for alert_id in ids]
+
+    def _derive_listing(self, params: Dict[str, Any], fresh_after: float) -> Optional[Dict[str, Any]]:
+        symbol = params.get("symbol")
+        status = params.get("status")
+        source = self._conn.execute(
+            "SELECT ids, fetched_at FROM listings WHERE complete = 1 AND fetched_at >= ? "
+            "AND (symbol IS NULL OR symbol = ?) AND (status IS NULL OR status = ?) "
+            "ORDER BY fetched_at DESC LIMIT 1",
+            (fresh_after, symbol, status),
+        ).fetchone()
+        if not source:
+            return None
+
+        query = "SELECT id, data FROM alerts WHERE fetched_at >= ?"
+        args: List[Any] = [source[1]]
+        if symbol is not None:
+            query += " AND symbol = ?"
+            args.append(symbol)
+        if status is not None:
+            query += " AND status = ?"
+            args.append(status)
+        query += " ORDER BY rowid"
+        rows = self._conn.execute(query, args).fetchall()
+        # Keep the API's order from the source listing; alerts stored since come last
+        position = {alert_id: index for index, alert_id in enumerate(json.loads(source[0]))}
+        rows.sort(key=lambda row: position.get(row[0], len(position)))
+        alerts = [json.loads(data) for _, data in rows]
+
+        total = len(alerts)
+        limit = params.get("limit") or 50
+        alerts = alerts[:limit]
+        return {
+            "data": alerts,
+            "meta": {
+                "pagination": {
+                    "page": 1,
+                    "limit": limit,
+                    "total": total,
+                    "total_pages": max((total + limit - 1) // limit, 1),
+                },
+            },
+        }
+
+    def put_listing(self, params: Dict[str, Any], response: Dict[str, Any]) -> None:
+        """Store an ``alerts.list`` response and the alerts in it."""
+        fetched_at = time.time()
+        alerts = response.get("data", [])
+        meta = response.get("meta", {})
+        pagination = meta.get("pagination", {})
+        total = pagination.get("total")
+        complete = params.get("page", 1) == 1 and total is not None and total <= len(alerts)
+
+        self.put_alerts(alerts, fetched_at)
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO listings (key, symbol, status, complete, ids, meta, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    _listing_key(params),
+                    params.get("symbol"),
+                    params.get("status"),
+                    int(complete),
+                    json.dumps([alert["id"] for alert in alerts]),
+                    json.dumps(meta),
+                    fetched_at,
+                ),
+            )
+
+    def invalidate(self, alert_id: Optional[str] = None) -> None:
+        """Forget an alert and every cached listing."""
+        with self._conn:
+            if alert_id:
+                self._conn.execute("DELETE FROM alerts WHERE id = ?", (alert_id,))
+            self._conn.execute("DELETE FROM listings")
@@ -1,12 +1,16 @@
 """StockAlert CLI - Command line interface for StockAlert.pro."""
 import argparse
 import json
+import math
 import os
 import sys
-from typing import Any, List
+from typing import Any, List, Optional
 
 from stockalert import StockAlert, __version__
 from stockalert.exceptions import StockAlertError
+from stockalert.types import Alert, PaginatedResponse
+
+from .cache import AlertCache, default_cache_path
 
 
 def print_json(data: Any) -> None:
@@ -26,27 +30,66 @@ def get_client() -> StockAlert:
     return StockAlert(api_key=api_key)
 
 
+def get_cache(client: StockAlert, args: argparse.Namespace) -> Optional[AlertCache]:
+    """Open the on-disk cache when a staleness window is configured."""
+    max_age = getattr(args, "max_age", None)
+    if max_age is None:
+        env_max_age = os.environ.get("STOCKALERT_CACHE_MAX_AGE")
+        try:
+            max_age = float(env_max_age) if env_max_age else 0
+        except ValueError:
+            max_age = math.nan
+        if math.isnan(max_age):  # also rejects a literal "nan"
+            print(
+                f"Error: STOCKALERT_CACHE_MAX_AGE must be a number of seconds, got {env_max_age!r}",
+                file=sys.stderr,
+            )
+            sys.exit(2)
+    if max_age <= 0:
+        return None
+    return AlertCache(default_cache_path(client.api_key), max_age)
+
+
+def invalidate_cache(client: StockAlert, alert_id: Optional[str] = None) -> None:
+    """Drop cached entries affected by a write, if a cache exists."""
+    path = default_cache_path(client.api_key)
+    if os.path.exists(path):
+        with AlertCache(path, 0) as cache:
+            cache.invalidate(alert_id)
+
+
 def cmd_list(args: argparse.Namespace) -> None:
     """List alerts command."""
     client = get_client()
 
     params = {}
     if args.symbol:
-        params["symbol"] = args.symbol
+        params["symbol"] = args.symbol.upper()
     if args.status:
         params["status"] = args.status
     if args.limit:
         params["limit"] = args.limit
 
+    cache = get_cache(client, args)
     try:
-        response = client.alerts.list(**params)
+        cached = cache.get_listing(params) if cache and not args.refresh else None
+        if cached is not None:
+            response: Any = PaginatedResponse(
+                [Alert(alert_data) for alert_data in cached["data"]], cached["meta"]
+            )
+        else:
+            response = client.alerts.list(**params)
+            if cache:
+                cache.put_listing(params, response.to_dict())
 
         if args.json:
             print_json(response)
         else:
             alerts: List[Any]
             # Check if response is a dict with data key or direct list
-            if isinstance(response, dict) and "data" in response:
+            if isinstance(response, PaginatedResponse) or (
+                isinstance(response, dict) and "data" in response
+            ):
                 alerts = response["data"]
             elif isinstance(response, list):
                 alerts = response
@@ -67,6 +110,9 @@ def cmd_list(args: argparse.Namespace) -> None:
     except StockAlertError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        if cache:
+            cache.close()
 
 
 def cmd_create(args: argparse.Namespace) -> None:
@@ -87,6 +133,7 @@ def cmd_create(args: argparse.Namespace) -> None:
 
     try:
         alert = client.alerts.create(**data)
+        invalidate_cache(client)
 
         if args.json:
             print_json(alert.to_dict())
@@ -105,8 +152,15 @@ def cmd_get(args: argparse.Namespace) -> None:
     """Get alert command."""
     client = get_client()
 
+    cache = get_cache(client, args)
     try:
-        alert = client.alerts.get(args.alert_id)
+        cached = cache.get_alert(args.alert_id) if cache and not args.refresh else None
+        if cached is not None:
+            alert = Alert(cached)
+        else:
+            alert = client.alerts.get(args.alert_id)
+            if cache:
+                cache.put_alerts([alert.to_dict()])
 
         if args.json:
             print_json(alert.to_dict())
@@ -122,6 +176,9 @@ def cmd_get(args: argparse.Namespace) -> None:
     except StockAlertError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        if cache:
+            cache.close()
 
 
 def cmd_delete(args: argparse.Namespace) -> None:
@@ -136,6 +193,7 @@ def cmd_delete(args: argparse.Namespace) -> None:
                 return
 
         client.alerts.delete(args.alert_id)
+        invalidate_cache(client, args.alert_id)
         print(f"✅ Alert {args.alert_id} deleted")
     except StockAlertError as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -148,6 +206,7 @@ def cmd_pause(args: argparse.Namespace) -> None:
 
     try:
         result = client.alerts.pause(args.alert_id)
+        invalidate_cache(client, args.alert_id)
         alert_id = result.get("alertId", args.alert_id)
         print(f"✅ Alert {alert_id} paused")
     except StockAlertError as e:
@@ -161,6 +220,7 @@ def cmd_activate(args: argparse.Namespace) -> None:
 
     try:
         result = client.alerts.activate(args.alert_id)
+        invalidate_cache(client, args.alert_id)
         alert_id = result.get("alertId", args.alert_id)
         print(f"✅ Alert {alert_id} activated")
     except StockAlertError as e:
@@ -168,6 +228,20 @@ def cmd_activate(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
+def add_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add on-disk cache options to a read command."""
+    parser.add_argument(
+        "--max-age",
+        type=float,
+        metavar="SECONDS",
+        help="Serve cached results younger than this "
+             "(default: $STOCKALERT_CACHE_MAX_AGE; cache disabled when unset)",
+    )
+    parser.add_argument(
+        "--refresh", action="store_true", help="Ignore cached results and refetch"
+    )
+
+
 def main() -> None:
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -183,6 +257,7 @@ def main() -> None:
     list_parser.add_argument("--status", choices=["active", "paused", "triggered"])
     list_parser.add_argument("-l", "--limit", type=int, help="Limit results")
     list_parser.add_argument("-j", "--json", action="store_true", help="Output as JSON")
+    add_cache_arguments(list_parser)
     list_parser.set_defaults(func=cmd_list)
 
     # Create command
@@ -199,6 +274,7 @@ def main() -> None:
     get_parser = subparsers.add_parser("get", help="Get alert details")
     get_parser.add_argument("alert_id", help="Alert ID")
     get_parser.add_argument("-j", "--json", action="store_true", help="Output as JSON")
+    add_cache_arguments(get_parser)
     get_parser.set_defaults(func=cmd_get)
 
     # Delete command
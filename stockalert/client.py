@@ -1,10 +1,11 @@
 """StockAlert Python SDK Client."""
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 import requests
 
-from .__version__ import __version__
+from .cache import DEFAULT_VALIDATOR_CACHE_SIZE, ResponseCache, resolve_response_cache
+from .codec import JSONCodec, resolve_codec
 from .exceptions import (
     APIError,
     AuthenticationError,
@@ -13,9 +14,11 @@ from .exceptions import (
     StockAlertError,
     ValidationError,
 )
+from .rate_limit import RateLimiter
 from .resources.alerts import AlertsResource
 from .resources.user import UserResource
 from .resources.webhooks import WebhooksResource
+from .transport import Transport
 
 
 class StockAlert:
@@ -33,8 +36,35 @@ class StockAlert:
         max_retries: Optional[int] = None,
         debug: bool = False,
         bearer_token: Optional[str] = None,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        keep_alive: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        etag_cache_size: int = DEFAULT_VALIDATOR_CACHE_SIZE,
+        cache: Union[ResponseCache, bool, None] = None,
+        codec: Union[JSONCodec, str, None] = None,
+        coalesce_requests: bool = True,
     ):
-        """Initialize the StockAlert client."""
+        """
+        Initialize the StockAlert client.
+
+        Args:
+            pool_connections: Number of host connection pools to keep
+            pool_maxsize: Maximum number of pooled connections per host
+            keep_alive: Reuse connections between requests (default: True)
+            rate_limiter: Limiter pacing requests to the server-reported budget.
+                Pass one instance to several clients to share a budget.
+            etag_cache_size: Number of GET responses kept for ETag /
+                Last-Modified revalidation (0 disables it)
+            cache: In-memory response cache for alerts.get, alerts.list and
+                user.get_subscription. ``True`` uses a default ResponseCache;
+                disabled by default.
+            codec: JSON backend for request and response bodies: ``"json"``
+                (default), ``"orjson"``, ``"ujson"``, ``"auto"`` for the
+                fastest installed one, or a JSONCodec instance
+            coalesce_requests: Share one in-flight request between
+                concurrent identical GETs from different threads (default: True)
+        """
         if not api_key:
             raise ValidationError("API key is required")
 
@@ -47,15 +77,6 @@ class StockAlert:
         self.max_retries = max_retries or self.DEFAULT_MAX_RETRIES
         self.debug = debug
 
-        # Initialize session
-        self.session = requests.Session()
-        self.session.headers.update({
-            "X-API-Key": api_key,
-            "User-Agent": f"stockalert-python/{__version__}",
-            "Accept": "application/json",
-            "Content-Type": "application/json"
-        })
-
         # Create config dict for resources using BaseResource
         config = {
             "api_key": api_key,
@@ -63,11 +84,23 @@ class StockAlert:
             "timeout": self.timeout,
             "max_retries": self.max_retries,
             "bearer_token": bearer_token,
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "keep_alive": keep_alive,
+            "etag_cache_size": etag_cache_size,
+            "coalesce_requests": coalesce_requests,
         }
+
+        # One transport (and connection pool) shared by the client and all resources
+        json_codec = resolve_codec(codec)
+        response_cache = resolve_response_cache(cache, json_codec)
+        self._transport = Transport(config, rate_limiter, response_cache, json_codec)
+        self.session = self._transport.session
+
         # Initialize resources
-        self.alerts = AlertsResource(config)
-        self.user = UserResource(config)
-        self.webhooks = WebhooksResource(config)
+        self.alerts = AlertsResource(config, self._transport)
+        self.user = UserResource(config, self._transport)
+        self.webhooks = WebhooksResource(config, self._transport)
 
         # Rate limit tracking
         self._rate_limit_reset: Dict[str, float] = {}
@@ -86,6 +119,10 @@ class StockAlert:
         url = self.base_url.rstrip("/") + "/" + path.lstrip("/")
         timeout = timeout or self.timeout
 
+        rate_limiter = self._transport.rate_limiter
+        codec = self._transport.codec
+        body = codec.dumps(json) if json is not None else None
+
         # Check rate limit
         if url in self._rate_limit_reset:
             reset_time = self._rate_limit_reset[url]
@@ -104,20 +141,24 @@ class StockAlert:
                 if self.debug and attempt > 0:
                     print(f"[StockAlert SDK] Retry attempt {attempt}/{self.max_retries}")
 
+                rate_limiter.acquire()
                 response = self.session.request(
                     method=method,
                     url=url,
                     params=params,
-                    json=json,
+                    data=body,
                     timeout=timeout
                 )
 
+                rate_limiter.update(response.headers)
+
                 # Handle rate limits
                 if response.status_code == 429:
                     retry_after = int(response.headers.get("Retry-After", 60))
                     self._rate_limit_reset[url] = time.time() + retry_after
+                    rate_limiter.penalize(retry_after)
 
-                    data = response.json()
+                    data = codec.decode(response)
                     error_data = data.get("error", {})
                     if isinstance(error_data, dict):
                         error_msg = error_data.get("message", "Rate limit exceeded")
@@ -127,7 +168,7 @@ class StockAlert:
 
                 # Parse response
                 try:
-                    data = response.json()
+                    data = codec.decode(response)
                 except ValueError as e:
                     raise APIError(f"Invalid JSON response: {response.text}", response.status_code) from e
 
@@ -183,8 +224,17 @@ class StockAlert:
 
         raise last_error or StockAlertError("Request failed after retries")
 
+    @property
+    def rate_limit(self) -> Dict[str, Any]:
+        """Current client-side view of the rate limit budget."""
+        return self._transport.rate_limiter.state
+
+    def close(self) -> None:
+        """Close the shared connection pool."""
+        self._transport.close()
+
     def __enter__(self) -> "StockAlert":
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        self.session.close()
+        self.close()
@@ -0,0 +1,107 @@
+"""JSON codecs for StockAlert SDK."""
+import importlib
+import json
+from typing import Any, Union
+
+from .exceptions import ValidationError
+
+
+class JSONCodec:
+    """
+    Standard library JSON codec.
+
+    Subclasses swap in a faster backend. ``dumps`` always returns bytes so
+    request bodies are sent without an intermediate ``str``.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+    def decode(self, response: Any) -> Any:
+        """Decode a ``requests`` or ``httpx`` response body."""
+        return response.json()
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec backed by ``orjson``."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        self._orjson = _import_backend("orjson")
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)  # type: ignore[no-any-return]
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+    def decode(self, response: Any) -> Any:
+        # orjson.JSONDecodeError subclasses ValueError like json's
+        return self._orjson.loads(response.content)
+
+
+class UjsonCodec(JSONCodec):
+    """Codec backed by ``ujson``."""
+
+    name = "ujson"
+
+    def __init__(self) -> None:
+        self._ujson = _import_backend("ujson")
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._ujson.dumps(obj, ensure_ascii=False).encode("utf-8")  # type: ignore[no-any-return]
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._ujson.loads(data)
+
+    def decode(self, response: Any) -> Any:
+        return self._ujson.loads(response.content)
+
+
+CODECS = {
+    "json": JSONCodec,
+    "orjson": OrjsonCodec,
+    "ujson": UjsonCodec,
+}
+
+# Tried in order by codec="auto"
+_AUTO_ORDER = ("orjson", "ujson")
+
+
+def _import_backend(name: str) -> Any:
+    try:
+        return importlib.import_module(name)
+    except ImportError as e:
+        raise ImportError(
+            f"The {name} JSON codec requires the {name} package. "
+            f"Install it with: pip install {name}"
+        ) from e
+
+
+def resolve_codec(codec: Union[JSONCodec, str, None]) -> JSONCodec:
+    """
+    Turn the ``codec`` client option into a codec instance.
+
+    ``None`` or ``"json"`` selects the standard library, ``"auto"`` the
+    fastest installed backend, and a name or JSONCodec instance that backend.
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec is None:
+        return JSONCodec()
+    if codec == "auto":
+        for name in _AUTO_ORDER:
+            try:
+                return CODECS[name]()
+            except ImportError:
+                continue
+        return JSONCodec()
+    if codec not in CODECS:
+        raise ValidationError(f"Unknown JSON codec: {codec!r}")
+    return CODECS[codec]()
@@ -0,0 +1,284 @@
+"""Local alert mirror for StockAlert SDK."""
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from .exceptions import APIError
+from .types import Alert
+
+if TYPE_CHECKING:
+    from .resources.alerts import AlertsResource
+    from .resources.async_alerts import AsyncAlertsResource
+
+# Fields whose change means the mirrored copy is stale
+_FINGERPRINT_FIELDS = (
+    "status",
+    "triggered_at",
+    "updated_at",
+    "last_evaluated_at",
+    "last_metric_value",
+    "threshold",
+    "condition",
+    "notification",
+    "symbol",
+)
+
+
+def _fingerprint(alert: Alert) -> Tuple[Any, ...]:
+    data = alert.to_dict()
+    return tuple(str(data.get(field)) for field in _FINGERPRINT_FIELDS)
+
+
+class _AlertIndex:
+    """In-memory alert store with secondary indexes by symbol, status and condition."""
+
+    def __init__(self, params: Dict[str, Any]) -> None:
+        self._params = params
+        self._alerts: Dict[str, Alert] = {}
+        self._fingerprints: Dict[str, Tuple[Any, ...]] = {}
+        self._by_symbol: Dict[str, Set[str]] = {}
+        self._by_status: Dict[str, Set[str]] = {}
+        self._by_condition: Dict[str, Set[str]] = {}
+        self._lock = threading.RLock()
+        self.synced_at: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._alerts)
+
+    def __contains__(self, alert_id: object) -> bool:
+        return alert_id in self._alerts
+
+    def __iter__(self) -> Iterator[Alert]:
+        with self._lock:
+            return iter(list(self._alerts.values()))
+
+    def get(self, alert_id: str) -> Optional[Alert]:
+        """Return the mirrored alert, if present."""
+        return self._alerts.get(alert_id)
+
+    def query(
+        self,
+        symbol: Optional[str] = None,
+        status: Optional[str] = None,
+        condition: Optional[str] = None,
+    ) -> List[Alert]:
+        """
+        Find mirrored alerts matching every given filter.
+
+        Example:
+            >>> mirror.query(symbol="NVDA", status="active", condition="price_below")
+        """
+        with self._lock:
+            candidates: List[Set[str]] = []
+            if symbol is not None:
+                candidates.append(self._by_symbol.get(symbol.upper(), set()))
+            if status is not None:
+                candidates.append(self._by_status.get(status, set()))
+            if condition is not None:
+                candidates.append(self._by_condition.get(condition, set()))
+
+            if not candidates:
+                return list(self._alerts.values())
+
+            candidates.sort(key=len)
+            ids = candidates[0].intersection(*candidates[1:])
+            return [self._alerts[alert_id] for alert_id in ids]
+
+    def upsert(self, alert: Alert) -> bool:
+        """Add or replace an alert; returns True if anything changed."""
+        fingerprint = _fingerprint(alert)
+        with self._lock:
+            if self._fingerprints.get(alert.id) == fingerprint:
+                return False
+            self._unindex(alert.id)
+            self._alerts[alert.id] = alert
+            self._fingerprints[alert.id] = fingerprint
+            self._by_symbol.setdefault(alert.symbol, set()).add(alert.id)
+            self._by_status.setdefault(alert.status, set()).add(alert.id)
+            self._by_condition.setdefault(alert.condition, set()).add(alert.id)
+            return True
+
+    def remove(self, alert_id: str) -> bool:
+        """Drop an alert from the mirror; returns True if it was present."""
+        with self._lock:
+            if alert_id not in self._alerts:
+                return False
+            self._unindex(alert_id)
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._alerts.clear()
+            self._fingerprints.clear()
+            self._by_symbol.clear()
+            self._by_status.clear()
+            self._by_condition.clear()
+            self.synced_at = None
+
+    def _unindex(self, alert_id: str) -> None:
+        old = self._alerts.pop(alert_id, None)
+        self._fingerprints.pop(alert_id, None)
+        if old is None:
+            return
+        for index, key in (
+            (self._by_symbol, old.symbol),
+            (self._by_status, old.status),
+            (self._by_condition, old.condition),
+        ):
+            ids = index.get(key)
+            if ids is not None:
+                ids.discard(alert_id)
+                if not ids:
+                    del index[key]
+
+    def _matching_ids(self, filters: Dict[str, Any]) -> Set[str]:
+        return {
+            alert.id
+            for alert in self.query(
+                symbol=filters.get("symbol"),
+                status=filters.get("status"),
+                condition=filters.get("condition"),
+            )
+        }
+
+    def _merge_listing(self, alerts: List[Alert], filters: Dict[str, Any]) -> Tuple[Dict[str, int], Set[str]]:
+        """
+        Apply one listing pass.
+
+        Returns change counts and the IDs of mirrored alerts that matched the
+        filters before but were missing from the listing. After an unfiltered
+        pass those are deletions; after a filtered pass they changed in a way
+        the listing cannot show (e.g. their status) and must be re-fetched.
+        """
+        changes = {"added": 0, "updated": 0, "removed": 0}
+        with self._lock:
+            expected = self._matching_ids(filters) if filters else set(self._alerts)
+            seen: Set[str] = set()
+            for alert in alerts:
+                seen.add(alert.id)
+                existed = alert.id in self._alerts
+                if self.upsert(alert):
+                    changes["updated" if existed else "added"] += 1
+
+            missing = expected - seen
+            if not filters:
+                for alert_id in missing:
+                    self.remove(alert_id)
+                changes["removed"] = len(missing)
+                missing = set()
+
+            self.synced_at = time.time()
+        return changes, missing
+
+
+class AlertMirror(_AlertIndex):
+    """
+    Local copy of the account's alerts with in-memory indexes.
+
+    ``load()`` walks every alert once; ``refresh()`` then re-walks the
+    listing and only re-indexes alerts whose status, ``triggered_at``,
+    ``last_evaluated_at`` or other tracked fields changed. Combined with
+    ETag revalidation, unchanged pages cost a 304 round-trip instead of a download.
+
+    Example:
+        >>> mirror = client.alerts.mirror()
+        >>> mirror.query(symbol="NVDA", status="active", condition="price_below")
+        >>> mirror.refresh()
+    """
+
+    def __init__(
+        self, resource: "AlertsResource", concurrency: int = 1, keep_raw: bool = True, **params: Any
+    ) -> None:
+        super().__init__(params)
+        self._resource = resource
+        self._concurrency = concurrency
+        self._keep_raw = keep_raw
+
+    def _iterate(self, params: Dict[str, Any]) -> Iterator[Alert]:
+        return self._resource.iterate(concurrency=self._concurrency, keep_raw=self._keep_raw, **params)
+
+    def load(self) -> "AlertMirror":
+        """Replace the mirror with a full listing."""
+        alerts = list(self._iterate(self._params))
+        with self._lock:
+            self.clear()
+            self._merge_listing(alerts, {})
+        return self
+
+    def refresh(self, **filters: Any) -> Dict[str, int]:
+        """
+        Bring the mirror up to date.
+
+        Args:
+            **filters: Only re-walk alerts matching these ``alerts.list``
+                filters (e.g. ``status="active"``). Alerts that matched before
+                but no longer appear are re-fetched individually.
+
+        Returns:
+            Counts of ``added``, ``updated`` and ``removed`` alerts
+        """
+        params = {**self._params, **filters}
+        alerts = list(self._iterate(params))
+        changes, missing = self._merge_listing(alerts, filters)
+
+        for alert_id in missing:
+            try:
+                alert = self._resource.get(alert_id, self._keep_raw)
+            except APIError as e:
+                if e.status_code != 404:
+                    raise
+                self.remove(alert_id)
+                changes["removed"] += 1
+            else:
+                if self.upsert(alert):
+                    changes["updated"] += 1
+        return changes
+
+
+class AsyncAlertMirror(_AlertIndex):
+    """Async variant of :class:`AlertMirror`."""
+
+    def __init__(
+        self, resource: "AsyncAlertsResource", concurrency: int = 1, keep_raw: bool = True, **params: Any
+    ) -> None:
+        super().__init__(params)
+        self._resource = resource
+        self._concurrency = concurrency
+        self._keep_raw = keep_raw
+
+    async def load(self) -> "AsyncAlertMirror":
+        """Replace the mirror with a full listing."""
+        alerts = [
+            alert
+            async for alert in self._resource.iterate(
+                concurrency=self._concurrency, keep_raw=self._keep_raw, **self._params
+            )
+        ]
+        with self._lock:
+            self.clear()
+            self._merge_listing(alerts, {})
+        return self
+
+    async def refresh(self, **filters: Any) -> Dict[str, int]:
+        """Bring the mirror up to date; see :meth:`AlertMirror.refresh`."""
+        params = {**self._params, **filters}
+        alerts = [
+            alert
+            async for alert in self._resource.iterate(
+                concurrency=self._concurrency, keep_raw=self._keep_raw, **params
+            )
+        ]
+        changes, missing = self._merge_listing(alerts, filters)
+
+        for alert_id in missing:
+            try:
+                alert = await self._resource.get(alert_id, self._keep_raw)
+            except APIError as e:
+                if e.status_code != 404:
+                    raise
+                self.remove(alert_id)
+                changes["removed"] += 1
+            else:
+                if self.upsert(alert):
+                    changes["updated"] += 1
+        return changes
@@ -0,0 +1,174 @@
+"""Client-side rate limiting for StockAlert SDK."""
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional
+
+DEFAULT_WINDOW = 60.0
+
+
+def _header_number(headers: Mapping[str, Any], name: str) -> Optional[float]:
+    value = headers.get(name)
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _reset_timestamp(value: float, now: float) -> Optional[float]:
+    """Interpret ``X-RateLimit-Reset`` as epoch ms, epoch seconds or a delay."""
+    if value > 1e12:
+        reset_at = value / 1000
+    elif value > 1e9:
+        reset_at = value
+    else:
+        reset_at = now + value
+    return reset_at if reset_at > now else None
+
+
+class RateLimiter:
+    """
+    Token bucket that learns the API budget from ``X-RateLimit-*`` headers.
+
+    Every outgoing request reserves a token first. While the server-reported
+    budget lasts, requests go out immediately; once it is spent, callers wait
+    until the window resets instead of being rejected with a 429. A single
+    limiter is thread-safe and can be shared between sync and async clients
+    that use the same API key.
+
+    Args:
+        window: Length of the rate limit window in seconds, used when the
+            server does not send ``X-RateLimit-Reset`` (default: 60)
+        pace: Delay requests when the budget is spent (default: True). With
+            ``pace=False`` the limiter only tracks state.
+    """
+
+    def __init__(self, window: float = DEFAULT_WINDOW, pace: bool = True) -> None:
+        self.window = window
+        self.pace = pace
+        self._lock = threading.Lock()
+        self._limit: Optional[int] = None
+        self._tokens = 0.0
+        self._reset_at: Optional[float] = None
+        self._server_reset_at: Optional[float] = None
+        self._server_remaining: Optional[float] = None
+        self._blocked_until = 0.0
+        self._updated = time.time()
+
+    @property
+    def state(self) -> Dict[str, Any]:
+        """Current budget: ``limit``, ``remaining`` and ``reset`` (epoch seconds)."""
+        with self._lock:
+            now = time.time()
+            self._refill(now)
+            reset_at = self._reset_at
+            if self._blocked_until > now:
+                reset_at = max(reset_at or 0.0, self._blocked_until)
+            return {
+                "limit": self._limit,
+                "remaining": max(int(self._tokens), 0) if self._limit is not None else None,
+                "reset": reset_at,
+            }
+
+    def _refill(self, now: float) -> None:
+        if self._limit is None:
+            return
+
+        if self._reset_at is not None:
+            # Fixed window: the whole budget comes back at each reset.
+            if now >= self._reset_at:
+                windows = int((now - self._reset_at) // self.window) + 1
+                self._tokens = min(self._tokens + windows * self._limit, float(self._limit))
+                self._reset_at += windows * self.window
+        else:
+            # No reset reported: refill continuously at limit / window.
+            elapsed = now - self._updated
+            self._tokens = min(self._tokens + elapsed * self._limit / self.window, float(self._limit))
+
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Reserve one request; return how many seconds to wait before sending it."""
+        if not self.pace:
+            return 0.0
+
+        with self._lock:
+            now = time.time()
+            wait = max(self._blocked_until - now, 0.0)
+            if self._limit is None:
+                return wait
+
+            self._refill(now)
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return wait
+
+            deficit = -self._tokens
+            if self._reset_at is not None:
+                extra_windows = int((deficit - 1) // self._limit)
+                budget_wait = (self._reset_at - now) + extra_windows * self.window
+            else:
+                budget_wait = deficit * self.window / self._limit
+            return max(wait, budget_wait)
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a request may be sent."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def update(self, headers: Mapping[str, Any]) -> None:
+        """Learn the current budget from response headers."""
+        limit = _header_number(headers, "X-RateLimit-Limit")
+        if not limit or limit <= 0:
+            return
+        remaining = _header_number(headers, "X-RateLimit-Remaining")
+        reset = _header_number(headers, "X-RateLimit-Reset")
+
+        with self._lock:
+            now = time.time()
+            first_update = self._limit is None
+            self._refill(now)
+            self._limit = int(limit)
+
+            new_window = False
+            if reset is not None:
+                reset_at = _reset_timestamp(reset, now)
+                if reset_at is not None:
+                    previous = self._server_reset_at
+                    # Relative resets jitter with latency; a real new window moves it far
+                    new_window = previous is not None and reset_at - previous >= self.window / 2
+                    self._server_reset_at = reset_at
+                    self._reset_at = reset_at
+
+            if remaining is not None:
+                # The server is authoritative, but requests still in flight
+                # have already reserved tokens locally, so never hand back
+                # more than we think is left, unless the server's window
+                # reset before ours did (clock skew or latency).
+                refilled = self._server_remaining is not None and remaining > self._server_remaining
+                if first_update or new_window or refilled:
+                    self._tokens = remaining
+                else:
+                    self._tokens = min(self._tokens, remaining)
+                self._server_remaining = remaining
+            elif first_update:
+                self._tokens = float(self._limit)
+
+            self._updated = now
+
+    def penalize(self, retry_after: Optional[float]) -> None:
+        """Record a 429: hold all requests until ``retry_after`` seconds pass."""
+        with self._lock:
+            now = time.time()
+            self._blocked_until = max(self._blocked_until, now + (retry_after or self.window))
+            if self._limit is not None:
+                self._tokens = min(self._tokens, 0.0)
@@ -1,31 +1,53 @@
 """Alerts resource for StockAlert SDK."""
-from typing import Any, Dict, Generator, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Generator, Iterable, List, Optional, Sequence, Tuple
 
+from ..batch import AlertBatch
+from ..cache import ResponseCache, request_key
 from ..exceptions import ValidationError
-from ..types import Alert, PaginatedResponse
-from .alerts_base import AlertsResourceBase
+from ..mirror import AlertMirror
+from ..streaming import DEFAULT_STREAM_CHUNK_SIZE, StreamedPage
+from ..transport import Transport
+from ..types import Alert, BulkResult, PaginatedResponse
+from .alerts_base import DEFAULT_BULK_CONCURRENCY, AlertsResourceBase
 from .base import BaseResource
 
 
 class AlertsResource(AlertsResourceBase, BaseResource):
     """Alerts resource using shared BaseResource HTTP client."""
 
-    def __init__(self, config: Dict[str, Any]) -> None:
-        BaseResource.__init__(self, config)
+    def __init__(self, config: Dict[str, Any], transport: Optional[Transport] = None) -> None:
+        BaseResource.__init__(self, config, transport)
 
-    def list(self, **params: Any) -> PaginatedResponse:
+    @property
+    def _response_cache(self) -> Optional[ResponseCache]:
+        return self._transport.cache
+
+    def list(self, columnar: bool = False, keep_raw: bool = True, **params: Any) -> PaginatedResponse:
         """
         List alerts with optional filtering.
 
+        Args:
+            columnar: Return ``data`` as an AlertBatch instead of a list of
+                Alert objects
+            keep_raw: Keep each alert's source dict for ``to_dict()``
+                (default); ``False`` saves memory when holding many alerts
+            **params: Filters and pagination (``symbol``, ``status``,
+                ``page``, ``limit``, ...)
+
         Returns full response including data and meta with pagination info.
         """
         # Normalize symbol to uppercase
         if "symbol" in params:
             params["symbol"] = str(params["symbol"]).upper()
 
-        response = self._request("GET", "/alerts", params=params, return_full_response=True)
-        alerts = [Alert(alert_data) for alert_data in response.get("data", [])]
-        return PaginatedResponse(alerts, response.get("meta", {}))
+        cache_key = request_key("/alerts", params)
+        response = self._cached_list(cache_key)
+        if response is None:
+            response = self._request("GET", "/alerts", params=params, return_full_response=True)
+            self._remember_list(cache_key, response)
+        return self._paginated_alerts(response, columnar, keep_raw)
 
     def create(self, **data: Any) -> Alert:
         """Create a new alert."""
@@ -35,15 +57,20 @@ class AlertsResource(AlertsResourceBase, BaseResource):
 
         self._validate_create_request(data)
         response = self._request("POST", "/alerts", json_data=data)
+        self._forget_alert()
+        self._remember_alert(response)
         return Alert(response)
 
-    def get(self, alert_id: str) -> Alert:
-        """Get alert by ID."""
+    def get(self, alert_id: str, keep_raw: bool = True) -> Alert:
+        """Get alert by ID; ``keep_raw`` works as in ``list``."""
         if not alert_id:
             raise ValidationError("Alert ID is required")
 
-        response = self._request("GET", f"/alerts/{alert_id}")
-        return Alert(response)
+        response = self._cached_alert(alert_id)
+        if response is None:
+            response = self._request("GET", f"/alerts/{alert_id}")
+            self._remember_alert(response)
+        return Alert(response, keep_raw)
 
     def update(
         self,
@@ -80,6 +107,8 @@ class AlertsResource(AlertsResourceBase, BaseResource):
             raise ValidationError("At least one field must be provided for update")
 
         response = self._request("PUT", f"/alerts/{alert_id}", json_data=update_data)
+        self._forget_alert(alert_id)
+        self._remember_alert(response)
         return Alert(response)
 
     def pause(self, alert_id: str) -> Dict[str, Any]:
@@ -95,7 +124,9 @@ class AlertsResource(AlertsResourceBase, BaseResource):
         if not alert_id:
             raise ValidationError("Alert ID is required")
 
-        return self._request("POST", f"/alerts/{alert_id}/pause")
+        result = self._request("POST", f"/alerts/{alert_id}/pause")
+        self._forget_alert(alert_id)
+        return result
 
     def activate(self, alert_id: str) -> Dict[str, Any]:
         """
@@ -110,14 +141,18 @@ class AlertsResource(AlertsResourceBase, BaseResource):
         if not alert_id:
             raise ValidationError("Alert ID is required")
 
-        return self._request("POST", f"/alerts/{alert_id}/activate")
+        result = self._request("POST", f"/alerts/{alert_id}/activate")
+        self._forget_alert(alert_id)
+        return result
 
     def delete(self, alert_id: str) -> Dict[str, Any]:
         """Delete an alert."""
         if not alert_id:
             raise ValidationError("Alert ID is required")
 
-        return self._request("DELETE", f"/alerts/{alert_id}")
+        result = self._request("DELETE", f"/alerts/{alert_id}")
+        self._forget_alert(alert_id)
+        return result
 
     def history(self, alert_id: str, page: int = 1, limit: int = 50) -> PaginatedResponse:
         """
@@ -142,20 +177,204 @@ class AlertsResource(AlertsResourceBase, BaseResource):
         )
         return PaginatedResponse(response.get("data", []), response.get("meta", {}))
 
-    def iterate(self, **params: Any) -> Generator[Alert, None, None]:
-        """Iterate through all alerts with automatic pagination."""
+    def stream(self, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE, **params: Any) -> StreamedPage[Alert]:
+        """
+        List alerts, parsing the response while it downloads.
+
+        Takes the same filters as ``list``. Alerts are yielded one by one as
+        they arrive instead of after the whole page is parsed, keeping memory
+        flat for large pages; ``meta`` is available once the page is read.
+        Streamed pages bypass the ETag and response caches.
+
+        Example:
+            >>> with client.alerts.stream(limit=100) as page:
+            ...     for alert in page:
+            ...         print(alert.symbol)
+        """
+        if "symbol" in params:
+            params["symbol"] = str(params["symbol"]).upper()
+
+        response = self._open_stream("/alerts", params)
+        return StreamedPage(
+            self._stream_chunks(response, chunk_size), response.close, Alert, response.status_code
+        )
+
+    def stream_history(
+        self,
+        alert_id: str,
+        page: int = 1,
+        limit: int = 50,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> StreamedPage[Dict[str, Any]]:
+        """Get alert history, yielding entries as they arrive; see ``stream``."""
+        if not alert_id:
+            raise ValidationError("Alert ID is required")
+
+        response = self._open_stream(f"/alerts/{alert_id}/history", {"page": page, "limit": limit})
+        return StreamedPage(
+            self._stream_chunks(response, chunk_size), response.close, dict, response.status_code
+        )
+
+    def iterate(
+        self, concurrency: int = 1, keep_raw: bool = True, **params: Any
+    ) -> Generator[Alert, None, None]:
+        """
+        Iterate through all alerts with automatic pagination.
+
+        Args:
+            concurrency: Number of pages to fetch in parallel once the first
+                page reveals the page count (default: 1, one page at a time).
+                Alerts are still yielded in page order, and at most
+                ``concurrency`` pages are buffered at once.
+            keep_raw: Keep each alert's source dict for ``to_dict()``
+                (default); ``False`` saves memory when holding many alerts
+        """
+        for result in self._iter_pages(concurrency, False, params, keep_raw):
+            yield from result.data
+
+    def iterate_batches(self, concurrency: int = 1, **params: Any) -> Generator[AlertBatch, None, None]:
+        """
+        Iterate through all alerts one columnar AlertBatch per page.
+
+        Takes the same arguments as ``iterate``. Join the pages with
+        ``AlertBatch.concat`` to hold the whole account in one batch.
+        """
+        for result in self._iter_pages(concurrency, True, params):
+            yield result.data
+
+    def _iter_pages(
+        self, concurrency: int, columnar: bool, params: Dict[str, Any], keep_raw: bool = True
+    ) -> Generator[PaginatedResponse, None, None]:
+        if concurrency < 1:
+            raise ValidationError("concurrency must be at least 1")
+
         page = params.get("page", 1)
         limit = min(params.get("limit", 50), 100)
 
         # Remove pagination params from base params
         base_params = {k: v for k, v in params.items() if k not in ["limit", "page"]}
+        base_params["columnar"] = columnar
+        base_params["keep_raw"] = keep_raw
+
+        if concurrency == 1:
+            while True:
+                result = self.list(**base_params, limit=limit, page=page)
+
+                yield result
+
+                if page >= max(result.total_pages, 1):
+                    break
+
+                page += 1
+            return
+
+        first = self.list(**base_params, limit=limit, page=page)
+        last_page = max(first.total_pages, 1)
+
+        if page >= last_page:
+            yield first
+            return
+
+        next_page = page + 1
+        pending: Deque[Future[PaginatedResponse]] = deque()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            try:
+                # Start fetching while the caller consumes the first page
+                while next_page <= last_page and len(pending) < concurrency:
+                    pending.append(executor.submit(self.list, **base_params, limit=limit, page=next_page))
+                    next_page += 1
+
+                yield first
+
+                while pending:
+                    result = pending.popleft().result()
+                    # Keep the window full while the caller consumes this page
+                    if next_page <= last_page:
+                        pending.append(executor.submit(self.list, **base_params, limit=limit, page=next_page))
+                        next_page += 1
+                    yield result
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def mirror(self, concurrency: int = 1, keep_raw: bool = True, **params: Any) -> AlertMirror:
+        """
+        Load every alert into a local, indexed mirror.
+
+        Args:
+            concurrency: Pages fetched in parallel while loading/refreshing
+            keep_raw: Keep each mirrored alert's source dict (see ``list``)
+            **params: ``list`` filters limiting what is mirrored
 
-        while True:
-            result = self.list(**base_params, limit=limit, page=page)
+        Returns:
+            A loaded AlertMirror; call ``refresh()`` to update it
+        """
+        return AlertMirror(self, concurrency=concurrency, keep_raw=keep_raw, **params).load()
 
-            yield from result.data
+    def bulk_create(
+        self,
+        items: Iterable[Dict[str, Any]],
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> List[BulkResult]:
+        """
+        Create many alerts.
 
-            if page >= max(result.total_pages, 1):
-                break
+        Every item is validated before anything is sent. Valid items are then
+        created concurrently under the client's rate budget.
 
-            page += 1
+        Args:
+            items: Create requests, each with the same fields as ``create``
+            concurrency: Maximum number of requests in flight (default: 8)
+
+        Returns:
+            One BulkResult per item, in input order, holding either the
+            created Alert or the error for that item
+        """
+        results, work = self._prepare_bulk_create(items)
+        self._run_bulk(work, lambda data: self.create(**data), concurrency)
+        return results
+
+    def bulk_pause(
+        self, alert_ids: Iterable[str], concurrency: int = DEFAULT_BULK_CONCURRENCY
+    ) -> List[BulkResult]:
+        """Pause many alerts; returns one BulkResult per ID."""
+        results, work = self._prepare_bulk_ids(alert_ids)
+        self._run_bulk(work, self.pause, concurrency)
+        return results
+
+    def bulk_activate(
+        self, alert_ids: Iterable[str], concurrency: int = DEFAULT_BULK_CONCURRENCY
+    ) -> List[BulkResult]:
+        """Activate many alerts; returns one BulkResult per ID."""
+        results, work = self._prepare_bulk_ids(alert_ids)
+        self._run_bulk(work, self.activate, concurrency)
+        return results
+
+    def bulk_delete(
+        self, alert_ids: Iterable[str], concurrency: int = DEFAULT_BULK_CONCURRENCY
+    ) -> List[BulkResult]:
+        """Delete many alerts; returns one BulkResult per ID."""
+        results, work = self._prepare_bulk_ids(alert_ids)
+        self._run_bulk(work, self.delete, concurrency)
+        return results
+
+    def _run_bulk(
+        self,
+        work: Sequence[Tuple[BulkResult, Any]],
+        operation: Callable[[Any], Any],
+        concurrency: int,
+    ) -> None:
+        if concurrency < 1:
+            raise ValidationError("concurrency must be at least 1")
+        if not work:
+            return
+
+        def run(entry: Tuple[BulkResult, Any]) -> None:
+            result, argument = entry
+            try:
+                result.result = operation(argument)
+            except Exception as e:  # one failing item must not abort the batch
+                result.error = e
+
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(work))) as executor:
+            list(executor.map(run, work))
@@ -1,9 +1,27 @@
 """Async alerts resource."""
-from typing import Any, AsyncGenerator, Dict, Optional
+import asyncio
+from collections import deque
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
+from ..batch import AlertBatch
+from ..cache import ResponseCache, request_key
 from ..exceptions import ValidationError
-from ..types import Alert, PaginatedResponse
-from .alerts_base import AlertsResourceBase
+from ..mirror import AsyncAlertMirror
+from ..streaming import DEFAULT_STREAM_CHUNK_SIZE, AsyncStreamedPage
+from ..types import Alert, BulkResult, PaginatedResponse
+from .alerts_base import DEFAULT_BULK_CONCURRENCY, AlertsResourceBase
 
 
 class AsyncAlertsResource(AlertsResourceBase):
@@ -13,18 +31,27 @@ class AsyncAlertsResource(AlertsResourceBase):
         self._config = config
         self.client: Any = None  # Set by AsyncStockAlert
 
-    async def list(self, **params: Any) -> PaginatedResponse:
+    @property
+    def _response_cache(self) -> Optional[ResponseCache]:
+        return self.client._cache if self.client is not None else None
+
+    async def list(self, columnar: bool = False, keep_raw: bool = True, **params: Any) -> PaginatedResponse:
         """
         List alerts with optional filtering.
 
-        Returns full response including data and meta with pagination info.
+        Returns full response including data and meta with pagination info;
+        ``columnar=True`` returns ``data`` as an AlertBatch and
+        ``keep_raw=False`` drops each alert's source dict to save memory.
         """
         if "symbol" in params:
             params["symbol"] = str(params["symbol"]).upper()
 
-        response = await self.client._request("GET", "/alerts", params=params, return_full_response=True)
-        alerts = [Alert(alert_data) for alert_data in response.get("data", [])]
-        return PaginatedResponse(alerts, response.get("meta", {}))
+        cache_key = request_key("/alerts", params)
+        response = self._cached_list(cache_key)
+        if response is None:
+            response = await self.client._request("GET", "/alerts", params=params, return_full_response=True)
+            self._remember_list(cache_key, response)
+        return self._paginated_alerts(response, columnar, keep_raw)
 
     async def create(self, **data: Any) -> Alert:
         """Create a new alert."""
@@ -33,15 +60,20 @@ class AsyncAlertsResource(AlertsResourceBase):
 
         self._validate_create_request(data)
         response = await self.client._request("POST", "/alerts", json=data)
+        self._forget_alert()
+        self._remember_alert(response)
         return Alert(response)
 
-    async def get(self, alert_id: str) -> Alert:
-        """Get alert by ID."""
+    async def get(self, alert_id: str, keep_raw: bool = True) -> Alert:
+        """Get alert by ID; ``keep_raw`` works as in ``list``."""
         if not alert_id:
             raise ValidationError("Alert ID is required")
 
-        response = await self.client._request("GET", f"/alerts/{alert_id}")
-        return Alert(response)
+        response = self._cached_alert(alert_id)
+        if response is None:
+            response = await self.client._request("GET", f"/alerts/{alert_id}")
+            self._remember_alert(response)
+        return Alert(response, keep_raw)
 
     async def update(
         self,
@@ -78,6 +110,8 @@ class AsyncAlertsResource(AlertsResourceBase):
             raise ValidationError("At least one field must be provided for update")
 
         response = await self.client._request("PUT", f"/alerts/{alert_id}", json=update_data)
+        self._forget_alert(alert_id)
+        self._remember_alert(response)
         return Alert(response)
 
     async def pause(self, alert_id: str) -> Dict[str, Any]:
@@ -85,21 +119,27 @@ class AsyncAlertsResource(AlertsResourceBase):
         if not alert_id:
             raise ValidationError("Alert ID is required")
 
-        return await self.client._request("POST", f"/alerts/{alert_id}/pause")
+        result = await self.client._request("POST", f"/alerts/{alert_id}/pause")
+        self._forget_alert(alert_id)
+        return result
 
     async def activate(self, alert_id: str) -> Dict[str, Any]:
         """Activate/reactivate an alert."""
         if not alert_id:
             raise ValidationError("Alert ID is required")
 
-        return await self.client._request("POST", f"/alerts/{alert_id}/activate")
+        result = await self.client._request("POST", f"/alerts/{alert_id}/activate")
+        self._forget_alert(alert_id)
+        return result
 
     async def delete(self, alert_id: str) -> Dict[str, Any]:
         """Delete an alert."""
         if not alert_id:
             raise ValidationError("Alert ID is required")
 
-        return await self.client._request("DELETE", f"/alerts/{alert_id}")
+        result = await self.client._request("DELETE", f"/alerts/{alert_id}")
+        self._forget_alert(alert_id)
+        return result
 
     async def history(self, alert_id: str, page: int = 1, limit: int = 50) -> PaginatedResponse:
         """
@@ -119,20 +159,197 @@ class AsyncAlertsResource(AlertsResourceBase):
         )
         return PaginatedResponse(response.get("data", []), response.get("meta", {}))
 
-    async def iterate(self, **params: Any) -> AsyncGenerator[Alert, None]:
-        """Iterate through all alerts with automatic pagination."""
+    async def stream(
+        self, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE, **params: Any
+    ) -> AsyncStreamedPage[Alert]:
+        """
+        List alerts, parsing the response while it downloads.
+
+        See ``AlertsResource.stream``.
+
+        Example:
+            >>> async with await client.alerts.stream(limit=100) as page:
+            ...     async for alert in page:
+            ...         print(alert.symbol)
+        """
+        if "symbol" in params:
+            params["symbol"] = str(params["symbol"]).upper()
+
+        response = await self.client._open_stream("/alerts", params)
+        return AsyncStreamedPage(
+            self.client._stream_chunks(response, chunk_size), response.aclose, Alert, response.status_code
+        )
+
+    async def stream_history(
+        self,
+        alert_id: str,
+        page: int = 1,
+        limit: int = 50,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> AsyncStreamedPage[Dict[str, Any]]:
+        """Get alert history, yielding entries as they arrive; see ``stream``."""
+        if not alert_id:
+            raise ValidationError("Alert ID is required")
+
+        response = await self.client._open_stream(
+            f"/alerts/{alert_id}/history", {"page": page, "limit": limit}
+        )
+        return AsyncStreamedPage(
+            self.client._stream_chunks(response, chunk_size), response.aclose, dict, response.status_code
+        )
+
+    async def iterate(
+        self, concurrency: int = 1, keep_raw: bool = True, **params: Any
+    ) -> AsyncGenerator[Alert, None]:
+        """
+        Iterate through all alerts with automatic pagination.
+
+        Args:
+            concurrency: Number of upcoming pages to prefetch concurrently
+                once the first page reveals the page count (default: 1, one
+                page at a time). Alerts are still yielded in page order, and
+                outstanding fetches are cancelled if iteration stops early.
+            keep_raw: Keep each alert's source dict for ``to_dict()``
+                (default); ``False`` saves memory when holding many alerts
+        """
+        pages = self._iter_pages(concurrency, False, params, keep_raw)
+        try:
+            async for result in pages:
+                for alert in result.data:
+                    yield alert
+        finally:
+            await pages.aclose()
+
+    async def iterate_batches(self, concurrency: int = 1, **params: Any) -> AsyncGenerator[AlertBatch, None]:
+        """Iterate one columnar AlertBatch per page; see ``AlertsResource.iterate_batches``."""
+        pages = self._iter_pages(concurrency, True, params)
+        try:
+            async for result in pages:
+                yield result.data
+        finally:
+            await pages.aclose()
+
+    async def _iter_pages(
+        self, concurrency: int, columnar: bool, params: Dict[str, Any], keep_raw: bool = True
+    ) -> AsyncGenerator[PaginatedResponse, None]:
+        if concurrency < 1:
+            raise ValidationError("concurrency must be at least 1")
+
         page = params.get("page", 1)
         limit = min(params.get("limit", 50), 100)
 
         base_params = {k: v for k, v in params.items() if k not in ["limit", "page"]}
+        base_params["columnar"] = columnar
+        base_params["keep_raw"] = keep_raw
+
+        if concurrency == 1:
+            while True:
+                result = await self.list(**base_params, limit=limit, page=page)
+
+                yield result
+
+                if page >= max(result.total_pages, 1):
+                    break
+
+                page += 1
+            return
+
+        first = await self.list(**base_params, limit=limit, page=page)
+        last_page = max(first.total_pages, 1)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(page_number: int) -> PaginatedResponse:
+            async with semaphore:
+                return await self.list(**base_params, limit=limit, page=page_number)
+
+        next_page = page + 1
+        pending: Deque[asyncio.Future] = deque()
+        try:
+            # Start prefetching while the caller consumes the first page
+            while next_page <= last_page and len(pending) < concurrency:
+                pending.append(asyncio.ensure_future(fetch(next_page)))
+                next_page += 1
+
+            yield first
 
-        while True:
-            result = await self.list(**base_params, limit=limit, page=page)
+            while pending:
+                result = await pending.popleft()
+                # Keep the window full while the caller consumes this page
+                if next_page <= last_page:
+                    pending.append(asyncio.ensure_future(fetch(next_page)))
+                    next_page += 1
+                yield result
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def mirror(self, concurrency: int = 1, keep_raw: bool = True, **params: Any) -> AsyncAlertMirror:
+        """Load every alert into a local, indexed mirror; see ``AlertsResource.mirror``."""
+        return await AsyncAlertMirror(self, concurrency=concurrency, keep_raw=keep_raw, **params).load()
+
+    async def bulk_create(
+        self,
+        items: Iterable[Dict[str, Any]],
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> List[BulkResult]:
+        """
+        Create many alerts.
+
+        Every item is validated before anything is sent. Valid items are then
+        created concurrently under the client's rate budget.
+
+        Returns:
+            One BulkResult per item, in input order, holding either the
+            created Alert or the error for that item
+        """
+        results, work = self._prepare_bulk_create(items)
+        await self._run_bulk(work, lambda data: self.create(**data), concurrency)
+        return results
+
+    async def bulk_pause(
+        self, alert_ids: Iterable[str], concurrency: int = DEFAULT_BULK_CONCURRENCY
+    ) -> List[BulkResult]:
+        """Pause many alerts; returns one BulkResult per ID."""
+        results, work = self._prepare_bulk_ids(alert_ids)
+        await self._run_bulk(work, self.pause, concurrency)
+        return results
+
+    async def bulk_activate(
+        self, alert_ids: Iterable[str], concurrency: int = DEFAULT_BULK_CONCURRENCY
+    ) -> List[BulkResult]:
+        """Activate many alerts; returns one BulkResult per ID."""
+        results, work = self._prepare_bulk_ids(alert_ids)
+        await self._run_bulk(work, self.activate, concurrency)
+        return results
+
+    async def bulk_delete(
+        self, alert_ids: Iterable[str], concurrency: int = DEFAULT_BULK_CONCURRENCY
+    ) -> List[BulkResult]:
+        """Delete many alerts; returns one BulkResult per ID."""
+        results, work = self._prepare_bulk_ids(alert_ids)
+        await self._run_bulk(work, self.delete, concurrency)
+        return results
+
+    async def _run_bulk(
+        self,
+        work: Sequence[Tuple[BulkResult, Any]],
+        operation: Callable[[Any], Awaitable[Any]],
+        concurrency: int,
+    ) -> None:
+        if concurrency < 1:
+            raise ValidationError("concurrency must be at least 1")
 
-            for alert in result.data:
-                yield alert
+        semaphore = asyncio.Semaphore(concurrency)
 
-            if page >= max(result.total_pages, 1):
-                break
+        async def run(entry: Tuple[BulkResult, Any]) -> None:
+            result, argument = entry
+            async with semaphore:
+                try:
+                    result.result = await operation(argument)
+                except Exception as e:  # one failing item must not abort the batch
+                    result.error = e
 
-            page += 1
+        await asyncio.gather(*(run(entry) for entry in work))
@@ -2,6 +2,7 @@
 from typing import Any, Dict
 
 from ..types import UserSubscription
+from .alerts_base import SUBSCRIPTION_ENDPOINT
 
 
 class AsyncUserResource:
@@ -13,5 +14,10 @@ class AsyncUserResource:
 
     async def get_subscription(self) -> UserSubscription:
         """Get subscription, quotas, and usage for the authenticated user."""
-        response = await self.client._request("GET", "/user/subscription")
+        cache = self.client._cache
+        response = cache.get(SUBSCRIPTION_ENDPOINT) if cache is not None else None
+        if response is None:
+            response = await self.client._request("GET", "/user/subscription")
+            if cache is not None:
+                cache.set(SUBSCRIPTION_ENDPOINT, None, response)
         return UserSubscription(response)
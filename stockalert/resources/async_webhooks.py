@@ -1,12 +1,57 @@
 """Async webhooks resource."""
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
-from ..resources.webhooks import WebhooksResource
+from ..types import ApiResponse
+from .webhooks import WebhooksResource
 
 
-class AsyncWebhooksResource(WebhooksResource):
-    """Async version of webhooks resource."""
+class AsyncWebhooksResource:
+    """Async webhooks resource."""
+
+    # Signature verification is pure CPU work; reuse the sync implementation.
+    verify_signature = staticmethod(WebhooksResource.verify_signature)
 
     def __init__(self, config: Dict[str, Any]) -> None:
-        super().__init__(config)
-        self.client: Optional[Any] = None  # Set by AsyncStockAlert
+        self._config = config
+        self.client: Any = None  # Set by AsyncStockAlert
+
+    async def list(self) -> ApiResponse:
+        """List all webhooks."""
+        return await self.client._request("GET", "/webhooks")
+
+    async def get(self, webhook_id: str) -> ApiResponse:
+        """Get webhook by ID."""
+        return await self.client._request("GET", f"/webhooks/{webhook_id}")
+
+    async def create(self, url: str, events: Optional[List[str]] = None) -> ApiResponse:
+        """
+        Create a new webhook.
+
+        Args:
+            url: Webhook endpoint URL (HTTPS required)
+            events: List of events to subscribe to (default: ["alert.triggered"])
+
+        Returns:
+            Created webhook (includes secret, returned only once)
+        """
+        if events is None:
+            events = ["alert.triggered"]
+
+        data = {
+            "url": url,
+            "events": events
+        }
+
+        return await self.client._request("POST", "/webhooks", json=data)
+
+    async def delete(self, webhook_id: str) -> ApiResponse:
+        """Delete a webhook."""
+        return await self.client._request("DELETE", f"/webhooks/{webhook_id}")
+
+    async def test(self, url: str, secret: str) -> ApiResponse:
+        """Test a webhook by sending a test payload."""
+        data = {
+            "url": url,
+            "secret": secret
+        }
+        return await self.client._request("POST", "/webhooks/test", json=data)
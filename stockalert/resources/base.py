@@ -1,12 +1,11 @@
 """Base resource class for StockAlert SDK."""
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
-from ..__version__ import __version__
+from ..cache import request_key
 from ..exceptions import (
+    APIError,
     AuthenticationError,
     NetworkError,
     NotFoundError,
@@ -14,49 +13,62 @@ from ..exceptions import (
     StockAlertError,
     ValidationError,
 )
+from ..transport import Transport
 
 
 class BaseResource:
     """Base class for all API resources."""
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], transport: Optional[Transport] = None):
         self._config = config
-        self._session = self._create_session()
+        # Resources created by a client share its transport; standalone
+        # resources get their own.
+        self._transport = transport or Transport(config)
+        self._session = self._transport.session
 
-    def _create_session(self) -> requests.Session:
-        session = requests.Session()
-
-        # Configure retries
-        retry_strategy = Retry(
-            total=3,
-            status_forcelist=[429, 500, 502, 503, 504],
-            backoff_factor=1,
-            allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE", "POST"]
-        )
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        auth_mode: Optional[str] = None,
+        return_full_response: bool = False,
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        flights = self._transport.flights
+        if flights is None or method.upper() != "GET" or kwargs:
+            json_response, _ = self._send_request(method, path, params, json_data, auth_mode, **kwargs)
+        else:
+            # Identical GETs issued concurrently share one HTTP call; each
+            # waiter decodes the shared body into its own objects
+            codec = self._transport.codec
+            key = (request_key(path, params), auth_mode)
+            json_response, _ = flights.do(
+                key,
+                lambda: self._send_request(method, path, params, json_data, auth_mode),
+                share=lambda sent: (codec.loads(sent[1]), sent[1]),
+            )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
+        if return_full_response:
+            return json_response  # type: ignore[no-any-return]
 
-        # Set default headers
-        session.headers.update({
-            "X-API-Key": self._config['api_key'],
-            "Content-Type": "application/json",
-            "User-Agent": f"stockalert-python/{__version__}",
-        })
+        # For v1 API envelope format, return data field
+        if "data" in json_response:
+            return json_response["data"]  # type: ignore[no-any-return]
 
-        return session
+        return json_response  # type: ignore[no-any-return]
 
-    def _request(
+    def _send_request(
         self,
         method: str,
         path: str,
         params: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
         auth_mode: Optional[str] = None,
-        return_full_response: bool = False,
         **kwargs: Any
-    ) -> Dict[str, Any]:
+    ) -> Tuple[Any, bytes]:
+        """Send a request and return the decoded response with its raw body."""
         # Ensure proper URL construction
         base_url = str(self._config['base_url']).rstrip("/")
         path = path.lstrip("/")
@@ -78,39 +90,82 @@ class BaseResource:
                     raise AuthenticationError("Bearer token required for this endpoint")
                 request_headers["Authorization"] = f"Bearer {bearer}"
 
-            response = self._session.request(
-                method=method,
-                url=url,
-                params=params,
-                json=json_data,
-                timeout=self._config.get("timeout", 30),
-                headers=request_headers,
-                **kwargs
-            )
-
-            # Handle rate limit headers
-            rate_limit_info = {
-                "limit": int(response.headers.get("X-RateLimit-Limit", 0)),
-                "remaining": int(response.headers.get("X-RateLimit-Remaining", 0)),
-                "reset": int(response.headers.get("X-RateLimit-Reset", 0)),
-            }
+            # Revalidate cached GET responses instead of downloading them again
+            validators = self._transport.validators
+            cache_key = request_key(url, params) if method.upper() == "GET" else None
+            conditional_headers = validators.conditional_headers(cache_key) if cache_key is not None else {}
+
+            rate_limiter = self._transport.rate_limiter
+            codec = self._transport.codec
+            body = codec.dumps(json_data) if json_data is not None else None
+
+            def send(extra_headers: Dict[str, str]) -> requests.Response:
+                rate_limiter.acquire()
+                response = self._session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    data=body,
+                    timeout=self._config.get("timeout", 30),
+                    headers={**(request_headers or {}), **extra_headers} if extra_headers else request_headers,
+                    **kwargs
+                )
+                # Handle rate limit headers
+                rate_limiter.update(response.headers)
+                return response
+
+            response = send(conditional_headers)
+
+            cached_body = None
+            if cache_key is not None and response.status_code == 304:
+                cached_body = validators.get(cache_key)
+                if cached_body is None:
+                    # The entry was evicted meanwhile, or a proxy answered: fetch the full body
+                    response = send({})
+                    if response.status_code == 304:
+                        raise APIError("Unexpected 304 Not Modified without a cached response", 304)
+
+            if cached_body is not None:
+                return codec.loads(cached_body), cached_body
 
             # Check for errors
             if not response.ok:
-                self._handle_error(response, rate_limit_info)
+                self._handle_error(response, rate_limiter.state)
 
             # Parse JSON response
-            json_response = response.json()
+            json_response = codec.decode(response)
+            if cache_key is not None:
+                validators.store(cache_key, response.headers, response.content)
+            return json_response, response.content
 
-            if return_full_response:
-                return json_response  # type: ignore[no-any-return]
+        except requests.exceptions.Timeout as e:
+            raise NetworkError("Request timed out") from e
+        except requests.exceptions.ConnectionError as e:
+            raise NetworkError("Connection failed") from e
+        except requests.exceptions.RequestException as e:
+            raise NetworkError(f"Request failed: {str(e)}") from e
 
-            # For v1 API envelope format, return data field
-            if "data" in json_response:
-                return json_response["data"]  # type: ignore[no-any-return]
+    def _open_stream(self, path: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+        """
+        Send a GET whose body is read incrementally by the caller.
 
-            return json_response  # type: ignore[no-any-return]
+        Error responses are read and raised here; a successful response is
+        returned unread. Streamed bodies bypass the ETag and response caches.
+        """
+        url = f"{str(self._config['base_url']).rstrip('/')}/{path.lstrip('/')}"
+        if params:
+            params = {k: v for k, v in params.items() if v is not None}
 
+        rate_limiter = self._transport.rate_limiter
+        rate_limiter.acquire()
+        try:
+            response = self._session.request(
+                method="GET",
+                url=url,
+                params=params,
+                timeout=self._config.get("timeout", 30),
+                stream=True,
+            )
         except requests.exceptions.Timeout as e:
             raise NetworkError("Request timed out") from e
         except requests.exceptions.ConnectionError as e:
@@ -118,9 +173,23 @@ class BaseResource:
         except requests.exceptions.RequestException as e:
             raise NetworkError(f"Request failed: {str(e)}") from e
 
-    def _handle_error(self, response: requests.Response, rate_limit_info: Dict[str, int]) -> None:
+        rate_limiter.update(response.headers)
+        if not response.ok:
+            try:
+                self._handle_error(response, rate_limiter.state)
+            finally:
+                response.close()
+        return response
+
+    def _stream_chunks(self, response: requests.Response, chunk_size: int) -> Iterator[bytes]:
+        try:
+            yield from response.iter_content(chunk_size)
+        except requests.exceptions.RequestException as e:
+            raise NetworkError(f"Connection lost while streaming: {str(e)}") from e
+
+    def _handle_error(self, response: requests.Response, rate_limit_info: Dict[str, Any]) -> None:
         try:
-            response_data = response.json()
+            response_data = self._transport.codec.decode(response)
             # Extract error message from v1 API format
             error_obj = response_data.get("error", {})
             if isinstance(error_obj, dict):
@@ -137,6 +206,7 @@ class BaseResource:
             raise NotFoundError(error_message)
         elif response.status_code == 429:
             retry_after = response.headers.get("Retry-After")
+            self._transport.rate_limiter.penalize(int(retry_after) if retry_after else None)
             raise RateLimitError(
                 error_message,
                 retry_after=int(retry_after) if retry_after else None
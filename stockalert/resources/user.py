@@ -1,6 +1,7 @@
 """User resource for StockAlert SDK."""
 
 from ..types import UserSubscription
+from .alerts_base import SUBSCRIPTION_ENDPOINT
 from .base import BaseResource
 
 
@@ -9,5 +10,10 @@ class UserResource(BaseResource):
 
     def get_subscription(self) -> UserSubscription:
         """Get subscription, quotas, and usage for the authenticated user."""
-        response = self._request("GET", "/user/subscription")
+        cache = self._transport.cache
+        response = cache.get(SUBSCRIPTION_ENDPOINT) if cache is not None else None
+        if response is None:
+            response = self._request("GET", "/user/subscription")
+            if cache is not None:
+                cache.set(SUBSCRIPTION_ENDPOINT, None, response)
         return UserSubscription(response)
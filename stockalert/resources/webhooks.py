@@ -1,9 +1,8 @@
 """Webhooks resource for StockAlert SDK."""
-import hashlib
-import hmac
-from typing import List, Optional, Union
+from typing import List, Optional, Sequence, Union
 
 from ..types import ApiResponse
+from ..webhooks.verifier import Payload, RotatingWebhookVerifier, Secret, WebhookVerifier
 from .base import BaseResource
 
 
@@ -83,18 +82,21 @@ class WebhooksResource(BaseResource):
 
     @staticmethod
     def verify_signature(
-        payload: Union[str, bytes],
+        payload: Payload,
         signature: str,
-        secret: str,
+        secret: Union[Secret, Sequence[Secret]],
         timestamp: Optional[Union[str, int]] = None,
+        tolerance: Optional[float] = None,
     ) -> bool:
         """
         Verify webhook signature
 
         Args:
-            payload: Raw webhook payload (JSON string or bytes)
+            payload: Raw webhook payload (str, bytes, bytearray or memoryview)
             signature: Signature from X-StockAlert-Signature header
-            secret: Your webhook secret
+            secret: Your webhook secret (str or bytes), or several secrets while rotating
+            timestamp: X-StockAlert-Timestamp header, if sent
+            tolerance: Reject timestamps older or newer than this many seconds
 
         Returns:
             True if signature is valid
@@ -104,21 +106,15 @@ class WebhooksResource(BaseResource):
             >>> signature = request.headers.get("X-StockAlert-Signature")
             >>> if WebhooksResource.verify_signature(payload, signature, secret):
             ...     # Process webhook
+
+        Each call derives the HMAC key again; for more than the occasional
+        webhook, build a ``stockalert.WebhookVerifier`` once and reuse it.
         """
-        if not payload or not signature or not secret:
+        if not secret:
             return False
-
-        payload_bytes = payload.encode("utf-8") if isinstance(payload, str) else payload
-        payload_text = payload if isinstance(payload, str) else payload.decode("utf-8")
-
-        signing_payload = payload_bytes
-        if timestamp not in (None, ""):
-            signing_payload = f"{timestamp}.{payload_text}".encode()
-
-        expected_signature = hmac.new(secret.encode("utf-8"), signing_payload, hashlib.sha256).hexdigest()
-
-        # Support both formats: "sha256=..." and raw hex
-        if signature.startswith("sha256="):
-            signature = signature[7:]  # Remove "sha256=" prefix
-
-        return hmac.compare_digest(signature, expected_signature)
+        verifier: WebhookVerifier
+        if isinstance(secret, (str, bytes)):
+            verifier = WebhookVerifier(secret, tolerance=tolerance)
+        else:
+            verifier = RotatingWebhookVerifier(secret, tolerance=tolerance)
+        return verifier.verify(payload, signature, timestamp)
@@ -0,0 +1,49 @@
+"""Retry and backoff helpers for StockAlert SDK."""
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Optional
+
+# Methods that can safely be sent again after a timeout or server error
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS", "TRACE"})
+
+# Server errors worth retrying
+RETRY_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+DEFAULT_BACKOFF_BASE = 0.5
+DEFAULT_BACKOFF_CAP = 30.0
+
+
+def backoff_delay(
+    attempt: int,
+    base: float = DEFAULT_BACKOFF_BASE,
+    cap: float = DEFAULT_BACKOFF_CAP,
+) -> float:
+    """
+    Exponential backoff with full jitter.
+
+    Returns a random delay in ``[0, min(cap, base * 2 ** attempt)]`` so that
+    concurrent callers retrying the same failure spread out instead of
+    hitting the API in lockstep.
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """Parse a ``Retry-After`` header (delay in seconds or HTTP date)."""
+    if not isinstance(value, str) or not value.strip():
+        return None
+
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
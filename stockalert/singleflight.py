@@ -0,0 +1,107 @@
+"""Request coalescing for StockAlert SDK."""
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls across threads.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait and receive the same result, or the same exception.
+    Pass ``share`` to give each waiter its own copy of the result instead.
+    Nothing is cached: once the call finishes, the next caller starts a
+    new one.
+
+    Example:
+        >>> flights = SingleFlight()
+        >>> flights.do(("GET", "/alerts/a1"), lambda: fetch("a1"))
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.shared = 0
+
+    def __len__(self) -> int:
+        """Number of calls currently in flight."""
+        return len(self._calls)
+
+    def do(self, key: Hashable, fn: Callable[[], T], share: Optional[Callable[[T], T]] = None) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            result: T = call.result
+            return share(result) if share is not None else result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result  # type: ignore[no-any-return]
+
+
+class AsyncSingleFlight:
+    """
+    Coalesces concurrent identical coroutine calls on one event loop.
+
+    The shared call runs as its own task, so cancelling one waiter does not
+    cancel the request for the others. ``share`` works as in SingleFlight.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, asyncio.Future[Any]] = {}
+        self.shared = 0
+
+    def __len__(self) -> int:
+        """Number of calls currently in flight."""
+        return len(self._calls)
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[T]],
+        share: Optional[Callable[[T], T]] = None,
+    ) -> T:
+        task = self._calls.get(key)
+        leader = task is None
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.shared += 1
+        result: T = await asyncio.shield(task)
+        return share(result) if share is not None and not leader else result
+
+    def _finish(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,301 @@
+"""Incremental parsing of paginated responses for StockAlert SDK."""
+import codecs
+import json
+import re
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from .exceptions import APIError
+
+T = TypeVar("T")
+
+DEFAULT_STREAM_CHUNK_SIZE = 16 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Parser states
+_START = "start"
+_FIRST_KEY = "first_key"
+_KEY = "key"
+_COLON = "colon"
+_VALUE = "value"
+_FIRST_ITEM = "first_item"
+_ITEM = "item"
+_AFTER_ITEM = "after_item"
+_AFTER_MEMBER = "after_member"
+_DONE = "done"
+
+
+class EnvelopeParser:
+    """
+    Incremental parser for ``{"data": [...], "meta": {...}}`` envelopes.
+
+    Text is fed in arbitrary chunks. Elements of the array under ``key`` are
+    returned as soon as they are complete and are not kept; every other
+    top-level member is collected into ``envelope``. Only the unparsed tail
+    of the input is buffered, so memory stays proportional to one element.
+    """
+
+    def __init__(self, key: str = "data") -> None:
+        self.key = key
+        self.envelope: Dict[str, Any] = {}
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._state = _START
+        self._member: Optional[str] = None
+
+    @property
+    def done(self) -> bool:
+        return self._state == _DONE
+
+    def feed(self, text: str, final: bool = False) -> List[Any]:
+        """
+        Parse more input.
+
+        Returns the array elements completed by this chunk. With ``final``
+        the input is known to be complete and a truncated body raises.
+
+        Raises:
+            ValueError: If the input is not a JSON object envelope
+        """
+        buffer = self._buffer + text
+        pos = 0
+        items: List[Any] = []
+
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()  # type: ignore[union-attr]
+            if pos >= len(buffer):
+                break
+            char = buffer[pos]
+            state = self._state
+
+            if state == _START:
+                self._expect(char, "{")
+                self._state = _FIRST_KEY
+                pos += 1
+            elif state in (_FIRST_KEY, _KEY):
+                if char == "}" and state == _FIRST_KEY:
+                    self._state = _DONE
+                    pos += 1
+                    continue
+                decoded = self._decode(buffer, pos, final)
+                if decoded is None:
+                    break
+                member, pos = decoded
+                if not isinstance(member, str):
+                    raise ValueError(f"Expected an object key at position {pos}")
+                self._member = member
+                self._state = _COLON
+            elif state == _COLON:
+                self._expect(char, ":")
+                self._state = _VALUE
+                pos += 1
+            elif state == _VALUE:
+                if self._member == self.key and char == "[":
+                    self._state = _FIRST_ITEM
+                    pos += 1
+                    continue
+                decoded = self._decode(buffer, pos, final)
+                if decoded is None:
+                    break
+                self.envelope[self._member or ""], pos = decoded
+                self._state = _AFTER_MEMBER
+            elif state in (_FIRST_ITEM, _ITEM):
+                if char == "]" and state == _FIRST_ITEM:
+                    self._state = _AFTER_MEMBER
+                    pos += 1
+                    continue
+                decoded = self._decode(buffer, pos, final)
+                if decoded is None:
+                    break
+                item, pos = decoded
+                items.append(item)
+                self._state = _AFTER_ITEM
+            elif state == _AFTER_ITEM:
+                self._expect(char, ",]")
+                self._state = _ITEM if char == "," else _AFTER_MEMBER
+                pos += 1
+            elif state == _AFTER_MEMBER:
+                self._expect(char, ",}")
+                self._state = _KEY if char == "," else _DONE
+                pos += 1
+            else:
+                raise ValueError(f"Unexpected data after the JSON document: {char!r}")
+
+        self._buffer = buffer[pos:]
+        if final and self._state != _DONE:
+            raise ValueError("Truncated JSON document")
+        return items
+
+    def _decode(self, buffer: str, pos: int, final: bool) -> Optional[Tuple[Any, int]]:
+        """Decode one value at ``pos``, or return None if it may still be incomplete."""
+        try:
+            value, end = self._decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return None
+        # A number (or literal) running to the end of the buffer may continue
+        if end >= len(buffer) and not final:
+            return None
+        return value, end
+
+    def _expect(self, char: str, allowed: str) -> None:
+        if char not in allowed:
+            raise ValueError(f"Expected one of {allowed!r}, got {char!r}")
+
+
+class _PageDecoder:
+    """Bytes-to-items decoding shared by the sync and async streamed pages."""
+
+    def __init__(self, status_code: int) -> None:
+        self.status_code = status_code
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._parser = EnvelopeParser()
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        try:
+            return self._parser.feed(self._text.decode(chunk))
+        except ValueError as e:
+            raise APIError(f"Invalid JSON response: {e}", self.status_code) from e
+
+    def finish(self) -> Tuple[List[Any], Dict[str, Any]]:
+        try:
+            items = self._parser.feed(self._text.decode(b"", final=True), final=True)
+        except ValueError as e:
+            raise APIError(f"Invalid JSON response: {e}", self.status_code) from e
+
+        envelope = self._parser.envelope
+        if not envelope.get("success", True):
+            error_data = envelope.get("error", {})
+            if isinstance(error_data, dict):
+                error_msg = error_data.get("message", "Request failed")
+            else:
+                error_msg = str(error_data) if error_data else "Request failed"
+            raise APIError(error_msg, self.status_code, envelope)
+        return items, envelope
+
+
+class _StreamedPageBase(Generic[T]):
+    def __init__(self, factory: Callable[[Any], T], status_code: int) -> None:
+        self._factory = factory
+        self._decoder = _PageDecoder(status_code)
+        self._consumed = False
+        self.meta: Dict[str, Any] = {}
+
+    @property
+    def pagination(self) -> Dict[str, Any]:
+        """Pagination info; available once every item has been read."""
+        return self.meta.get("pagination", {})  # type: ignore[no-any-return]
+
+    @property
+    def total_pages(self) -> int:
+        pagination = self.pagination
+        return pagination.get("total_pages", pagination.get("totalPages", 0))  # type: ignore[no-any-return]
+
+    def _start(self) -> None:
+        if self._consumed:
+            raise RuntimeError("A streamed page can only be iterated once")
+        self._consumed = True
+
+    def _finish(self) -> List[T]:
+        items, envelope = self._decoder.finish()
+        self.meta = envelope.get("meta", {})
+        return [self._factory(item) for item in items]
+
+
+class StreamedPage(_StreamedPageBase[T]):
+    """
+    One page of results parsed as the response body arrives.
+
+    Iterating yields each element of ``data`` as soon as it has been
+    received, so processing starts before the download finishes and only
+    one element is held in memory at a time. ``meta`` is filled in once the
+    page has been read to the end. The connection is released when iteration
+    ends; use the page as a context manager (or call ``close()``) when
+    stopping early.
+
+    Example:
+        >>> with client.alerts.stream(limit=100) as page:
+        ...     for alert in page:
+        ...         print(alert.symbol)
+        >>> page.total_pages
+    """
+
+    def __init__(
+        self,
+        chunks: Iterator[bytes],
+        close: Callable[[], None],
+        factory: Callable[[Any], T],
+        status_code: int,
+    ) -> None:
+        super().__init__(factory, status_code)
+        self._chunks = chunks
+        self._close = close
+
+    def __iter__(self) -> Iterator[T]:
+        self._start()
+        try:
+            for chunk in self._chunks:
+                for item in self._decoder.feed(chunk):
+                    yield self._factory(item)
+            yield from self._finish()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Release the underlying connection."""
+        self._close()
+
+    def __enter__(self) -> "StreamedPage[T]":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+
+class AsyncStreamedPage(_StreamedPageBase[T]):
+    """Async variant of :class:`StreamedPage`; use ``async for`` / ``async with``."""
+
+    def __init__(
+        self,
+        chunks: AsyncIterator[bytes],
+        close: Callable[[], Awaitable[None]],
+        factory: Callable[[Any], T],
+        status_code: int,
+    ) -> None:
+        super().__init__(factory, status_code)
+        self._chunks = chunks
+        self._close = close
+
+    async def __aiter__(self) -> AsyncIterator[T]:
+        self._start()
+        try:
+            async for chunk in self._chunks:
+                for item in self._decoder.feed(chunk):
+                    yield self._factory(item)
+            for item in self._finish():
+                yield item
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        """Release the underlying connection."""
+        await self._close()
+
+    async def __aenter__(self) -> "AsyncStreamedPage[T]":
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.close()
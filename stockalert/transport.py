@@ -0,0 +1,88 @@
+"""Shared HTTP transport for StockAlert SDK."""
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .__version__ import __version__
+from .cache import DEFAULT_VALIDATOR_CACHE_SIZE, ResponseCache, ValidatorCache
+from .codec import JSONCodec
+from .rate_limit import RateLimiter
+from .singleflight import SingleFlight
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+
+class Transport:
+    """
+    HTTP transport shared by a client and all of its resources.
+
+    Owns a single ``requests.Session`` (and therefore a single connection
+    pool), so every resource reuses the same keep-alive connections, along
+    with the rate limiter, the conditional-request cache, the optional
+    response cache, the JSON codec and the in-flight GET coalescing used
+    across them.
+    """
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        codec: Optional[JSONCodec] = None,
+    ) -> None:
+        self._config = config
+        self.session = self._create_session()
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.validators = ValidatorCache(
+            config.get("etag_cache_size", DEFAULT_VALIDATOR_CACHE_SIZE)
+        )
+        self.cache = cache
+        self.codec = codec or JSONCodec()
+        self.flights = SingleFlight() if config.get("coalesce_requests", True) else None
+        self._closed = False
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+
+        # Configure retries
+        retry_strategy = Retry(
+            total=self._config.get("max_retries", 3),
+            status_forcelist=[429, 500, 502, 503, 504],
+            backoff_factor=1,
+            allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE", "POST"]
+        )
+
+        adapter = HTTPAdapter(
+            pool_connections=self._config.get("pool_connections") or DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize=self._config.get("pool_maxsize") or DEFAULT_POOL_MAXSIZE,
+            pool_block=bool(self._config.get("pool_block", False)),
+            max_retries=retry_strategy,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        # Set default headers
+        session.headers.update({
+            "X-API-Key": self._config["api_key"],
+            "User-Agent": f"stockalert-python/{__version__}",
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        })
+
+        if not self._config.get("keep_alive", True):
+            session.headers["Connection"] = "close"
+
+        return session
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        if not self._closed:
+            self.session.close()
+            self._closed = True
@@ -1,6 +1,8 @@
 """Type definitions for StockAlert SDK."""
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Sequence, Union
+
+from .codec import JSONCodec, resolve_codec
 
 AlertCondition = Literal[
     "price_above",
@@ -53,24 +55,83 @@ def _parse_datetime(value: Any) -> Optional[datetime]:
     raise TypeError(f"Unsupported datetime value: {value!r}")
 
 
-class Alert:
-    """Alert object."""
+class _LazyDatetime:
+    """
+    Descriptor that parses a raw datetime slot on first access.
 
-    def __init__(self, data: Dict[str, Any]):
+    The raw value lives in ``_<name>_raw`` and the parsed one is cached in
+    ``_<name>``; an unset cache slot means "not parsed yet".
+    """
+
+    def __init__(self, name: str) -> None:
+        self.raw_slot = f"_{name}_raw"
+        self.parsed_slot = f"_{name}"
+
+    def __get__(self, obj: Any, owner: Any = None) -> Any:
+        if obj is None:
+            return self
+        try:
+            return getattr(obj, self.parsed_slot)
+        except AttributeError:
+            value = _parse_datetime(getattr(obj, self.raw_slot))
+            setattr(obj, self.parsed_slot, value)
+            return value
+
+    def __set__(self, obj: Any, value: Optional[datetime]) -> None:
+        setattr(obj, self.parsed_slot, value)
+
+
+class Alert:
+    """
+    Alert object.
+
+    Datetime fields are parsed on first access. Pass ``keep_raw=False`` to
+    drop the source dict when holding many alerts; ``to_dict()`` then
+    rebuilds it from the fields.
+    """
+
+    __slots__ = (
+        "id",
+        "symbol",
+        "condition",
+        "threshold",
+        "notification",
+        "status",
+        "initial_price",
+        "parameters",
+        "user_id",
+        "email",
+        "verified",
+        "verification_token",
+        "last_metric_value",
+        "stock",
+        "_created_at_raw",
+        "_created_at",
+        "_triggered_at_raw",
+        "_triggered_at",
+        "_last_evaluated_at_raw",
+        "_last_evaluated_at",
+        "_updated_at",
+        "_last_triggered",
+        "_raw_data",
+    )
+
+    _updated_at: datetime
+    _last_triggered: Optional[datetime]
+
+    created_at = _LazyDatetime("created_at")
+    triggered_at = _LazyDatetime("triggered_at")
+    last_evaluated_at = _LazyDatetime("last_evaluated_at")
+
+    def __init__(self, data: Dict[str, Any], keep_raw: bool = True):
         self.id: str = data["id"]
         self.symbol: str = data["symbol"]
         self.condition: AlertCondition = data["condition"]
         self.threshold: Optional[float] = data.get("threshold")
         self.notification: NotificationChannel = data["notification"]
         self.status: AlertStatus = data["status"]
-        self.created_at: datetime = _parse_datetime(data["created_at"])  # type: ignore[assignment]
-
-        triggered_at = data.get("triggered_at") or data.get("updated_at")
-        self.triggered_at: Optional[datetime] = _parse_datetime(triggered_at)
-
-        # Backward-compatible aliases used by older consumers.
-        self.updated_at: datetime = self.triggered_at or self.created_at
-        self.last_triggered: Optional[datetime] = self.triggered_at
+        self._created_at_raw = data["created_at"]
+        self._triggered_at_raw = data.get("triggered_at") or data.get("updated_at")
 
         self.initial_price: Optional[float] = data.get("initial_price")
         self.parameters: Optional[Dict[str, Any]] = data.get("parameters")
@@ -78,26 +139,89 @@ class Alert:
         self.email: Optional[str] = data.get("email")
         self.verified: Optional[bool] = data.get("verified")
         self.verification_token: Optional[str] = data.get("verification_token")
-        self.last_evaluated_at: Optional[datetime] = _parse_datetime(data.get("last_evaluated_at"))
+        self._last_evaluated_at_raw = data.get("last_evaluated_at")
         self.last_metric_value: Optional[float] = data.get("last_metric_value")
         self.stock: Optional[Dict[str, Any]] = data.get("stock")
 
-        self._raw_data = data
+        self._raw_data: Optional[Dict[str, Any]] = data if keep_raw else None
+
+    # Backward-compatible aliases used by older consumers.
+    @property
+    def updated_at(self) -> datetime:
+        try:
+            return self._updated_at
+        except AttributeError:
+            return self.triggered_at or self.created_at  # type: ignore[no-any-return]
+
+    @updated_at.setter
+    def updated_at(self, value: datetime) -> None:
+        self._updated_at = value
+
+    @property
+    def last_triggered(self) -> Optional[datetime]:
+        try:
+            return self._last_triggered
+        except AttributeError:
+            return self.triggered_at  # type: ignore[no-any-return]
+
+    @last_triggered.setter
+    def last_triggered(self, value: Optional[datetime]) -> None:
+        self._last_triggered = value
 
     def __repr__(self) -> str:
         return f"<Alert {self.id}: {self.symbol} {self.condition}>"
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return self._raw_data
+        if self._raw_data is not None:
+            return self._raw_data
+
+        data = {
+            "id": self.id,
+            "symbol": self.symbol,
+            "condition": self.condition,
+            "threshold": self.threshold,
+            "notification": self.notification,
+            "status": self.status,
+            "created_at": self._created_at_raw,
+            "triggered_at": self._triggered_at_raw,
+            "initial_price": self.initial_price,
+            "parameters": self.parameters,
+            "user_id": self.user_id,
+            "email": self.email,
+            "verified": self.verified,
+            "verification_token": self.verification_token,
+            "last_evaluated_at": self._last_evaluated_at_raw,
+            "last_metric_value": self.last_metric_value,
+            "stock": self.stock,
+        }
+        return {key: value for key, value in data.items() if value is not None}
 
 
 class UserSubscription:
     """User subscription and quota details."""
 
-    def __init__(self, data: Dict[str, Any]):
-        current_period = data.get("current_period") or {}
+    __slots__ = (
+        "id",
+        "account_type",
+        "status",
+        "is_early_bird",
+        "is_early_bird_eligible",
+        "is_premium",
+        "cancel_at_period_end",
+        "quotas",
+        "usage",
+        "alerts",
+        "watchlist_items_count",
+        "watchlist_quota",
+        "_current_period_raw",
+        "_current_period",
+        "_raw_data",
+    )
+
+    _current_period: Dict[str, Optional[datetime]]
 
+    def __init__(self, data: Dict[str, Any]):
         self.id: Optional[str] = data.get("id")
         self.account_type: AccountType = data["account_type"]
         self.status: str = data["status"]
@@ -107,16 +231,29 @@ class UserSubscription:
         self.cancel_at_period_end: Optional[bool] = data.get("cancel_at_period_end")
         self.quotas: Dict[str, Any] = dict(data.get("quotas") or {})
         self.usage: Dict[str, Any] = dict(data.get("usage") or {})
-        self.current_period: Dict[str, Optional[datetime]] = {
-            "start": _parse_datetime(current_period.get("start")),
-            "end": _parse_datetime(current_period.get("end")),
-        }
+        self._current_period_raw: Dict[str, Any] = data.get("current_period") or {}
         self.alerts: Dict[str, Any] = dict(data.get("alerts") or {})
         self.watchlist_items_count: int = data.get("watchlist_items_count", 0)
         self.watchlist_quota: int = data.get("watchlist_quota", 0)
 
         self._raw_data = data
 
+    @property
+    def current_period(self) -> Dict[str, Optional[datetime]]:
+        try:
+            return self._current_period
+        except AttributeError:
+            period: Dict[str, Optional[datetime]] = {
+                "start": _parse_datetime(self._current_period_raw.get("start")),
+                "end": _parse_datetime(self._current_period_raw.get("end")),
+            }
+            self._current_period = period
+            return period
+
+    @current_period.setter
+    def current_period(self, value: Dict[str, Optional[datetime]]) -> None:
+        self._current_period = value
+
     def __repr__(self) -> str:
         return f"<UserSubscription {self.account_type} ({self.status})>"
 
@@ -128,8 +265,8 @@ class UserSubscription:
 class PaginatedResponse:
     """Paginated response for v1 API."""
 
-    def __init__(self, data: List[Any], meta: Optional[Dict[str, Any]] = None):
-        self.data = data
+    def __init__(self, data: Sequence[Any], meta: Optional[Dict[str, Any]] = None):
+        self.data: Any = data
         self.meta = meta or {}
 
         pagination = self.meta.get("pagination", {})
@@ -148,6 +285,8 @@ class PaginatedResponse:
 
     def __getitem__(self, key: str) -> Any:
         if key == "data":
+            if hasattr(self.data, "to_dicts"):
+                return self.data.to_dicts()
             return [self._serialize_item(item) for item in self.data]
         if key == "meta":
             return self.meta
@@ -178,22 +317,133 @@ class PaginatedResponse:
         return item.to_dict() if hasattr(item, "to_dict") else item
 
 
+class BulkResult:
+    """Outcome of one item in a bulk operation."""
+
+    def __init__(
+        self,
+        index: int,
+        item: Any,
+        result: Any = None,
+        error: Optional[Exception] = None,
+    ):
+        self.index = index
+        self.item = item
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = "ok" if self.ok else f"error: {self.error}"
+        return f"<BulkResult #{self.index} {status}>"
+
+
+# Required fields of the legacy flat webhook data
+_LEGACY_WEBHOOK_KEYS = ("alert_id", "symbol", "condition", "status")
+
+
 class WebhookPayload:
-    """Normalized webhook payload."""
+    """
+    Normalized webhook payload.
+
+    Required keys and their types are checked up front, so malformed
+    payloads fail at construction. ``timestamp`` is parsed and legacy flat
+    ``data`` is normalized into ``{"alert": ..., "stock": ...}`` on first
+    access, so handlers that only route on ``event`` skip that work.
+    """
+
+    __slots__ = ("id", "event", "_timestamp_raw", "_timestamp", "_data_raw", "_data")
+
+    _data: Dict[str, Any]
+
+    timestamp = _LazyDatetime("timestamp")
 
     def __init__(self, data: Dict[str, Any]):
         self.id: Optional[str] = data.get("id")
         self.event: str = data["event"]
-        self.timestamp: datetime = _parse_datetime(data["timestamp"])  # type: ignore[assignment]
-        self.data: Dict[str, Any] = self._normalize_data(data["data"])
-        self._raw_data = {
-            "id": self.id,
-            "event": self.event,
-            "timestamp": data["timestamp"],
-            "data": self.data,
-        }
+        self._timestamp_raw = data["timestamp"]
+        self._data_raw: Dict[str, Any] = data["data"]
+        self._check(data)
+
+    @classmethod
+    def parse_many(
+        cls,
+        source: Union[str, bytes, Iterable[Union[str, bytes]]],
+        codec: Union[JSONCodec, str, None] = None,
+    ) -> Iterator["WebhookPayload"]:
+        """
+        Parse newline-delimited JSON webhooks lazily, one line at a time.
+
+        Args:
+            source: NDJSON text or bytes, or any iterable of lines such as a
+                file opened in text or binary mode
+            codec: JSON codec used for each line (see ``StockAlert(codec=...)``)
+
+        Yields:
+            One WebhookPayload per non-blank line
+
+        Raises:
+            ValueError: If a line is not a valid webhook; the message names
+                the line number
+
+        Example:
+            >>> with open("webhooks.ndjson", "rb") as archive:
+            ...     triggered = [p for p in WebhookPayload.parse_many(archive) if p.event == "alert.triggered"]
+        """
+        loads = resolve_codec(codec).loads
+        lines: Iterable[Union[str, bytes]]
+        if isinstance(source, str):
+            # str.splitlines() also breaks on U+2028 and friends, which JSON strings may contain
+            lines = source.split("\n")
+        elif isinstance(source, bytes):
+            lines = source.splitlines()
+        else:
+            lines = source
+        for number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                yield cls(loads(line))
+            except (ValueError, KeyError, TypeError) as e:
+                raise ValueError(f"Invalid webhook on line {number}: {e}") from e
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        try:
+            return self._data
+        except AttributeError:
+            self._data = self._normalize_data(self._data_raw)
+            return self._data
+
+    @data.setter
+    def data(self, value: Dict[str, Any]) -> None:
+        self._data = value
 
-    def _normalize_data(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    def __repr__(self) -> str:
+        return f"<WebhookPayload {self.id}: {self.event}>"
+
+    def _check(self, data: Dict[str, Any]) -> None:
+        """Reject malformed payloads up front; only the conversion is deferred."""
+        if not isinstance(self.event, str):
+            raise TypeError("Webhook event must be a string")
+        if not isinstance(self._timestamp_raw, (str, int, float)) or isinstance(self._timestamp_raw, bool):
+            raise TypeError("Webhook timestamp must be a string or number")
+        payload = self._data_raw
+        if not isinstance(payload, dict):
+            raise TypeError("Webhook data must be an object")
+        if "alert" in payload:
+            if not isinstance(payload["alert"], dict):
+                raise TypeError("Webhook data.alert must be an object")
+            return
+        missing = [key for key in _LEGACY_WEBHOOK_KEYS if key not in payload]
+        if missing:
+            raise KeyError(f"Webhook data is missing {', '.join(missing)}")
+
+    @staticmethod
+    def _normalize_data(payload: Dict[str, Any]) -> Dict[str, Any]:
         if "alert" in payload:
             return payload
 
@@ -224,7 +474,12 @@ class WebhookPayload:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return self._raw_data
+        return {
+            "id": self.id,
+            "event": self.event,
+            "timestamp": self._timestamp_raw,
+            "data": self.data,
+        }
 
 
 ApiResponse = Dict[str, Any]
@@ -0,0 +1,244 @@
+"""Alert request validation for StockAlert SDK."""
+import re
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Tuple, get_args
+
+from .exceptions import ValidationError
+from .types import AlertCondition, NotificationChannel
+
+SYMBOL_PATTERN = re.compile(r"[A-Z0-9.-]{1,10}")
+NOTIFICATION_CHANNELS: Tuple[str, ...] = get_args(NotificationChannel)
+CONDITIONS: Tuple[str, ...] = get_args(AlertCondition)
+
+# Threshold usage per condition
+REQUIRED = "required"
+FORBIDDEN = "forbidden"
+OPTIONAL = "optional"
+
+# (predicate, message); the predicate returns True for acceptable input
+ThresholdCheck = Tuple[Callable[[Any], bool], str]
+ParameterCheck = Tuple[Callable[[Dict[str, Any]], bool], str]
+
+
+class ConditionRule(NamedTuple):
+    """Declarative validation rule for one alert condition."""
+
+    threshold: str = OPTIONAL
+    # Run only when a threshold is given
+    threshold_checks: Tuple[ThresholdCheck, ...] = ()
+    parameter_checks: Tuple[ParameterCheck, ...] = ()
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_positive_int(value: Any) -> bool:
+    return isinstance(value, int) and value >= 1
+
+
+def _optional(name: str, predicate: Callable[[Any], bool]) -> Callable[[Dict[str, Any]], bool]:
+    """Accept a missing parameter, otherwise apply ``predicate`` to it."""
+    return lambda params: params.get(name) is None or predicate(params[name])
+
+
+_MA_PERIOD: ThresholdCheck = (
+    lambda threshold: isinstance(threshold, int) and threshold > 0,
+    "{condition} requires a positive moving average period as threshold",
+)
+
+RULES: Dict[str, ConditionRule] = {
+    "price_above": ConditionRule(REQUIRED),
+    "price_below": ConditionRule(REQUIRED),
+    "price_change_up": ConditionRule(REQUIRED),
+    "price_change_down": ConditionRule(REQUIRED),
+    "new_high": ConditionRule(FORBIDDEN),
+    "new_low": ConditionRule(FORBIDDEN),
+    "reminder": ConditionRule(
+        REQUIRED,
+        parameter_checks=(
+            (
+                lambda params: bool(params.get("reminder_date")) and bool(params.get("reminder_time")),
+                "Reminder alerts require reminder_date and reminder_time",
+            ),
+        ),
+    ),
+    "daily_reminder": ConditionRule(
+        FORBIDDEN,
+        parameter_checks=(
+            (
+                _optional("deliveryTime", lambda value: value in ("market_open", "after_market_close")),
+                'Daily reminder deliveryTime must be "market_open" or "after_market_close"',
+            ),
+        ),
+    ),
+    "ma_crossover_golden": ConditionRule(FORBIDDEN),
+    "ma_crossover_death": ConditionRule(FORBIDDEN),
+    "ma_touch_above": ConditionRule(REQUIRED, threshold_checks=(_MA_PERIOD,)),
+    "ma_touch_below": ConditionRule(REQUIRED, threshold_checks=(_MA_PERIOD,)),
+    "volume_change": ConditionRule(REQUIRED),
+    "rsi_limit": ConditionRule(
+        REQUIRED,
+        threshold_checks=(
+            (
+                lambda threshold: _is_number(threshold) and 0 <= threshold <= 100,
+                "RSI threshold must be between 0 and 100",
+            ),
+        ),
+    ),
+    "pe_ratio_below": ConditionRule(REQUIRED),
+    "pe_ratio_above": ConditionRule(REQUIRED),
+    "forward_pe_below": ConditionRule(REQUIRED),
+    "forward_pe_above": ConditionRule(REQUIRED),
+    "earnings_announcement": ConditionRule(REQUIRED),
+    "dividend_ex_date": ConditionRule(REQUIRED),
+    "dividend_payment": ConditionRule(
+        FORBIDDEN,
+        parameter_checks=(
+            (
+                lambda params: _is_number(params.get("shares")) and params["shares"] > 0,
+                "Dividend payment alerts require a positive shares parameter",
+            ),
+        ),
+    ),
+    "insider_transactions": ConditionRule(
+        REQUIRED,
+        threshold_checks=(
+            (
+                lambda threshold: _is_number(threshold) and threshold > 0,
+                "insider_transactions threshold must be greater than 0",
+            ),
+        ),
+        parameter_checks=(
+            (
+                _optional("direction", lambda value: value in ("buy", "sell", "both")),
+                "insider_transactions direction must be buy, sell or both",
+            ),
+            (
+                _optional("minExecutives", _is_positive_int),
+                "insider_transactions minExecutives must be a positive integer",
+            ),
+            (
+                _optional("windowDays", _is_positive_int),
+                "insider_transactions windowDays must be a positive integer",
+            ),
+            (
+                _optional("openMarketOnly", lambda value: isinstance(value, bool)),
+                "insider_transactions openMarketOnly must be a boolean",
+            ),
+        ),
+    ),
+}
+
+ConditionValidator = Callable[[Any, Dict[str, Any], List[str]], None]
+
+
+def _compile(condition: str, rule: ConditionRule) -> ConditionValidator:
+    """Turn a rule into one function appending error messages to a list."""
+    threshold_checks = tuple(
+        (predicate, message.format(condition=condition)) for predicate, message in rule.threshold_checks
+    )
+    parameter_checks = rule.parameter_checks
+    required = rule.threshold == REQUIRED
+    forbidden = rule.threshold == FORBIDDEN
+    missing_message = f"{condition} requires a threshold value"
+    unused_message = f"{condition} does not use a threshold value"
+
+    def validate(threshold: Any, params: Dict[str, Any], errors: List[str]) -> None:
+        if threshold is None:
+            if required:
+                errors.append(missing_message)
+        elif forbidden:
+            errors.append(unused_message)
+        else:
+            for predicate, message in threshold_checks:
+                if not predicate(threshold):
+                    errors.append(message)
+        for check, message in parameter_checks:
+            if not check(params):
+                errors.append(message)
+
+    return validate
+
+
+def _no_rules(threshold: Any, params: Dict[str, Any], errors: List[str]) -> None:
+    """Conditions unknown to this SDK version are left to the API."""
+
+
+_VALIDATORS: Dict[str, ConditionValidator] = {
+    condition: _compile(condition, RULES.get(condition, ConditionRule())) for condition in CONDITIONS
+}
+
+_NOTIFICATION_MESSAGE = f"Notification must be one of: {', '.join(NOTIFICATION_CHANNELS)}"
+
+
+def alert_errors(data: Dict[str, Any], normalize: bool = False) -> List[str]:
+    """
+    Validate a create alert request and return every error message.
+
+    Args:
+        data: Request fields as passed to ``alerts.create``
+        normalize: Store the upper-cased symbol back into ``data`` when valid
+
+    Returns:
+        Error messages in check order; empty when the request is valid
+    """
+    errors: List[str] = []
+    raw_symbol = data.get("symbol")
+    condition = data.get("condition")
+
+    if not raw_symbol:
+        errors.append("Symbol is required")
+    if not condition:
+        errors.append("Condition is required")
+
+    if raw_symbol:
+        symbol = str(raw_symbol).strip().upper()
+        if SYMBOL_PATTERN.fullmatch(symbol) is None:
+            errors.append("Symbol must be 1-10 chars: A-Z, 0-9, dot or hyphen")
+        elif normalize:
+            data["symbol"] = symbol
+
+    if "notification" in data and data["notification"] not in NOTIFICATION_CHANNELS:
+        errors.append(_NOTIFICATION_MESSAGE)
+
+    if condition:
+        params = data.get("parameters") or {}
+        if not isinstance(params, dict):
+            errors.append("Parameters must be an object")
+            params = {}
+        _VALIDATORS.get(condition, _no_rules)(data.get("threshold"), params, errors)
+
+    return errors
+
+
+def validate_alert(data: Dict[str, Any]) -> None:
+    """
+    Validate a create alert request and normalize its symbol in place.
+
+    Raises:
+        ValidationError: With the first problem found
+    """
+    errors = alert_errors(data, normalize=True)
+    if errors:
+        raise ValidationError(errors[0])
+
+
+def validate_many(items: Iterable[Dict[str, Any]]) -> Dict[int, List[str]]:
+    """
+    Validate many create alert requests without modifying them.
+
+    Returns:
+        Every error message per invalid item, keyed by its position in
+        ``items``; an empty dict means every item is valid
+
+    Example:
+        >>> problems = validate_many(generated_alerts)
+        >>> for index, errors in problems.items():
+        ...     print(index, "; ".join(errors))
+    """
+    problems: Dict[int, List[str]] = {}
+    for index, item in enumerate(items):
+        errors = alert_errors(item)
+        if errors:
+            problems[index] = errors
+    return problems
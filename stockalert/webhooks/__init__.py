@@ -0,0 +1,18 @@
+"""Webhook receiving tools for StockAlert SDK."""
+from .dispatcher import RouteStats, WebhookDispatcher
+from .receiver import WebhookReceiver
+from .replay import MemorySeenEvents, SeenEvents, SQLiteSeenEvents
+from .store import WebhookEventStore
+from .verifier import RotatingWebhookVerifier, WebhookVerifier
+
+__all__ = [
+    "MemorySeenEvents",
+    "RotatingWebhookVerifier",
+    "RouteStats",
+    "SQLiteSeenEvents",
+    "SeenEvents",
+    "WebhookDispatcher",
+    "WebhookEventStore",
+    "WebhookReceiver",
+    "WebhookVerifier",
+]
@@ -0,0 +1,341 @@
+"""Event routing for StockAlert webhook handlers."""
+import asyncio
+import inspect
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+
+from ..logging import logger
+from ..types import WebhookPayload
+
+DEFAULT_DISPATCH_WORKERS = 8
+
+# Matches every event type
+ANY_EVENT = "*"
+
+RouteKey = Tuple[str, Optional[str], Optional[str]]
+Handler = Callable[[WebhookPayload], Any]
+# A queued thread pool call, or a callback resuming a waiting coroutine
+_Waiter = Union[Tuple[WebhookPayload, "Future[Any]"], Callable[[], object]]
+
+
+class RouteStats:
+    """Call counts and latency of one route."""
+
+    __slots__ = ("calls", "failures", "total_seconds", "max_seconds")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.failures = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+    def record(self, seconds: float, failed: bool) -> None:
+        self.calls += 1
+        self.failures += failed
+        self.total_seconds += seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+
+    def __repr__(self) -> str:
+        return (
+            f"<RouteStats calls={self.calls} failures={self.failures} "
+            f"mean={self.mean_seconds * 1000:.1f}ms max={self.max_seconds * 1000:.1f}ms>"
+        )
+
+
+class Route:
+    """A handler registered for an event, optionally narrowed by symbol and condition."""
+
+    def __init__(
+        self,
+        event: str,
+        handler: Handler,
+        symbol: Optional[str] = None,
+        condition: Optional[str] = None,
+        concurrency: Optional[int] = None,
+    ) -> None:
+        if concurrency is not None and concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.event = event
+        self.handler = handler
+        self.symbol = symbol
+        self.condition = condition
+        self.concurrency = concurrency
+        self.stats = RouteStats()
+        self.is_async = inspect.iscoroutinefunction(handler)
+        self._lock = threading.Lock()
+        # One count and queue for thread pool and asyncio calls alike
+        self._in_flight = 0
+        self._backlog: Deque[_Waiter] = deque()
+
+    @property
+    def key(self) -> RouteKey:
+        return (self.event, self.symbol, self.condition)
+
+    @property
+    def in_flight(self) -> int:
+        """Calls of this route currently running."""
+        return self._in_flight
+
+    def _acquire(self, waiter: _Waiter) -> bool:
+        """Take a slot, or queue ``waiter`` to receive one when it frees up."""
+        with self._lock:
+            if self.concurrency is None or self._in_flight < self.concurrency:
+                self._in_flight += 1
+                return True
+            self._backlog.append(waiter)
+            return False
+
+    def _release(self) -> Optional[Tuple[WebhookPayload, "Future[Any]"]]:
+        """
+        Hand this slot to the next queued call, or free it.
+
+        A waiting coroutine is resumed here; a queued thread pool call is
+        returned for the caller to run.
+        """
+        with self._lock:
+            waiter = self._backlog.popleft() if self._backlog else None
+            if waiter is None:
+                self._in_flight -= 1
+                return None
+        if callable(waiter):
+            waiter()
+            return None
+        return waiter
+
+    def __repr__(self) -> str:
+        name = getattr(self.handler, "__qualname__", repr(self.handler))
+        return f"<Route {self.event} symbol={self.symbol} condition={self.condition} -> {name}>"
+
+
+class WebhookDispatcher:
+    """
+    Routes webhooks to handlers by event type, symbol and condition.
+
+    Routes live in a dict keyed by ``(event, symbol, condition)``, so
+    finding the handlers for a payload takes at most eight lookups however
+    many routes exist. A payload's ``data`` is only normalized when some
+    route is narrowed by symbol or condition.
+
+    ``dispatch`` runs handlers on a thread pool and returns one future per
+    matched route; ``dispatch_async`` awaits coroutine handlers on the
+    running loop and sends plain functions to the same pool. A route's
+    ``concurrency`` caps how many of its calls run at once across both
+    paths and all event loops; extra calls wait their turn in one queue
+    without occupying a worker. Failures are logged and
+    counted in the route's ``stats`` instead of affecting other routes.
+
+    The dispatcher itself is an async handler for ``WebhookReceiver``.
+
+    Args:
+        max_workers: Thread pool size for plain function handlers
+        executor: Use this executor instead of creating a thread pool
+
+    Example:
+        >>> dispatcher = WebhookDispatcher()
+        >>> @dispatcher.on("alert.triggered", symbol="NVDA", concurrency=2)
+        ... def on_nvda(payload):
+        ...     print(payload.data["stock"]["price"])
+        >>> app = WebhookReceiver(secret, dispatcher)
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_DISPATCH_WORKERS, executor: Optional[Executor] = None) -> None:
+        self.max_workers = max_workers
+        self.routes: List[Route] = []
+        self.unrouted = 0
+        self._table: Dict[RouteKey, List[Route]] = {}
+        self._by_symbol = False
+        self._by_condition = False
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._executor_lock = threading.Lock()
+
+    def on(
+        self,
+        event: str,
+        handler: Optional[Handler] = None,
+        symbol: Optional[str] = None,
+        condition: Optional[str] = None,
+        concurrency: Optional[int] = None,
+    ) -> Any:
+        """
+        Register ``handler`` for ``event`` (or ``"*"`` for every event).
+
+        Usable directly or as a decorator. A payload runs every route whose
+        event matches and whose ``symbol`` and ``condition``, when given,
+        match the triggering alert.
+
+        Args:
+            event: Event type, e.g. ``"alert.triggered"``
+            handler: Function or coroutine function taking a WebhookPayload
+            symbol: Only payloads for this symbol
+            condition: Only payloads for this alert condition
+            concurrency: Maximum simultaneous calls of this route
+
+        Returns:
+            The handler, or a decorator when ``handler`` is omitted
+        """
+        if handler is None:
+            return lambda fn: self.on(event, fn, symbol, condition, concurrency)
+
+        route = Route(event, handler, symbol.upper() if symbol else None, condition, concurrency)
+        self.routes.append(route)
+        self._table.setdefault(route.key, []).append(route)
+        self._by_symbol = self._by_symbol or route.symbol is not None
+        self._by_condition = self._by_condition or route.condition is not None
+        return handler
+
+    def match(self, payload: WebhookPayload) -> List[Route]:
+        """Routes that handle ``payload``, most specific first."""
+        symbol: Optional[str] = None
+        condition: Optional[str] = None
+        if self._by_symbol or self._by_condition:
+            alert = payload.data.get("alert") or {}
+            symbol = str(alert.get("symbol") or "").upper() or None
+            condition = alert.get("condition")
+
+        symbols = (symbol, None) if self._by_symbol and symbol else (None,)
+        conditions = (condition, None) if self._by_condition and condition else (None,)
+        table = self._table
+        matched: List[Route] = []
+        for event in (payload.event, ANY_EVENT):
+            for s in symbols:
+                for c in conditions:
+                    routes = table.get((event, s, c))
+                    if routes:
+                        matched.extend(routes)
+        return matched
+
+    def dispatch(self, payload: WebhookPayload) -> List["Future[Any]"]:
+        """
+        Run the matching handlers on the thread pool.
+
+        Coroutine handlers run to completion in their worker thread.
+
+        Returns:
+            One future per matched route, resolved with the handler's result
+            or exception
+        """
+        routes = self.match(payload)
+        if not routes:
+            self._unrouted(payload)
+        futures = []
+        for route in routes:
+            future: Future[Any] = Future()
+            self._submit(route, payload, future)
+            futures.append(future)
+        return futures
+
+    async def dispatch_async(self, payload: WebhookPayload) -> List[Any]:
+        """
+        Run the matching handlers concurrently and wait for all of them.
+
+        Returns:
+            Each route's result, or the exception it raised
+        """
+        routes = self.match(payload)
+        if not routes:
+            self._unrouted(payload)
+            return []
+        return await asyncio.gather(*(self._run_async(route, payload) for route in routes), return_exceptions=True)
+
+    async def __call__(self, payload: WebhookPayload) -> None:
+        await self.dispatch_async(payload)
+
+    def close(self, wait: bool = True) -> None:
+        """Shut down the thread pool if the dispatcher created it."""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def __enter__(self) -> "WebhookDispatcher":
+        return self
+
+    def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        self.close()
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="stockalert-webhook"
+                    )
+        return self._executor
+
+    def _unrouted(self, payload: WebhookPayload) -> None:
+        self.unrouted += 1
+        logger.debug("No webhook route for event %s (%s)", payload.event, payload.id)
+
+    def _submit(self, route: Route, payload: WebhookPayload, future: "Future[Any]") -> None:
+        if route._acquire((payload, future)):
+            self.executor.submit(self._run, route, payload, future)
+
+    def _run(self, route: Route, payload: WebhookPayload, future: "Future[Any]") -> None:
+        call: Optional[Tuple[WebhookPayload, Future[Any]]] = (payload, future)
+        while call is not None:
+            payload, future = call
+            start = time.perf_counter()
+            try:
+                result = asyncio.run(route.handler(payload)) if route.is_async else route.handler(payload)
+            except Exception as e:
+                self._record(route, payload, start, e)
+                future.set_exception(e)
+            else:
+                self._record(route, payload, start, None)
+                future.set_result(result)
+            # Keep the slot and this worker for the next queued call, if any
+            call = route._release()
+
+    async def _run_async(self, route: Route, payload: WebhookPayload) -> Any:
+        loop = asyncio.get_running_loop()
+        slot: asyncio.Future[None] = loop.create_future()
+
+        def grant() -> None:
+            if slot.cancelled():
+                self._release_slot(route)
+            else:
+                slot.set_result(None)
+
+        # Slots may be released from worker threads or other loops
+        if not route._acquire(lambda: loop.call_soon_threadsafe(grant)):
+            try:
+                await slot
+            except asyncio.CancelledError:
+                if slot.done() and not slot.cancelled():
+                    self._release_slot(route)  # granted, but cancelled before it could run
+                raise
+
+        start = time.perf_counter()
+        try:
+            if route.is_async:
+                result = await route.handler(payload)
+            else:
+                result = await loop.run_in_executor(self.executor, route.handler, payload)
+        except Exception as e:
+            self._record(route, payload, start, e)
+            raise
+        finally:
+            self._release_slot(route)
+        self._record(route, payload, start, None)
+        return result
+
+    def _release_slot(self, route: Route) -> None:
+        call = route._release()
+        if call is not None:
+            self.executor.submit(self._run, route, *call)
+
+    def _record(self, route: Route, payload: WebhookPayload, start: float, error: Optional[Exception]) -> None:
+        elapsed = time.perf_counter() - start
+        with route._lock:
+            route.stats.record(elapsed, error is not None)
+        if error is not None:
+            logger.error("Webhook handler %r failed for event %s: %s", route, payload.id, error, exc_info=error)
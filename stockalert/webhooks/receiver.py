@@ -0,0 +1,215 @@
+"""ASGI webhook receiver for StockAlert SDK."""
+import asyncio
+import inspect
+import json
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from ..logging import logger
+from ..types import WebhookPayload
+from .verifier import WebhookVerifier
+
+SIGNATURE_HEADER = b"x-stockalert-signature"
+TIMESTAMP_HEADER = b"x-stockalert-timestamp"
+
+DEFAULT_WORKERS = 4
+DEFAULT_QUEUE_SIZE = 1000
+DEFAULT_ENQUEUE_TIMEOUT = 0.5
+DEFAULT_MAX_BODY_SIZE = 1024 * 1024
+
+WebhookHandler = Callable[[WebhookPayload], Union[None, Awaitable[None]]]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+class WebhookReceiver:
+    """
+    ASGI application that accepts StockAlert webhooks.
+
+    Each request is verified, parsed into a WebhookPayload and put on a
+    bounded queue; the response is sent right away and ``workers`` tasks run
+    ``handler`` in the background. Coroutine handlers are awaited, plain
+    functions run in the default executor. When the queue stays full for
+    ``enqueue_timeout`` seconds the request is answered with ``503`` and
+    ``Retry-After`` so StockAlert redelivers it later instead of the
+    receiver buffering without bound. If the verifier has a ``seen`` store,
+    redeliveries of an already accepted event are acknowledged with ``200``
+    without running the handler again.
+
+    Args:
+        verifier: WebhookVerifier (or the webhook secret)
+        handler: Called with each WebhookPayload
+        workers: Number of concurrent handler tasks
+        queue_size: Maximum number of accepted, unprocessed webhooks
+        enqueue_timeout: Seconds to wait for queue space before rejecting
+        max_body_size: Larger request bodies are rejected with ``413``
+
+    Example:
+        >>> app = WebhookReceiver(secret, handle_webhook, workers=8)
+        >>> # uvicorn module:app
+    """
+
+    def __init__(
+        self,
+        verifier: Union[WebhookVerifier, str],
+        handler: WebhookHandler,
+        workers: int = DEFAULT_WORKERS,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        enqueue_timeout: float = DEFAULT_ENQUEUE_TIMEOUT,
+        max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.verifier = verifier if isinstance(verifier, WebhookVerifier) else WebhookVerifier(verifier)
+        self.handler = handler
+        # Also covers objects with an ``async def __call__``, such as WebhookDispatcher
+        self._async_handler = inspect.iscoroutinefunction(handler) or inspect.iscoroutinefunction(
+            handler.__call__  # type: ignore[operator]
+        )
+        self.workers = workers
+        self.queue_size = queue_size
+        self.enqueue_timeout = enqueue_timeout
+        self.max_body_size = max_body_size
+        self.stats = {"received": 0, "rejected": 0, "throttled": 0, "processed": 0, "failed": 0, "duplicates": 0}
+        self._queue: Optional[asyncio.Queue[WebhookPayload]] = None
+        self._tasks: List[asyncio.Task[None]] = []
+
+    @property
+    def pending(self) -> int:
+        """Webhooks accepted but not yet handled."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def start(self) -> None:
+        """Start the worker tasks (done automatically on first use)."""
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(self.queue_size)
+        self._tasks = [asyncio.ensure_future(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self, drain: bool = True) -> None:
+        """Stop the workers, first handling everything queued if ``drain``."""
+        if not self._tasks:
+            return
+        if drain and self._queue is not None:
+            await self._queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def __call__(self, scope: Dict[str, Any], receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        if scope["method"] != "POST":
+            await self._respond(send, 405, {"error": "Method not allowed"}, [(b"allow", b"POST")])
+            return
+
+        status, body = await self._accept(scope, receive)
+        headers = [(b"retry-after", b"1")] if status == 503 else []
+        await self._respond(send, status, body, headers)
+
+    async def _accept(self, scope: Dict[str, Any], receive: Receive) -> Tuple[int, Dict[str, Any]]:
+        headers = dict(scope.get("headers") or [])
+        raw = await self._read_body(receive)
+        if raw is None:
+            self.stats["rejected"] += 1
+            return 413, {"error": "Payload too large"}
+
+        signature = headers.get(SIGNATURE_HEADER, b"").decode("latin-1")
+        timestamp = headers.get(TIMESTAMP_HEADER, b"").decode("latin-1") or None
+        if not self.verifier.verify(raw, signature, timestamp):
+            self.stats["rejected"] += 1
+            return 401, {"error": "Invalid signature"}
+
+        try:
+            payload = WebhookPayload(json.loads(raw))
+        except (ValueError, KeyError, TypeError):
+            self.stats["rejected"] += 1
+            return 400, {"error": "Invalid payload"}
+
+        if self.verifier.is_replay(payload.id):
+            self.stats["duplicates"] += 1
+            return 200, {"received": True, "duplicate": True}
+
+        await self.start()
+        assert self._queue is not None
+        try:
+            self._queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            try:
+                await asyncio.wait_for(self._queue.put(payload), self.enqueue_timeout)
+            except asyncio.TimeoutError:
+                # Let the redelivery through
+                self.verifier.forget(payload.id)
+                self.stats["throttled"] += 1
+                return 503, {"error": "Receiver busy"}
+
+        self.stats["received"] += 1
+        return 200, {"received": True}
+
+    async def _read_body(self, receive: Receive) -> Optional[bytearray]:
+        body = bytearray()
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                break
+            body += message.get("body", b"")
+            if len(body) > self.max_body_size:
+                return None
+            if not message.get("more_body", False):
+                break
+        return body
+
+    async def _worker(self) -> None:
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        while True:
+            payload = await self._queue.get()
+            try:
+                if self._async_handler:
+                    await self.handler(payload)  # type: ignore[misc]
+                else:
+                    result = await loop.run_in_executor(None, self.handler, payload)
+                    if inspect.isawaitable(result):
+                        await result
+                self.stats["processed"] += 1
+            except Exception:
+                self.stats["failed"] += 1
+                logger.exception("Webhook handler failed for event %s", payload.id)
+            finally:
+                self._queue.task_done()
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await self.start()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.stop()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _respond(
+        self,
+        send: Send,
+        status: int,
+        body: Dict[str, Any],
+        headers: Optional[List[Tuple[bytes, bytes]]] = None,
+    ) -> None:
+        content = json.dumps(body).encode("utf-8")
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(content)).encode("ascii")),
+                    *(headers or []),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": content})
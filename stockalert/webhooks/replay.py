@@ -0,0 +1,154 @@
+"""Duplicate webhook detection for StockAlert SDK."""
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+DEFAULT_SEEN_TTL = 24 * 60 * 60
+DEFAULT_SEEN_MAX_ENTRIES = 100_000
+
+# Expired rows are purged from SQLite every this many inserts
+_PRUNE_EVERY = 1000
+
+
+class SeenEvents(ABC):
+    """
+    Interface for remembering delivered webhook event IDs.
+
+    ``add`` records an ID and returns False if it was already recorded and
+    has not expired yet.
+    """
+
+    @abstractmethod
+    def add(self, event_id: str) -> bool:
+        """Record ``event_id``; return True if it was not seen before."""
+
+    @abstractmethod
+    def __contains__(self, event_id: object) -> bool:
+        """Whether ``event_id`` was seen and has not expired."""
+
+    @abstractmethod
+    def discard(self, event_id: str) -> None:
+        """Forget an ID, e.g. when its delivery was not accepted after all."""
+
+
+class MemorySeenEvents(SeenEvents):
+    """
+    In-process seen-ID set bounded by age and size.
+
+    IDs are kept in arrival order, so expiry and eviction pop from the front
+    and every operation is O(1) amortized.
+
+    Args:
+        ttl: Seconds an ID is remembered (default: 24 hours)
+        max_entries: Oldest IDs are forgotten beyond this many
+    """
+
+    def __init__(self, ttl: float = DEFAULT_SEEN_TTL, max_entries: int = DEFAULT_SEEN_MAX_ENTRIES) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._expires: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._expires)
+
+    def __contains__(self, event_id: object) -> bool:
+        expires = self._expires.get(event_id)  # type: ignore[call-overload]
+        return expires is not None and expires > time.monotonic()
+
+    def add(self, event_id: str) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            if event_id in self._expires:
+                return False
+            self._expires[event_id] = now + self.ttl
+            while len(self._expires) > self.max_entries:
+                self._expires.popitem(last=False)
+            return True
+
+    def discard(self, event_id: str) -> None:
+        with self._lock:
+            self._expires.pop(event_id, None)
+
+    def _expire(self, now: float) -> None:
+        expires = self._expires
+        while expires:
+            oldest = next(iter(expires.values()))
+            if oldest > now:
+                break
+            expires.popitem(last=False)
+
+
+class SQLiteSeenEvents(SeenEvents):
+    """
+    Seen-ID set in a SQLite file shared by several receiver processes.
+
+    Uses WAL mode so concurrent writers from different processes do not
+    block readers; ``add`` runs in an immediate transaction, so exactly one
+    process sees a given ID as new.
+
+    Args:
+        path: Database file
+        ttl: Seconds an ID is remembered (default: 24 hours)
+    """
+
+    def __init__(self, path: str, ttl: float = DEFAULT_SEEN_TTL) -> None:
+        self.path = path
+        self.ttl = ttl
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._inserts = 0
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen_events (id TEXT PRIMARY KEY, expires_at REAL NOT NULL)"
+        )
+
+    def __contains__(self, event_id: object) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM seen_events WHERE id = ? AND expires_at > ?", (event_id, time.time())
+            ).fetchone()
+        return row is not None
+
+    def add(self, event_id: str) -> bool:
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # An expired ID counts as new again
+                self._conn.execute(
+                    "DELETE FROM seen_events WHERE id = ? AND expires_at <= ?", (event_id, now)
+                )
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO seen_events (id, expires_at) VALUES (?, ?)",
+                    (event_id, now + self.ttl),
+                )
+                added = cursor.rowcount == 1
+                self._inserts += 1
+                if self._inserts % _PRUNE_EVERY == 0:
+                    self._conn.execute("DELETE FROM seen_events WHERE expires_at <= ?", (now,))
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return added
+
+    def discard(self, event_id: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM seen_events WHERE id = ?", (event_id,))
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "SQLiteSeenEvents":
+        return self
+
+    def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        self.close()
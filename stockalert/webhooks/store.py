@@ -0,0 +1,336 @@
+"""Append-only local log of received webhooks for StockAlert SDK."""
+import bisect
+import mmap
+import os
+import struct
+import threading
+import zlib
+from array import array
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Union
+
+from ..codec import JSONCodec, resolve_codec
+from ..types import WebhookPayload, _parse_datetime
+from .dispatcher import WebhookDispatcher
+
+DEFAULT_SEGMENT_SIZE = 64 * 1024 * 1024
+
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".log"
+
+# payload length, CRC-32, timestamp (epoch seconds), symbol length, alert ID length;
+# a zero payload length marks the end of the written part of a segment
+_HEADER = struct.Struct("<IIdHH")
+
+_END_MARKER = bytes(_HEADER.size)
+
+# Dispatched but unfinished replayed events per dispatcher worker
+_REPLAY_BACKLOG_PER_WORKER = 4
+
+TimeBound = Union[datetime, str, int, float, None]
+
+
+def _epoch_seconds(value: Any) -> float:
+    parsed = _parse_datetime(value)
+    if parsed is None:
+        return 0.0
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+class _Segment:
+    __slots__ = ("number", "path", "file", "map", "end")
+
+    def __init__(self, number: int, path: str, size: int) -> None:
+        self.number = number
+        self.path = path
+        self.file = open(path, "a+b")
+        if os.fstat(self.file.fileno()).st_size < size:
+            self.file.truncate(size)
+        self.map = mmap.mmap(self.file.fileno(), 0)
+        self.end = 0
+
+    @property
+    def size(self) -> int:
+        return len(self.map)
+
+    def close(self) -> None:
+        self.map.flush()
+        self.map.close()
+        self.file.close()
+
+
+class WebhookEventStore:
+    """
+    Append-only, memory-mapped log of webhook payloads.
+
+    Payloads are written to preallocated segment files of ``segment_size``
+    bytes through ``mmap``; a new segment starts when the current one is
+    full. Each record carries a checksum plus its timestamp, symbol and
+    alert ID in a fixed header, so opening a store rebuilds the index from
+    the headers alone and a torn final write is ignored.
+
+    The in-memory index keeps timestamps and record positions in packed
+    arrays and record numbers per symbol and per alert ID, so ``scan``
+    only decodes the records it returns.
+
+    Args:
+        directory: Folder holding the segment files (created if missing)
+        segment_size: Bytes preallocated per segment
+        codec: JSON codec for record bodies (see ``StockAlert(codec=...)``)
+
+    Example:
+        >>> store = WebhookEventStore("/var/lib/app/webhooks")
+        >>> store.append(payload)
+        >>> today = store.scan(symbol="TSLA", start=datetime(2026, 3, 19, tzinfo=timezone.utc))
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+        codec: Union[JSONCodec, str, None] = None,
+    ) -> None:
+        if segment_size < _HEADER.size:
+            raise ValueError("segment_size is too small")
+        self.directory = directory
+        self.segment_size = segment_size
+        self._codec = resolve_codec(codec)
+        self._lock = threading.Lock()
+        self._segments: List[_Segment] = []
+        # Record number -> segment index, byte offset and timestamp
+        self._segment_of = array("I")
+        self._offset_of = array("Q")
+        self._times = array("d")
+        self._time_ordered = True
+        self._by_symbol: Dict[str, array[int]] = {}
+        self._by_alert: Dict[str, array[int]] = {}
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+    @property
+    def symbols(self) -> List[str]:
+        """Symbols with at least one stored event."""
+        return sorted(self._by_symbol)
+
+    def append(self, payload: WebhookPayload) -> int:
+        """
+        Store a webhook.
+
+        Returns:
+            The record number, usable with ``get``
+        """
+        alert = payload.data.get("alert") or {}
+        symbol = str(alert.get("symbol") or "").upper()
+        alert_id = str(alert.get("id") or "")
+        timestamp = _epoch_seconds(payload.timestamp)
+        meta = symbol.encode("utf-8") + alert_id.encode("utf-8")
+        body = self._codec.dumps(payload.to_dict())
+        header = _HEADER.pack(
+            len(body),
+            zlib.crc32(body, zlib.crc32(meta)),
+            timestamp,
+            len(symbol.encode("utf-8")),
+            len(alert_id.encode("utf-8")),
+        )
+        size = len(header) + len(meta) + len(body)
+
+        with self._lock:
+            segment = self._writable_segment(size)
+            offset = segment.end
+            end = offset + size
+            # Clear the next header so leftovers of a torn write never follow this record
+            segment.map[end : end + _HEADER.size] = _END_MARKER
+            segment.map[offset + _HEADER.size : end] = meta + body
+            # The header goes last: a record without one is not there
+            segment.map[offset : offset + _HEADER.size] = header
+            segment.end = end
+            return self._index(len(self._segments) - 1, offset, timestamp, symbol, alert_id)
+
+    def get(self, number: int) -> WebhookPayload:
+        """Read the record with ``number``."""
+        if not 0 <= number < len(self._times):
+            raise IndexError(f"No webhook record {number}")
+        return self._read(number)
+
+    def scan(
+        self,
+        symbol: Optional[str] = None,
+        alert_id: Optional[str] = None,
+        start: TimeBound = None,
+        end: TimeBound = None,
+    ) -> Iterator[WebhookPayload]:
+        """
+        Stored webhooks matching every given filter, in append order.
+
+        Args:
+            symbol: Only this symbol
+            alert_id: Only this alert
+            start: Earliest timestamp (inclusive); datetime, ISO string or
+                epoch milliseconds
+            end: Latest timestamp (exclusive)
+        """
+        for number in self._select(symbol, alert_id, start, end):
+            yield self._read(number)
+
+    def count(
+        self,
+        symbol: Optional[str] = None,
+        alert_id: Optional[str] = None,
+        start: TimeBound = None,
+        end: TimeBound = None,
+    ) -> int:
+        """Number of stored webhooks matching the filters, read from the index only."""
+        return len(self._select(symbol, alert_id, start, end))
+
+    def replay(
+        self,
+        dispatcher: WebhookDispatcher,
+        symbol: Optional[str] = None,
+        alert_id: Optional[str] = None,
+        start: TimeBound = None,
+        end: TimeBound = None,
+    ) -> int:
+        """
+        Dispatch stored webhooks again, in append order.
+
+        At most a few events per dispatcher worker are in flight at once;
+        returns after every handler has finished. Handler failures are
+        logged and counted by the dispatcher.
+
+        Returns:
+            Number of webhooks replayed
+        """
+        limit = max(1, dispatcher.max_workers * _REPLAY_BACKLOG_PER_WORKER)
+        pending: Set[Future[Any]] = set()
+        replayed = 0
+        for payload in self.scan(symbol, alert_id, start, end):
+            pending.update(dispatcher.dispatch(payload))
+            replayed += 1
+            if len(pending) >= limit:
+                _, pending = wait(pending, return_when=FIRST_COMPLETED)
+        wait(pending)
+        return replayed
+
+    def flush(self) -> None:
+        """Write the mapped pages of the current segment to disk."""
+        with self._lock:
+            if self._segments:
+                self._segments[-1].map.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            for segment in self._segments:
+                segment.close()
+            self._segments = []
+
+    def __enter__(self) -> "WebhookEventStore":
+        return self
+
+    def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        self.close()
+
+    def _select(
+        self,
+        symbol: Optional[str],
+        alert_id: Optional[str],
+        start: TimeBound,
+        end: TimeBound,
+    ) -> Sequence[int]:
+        low = None if start is None else _epoch_seconds(start)
+        high = None if end is None else _epoch_seconds(end)
+
+        lists = []
+        if symbol is not None:
+            lists.append(self._by_symbol.get(symbol.upper(), array("I")))
+        if alert_id is not None:
+            lists.append(self._by_alert.get(alert_id, array("I")))
+
+        if not lists:
+            if self._time_ordered:
+                times = self._times
+                first = 0 if low is None else bisect.bisect_left(times, low)
+                last = len(times) if high is None else bisect.bisect_left(times, high)
+                return range(first, last)
+            candidates: Sequence[int] = range(len(self._times))
+        elif len(lists) == 1:
+            candidates = lists[0]
+        else:
+            lists.sort(key=len)
+            others = set(lists[1])
+            candidates = [number for number in lists[0] if number in others]
+
+        if low is None and high is None:
+            return candidates
+        times = self._times
+        return [
+            number
+            for number in candidates
+            if (low is None or times[number] >= low) and (high is None or times[number] < high)
+        ]
+
+    def _read(self, number: int) -> WebhookPayload:
+        segment = self._segments[self._segment_of[number]]
+        offset = self._offset_of[number]
+        length, _, _, symbol_length, alert_length = _HEADER.unpack_from(segment.map, offset)
+        start = offset + _HEADER.size + symbol_length + alert_length
+        return WebhookPayload(self._codec.loads(segment.map[start : start + length]))
+
+    def _writable_segment(self, size: int) -> _Segment:
+        segment = self._segments[-1] if self._segments else None
+        # Keep at least one header's worth of zeros after the last record
+        if segment is None or segment.end + size + _HEADER.size > segment.size:
+            number = segment.number + 1 if segment is not None else 1
+            segment = self._open_segment(number, max(self.segment_size, size + _HEADER.size))
+        return segment
+
+    def _open_segment(self, number: int, size: int) -> _Segment:
+        path = os.path.join(self.directory, f"{SEGMENT_PREFIX}{number:06d}{SEGMENT_SUFFIX}")
+        segment = _Segment(number, path, size)
+        self._segments.append(segment)
+        return segment
+
+    def _index(self, segment: int, offset: int, timestamp: float, symbol: str, alert_id: str) -> int:
+        number = len(self._times)
+        if self._times and timestamp < self._times[-1]:
+            self._time_ordered = False
+        self._segment_of.append(segment)
+        self._offset_of.append(offset)
+        self._times.append(timestamp)
+        if symbol:
+            self._by_symbol.setdefault(symbol, array("I")).append(number)
+        if alert_id:
+            self._by_alert.setdefault(alert_id, array("I")).append(number)
+        return number
+
+    def _load(self) -> None:
+        numbers = sorted(
+            int(name[len(SEGMENT_PREFIX) : -len(SEGMENT_SUFFIX)])
+            for name in os.listdir(self.directory)
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX)
+        )
+        for number in numbers:
+            segment = self._open_segment(number, _HEADER.size)
+            data = segment.map
+            offset = 0
+            while offset + _HEADER.size <= segment.size:
+                length, checksum, timestamp, symbol_length, alert_length = _HEADER.unpack_from(data, offset)
+                meta_start = offset + _HEADER.size
+                body_start = meta_start + symbol_length + alert_length
+                record_end = body_start + length
+                if length == 0 or record_end > segment.size:
+                    break
+                meta = data[meta_start:body_start]
+                if zlib.crc32(data[body_start:record_end], zlib.crc32(meta)) != checksum:
+                    # Torn write: the next append overwrites it
+                    break
+                symbol = meta[:symbol_length].decode("utf-8")
+                alert_id = meta[symbol_length:].decode("utf-8")
+                self._index(len(self._segments) - 1, offset, timestamp, symbol, alert_id)
+                offset = record_end
+            segment.end = offset
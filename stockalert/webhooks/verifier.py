@@ -0,0 +1,335 @@
+"""Webhook signature verification for StockAlert SDK."""
+import hashlib
+import hmac
+import threading
+import time
+from datetime import timezone
+from typing import List, Mapping, Optional, Sequence, Tuple, Union
+
+from ..logging import logger
+from ..types import _parse_datetime
+from .replay import SeenEvents
+
+Payload = Union[str, bytes, bytearray, memoryview]
+Secret = Union[str, bytes]
+
+SIGNATURE_PREFIX = "sha256="
+
+
+def _timestamp_prefix(timestamp: Optional[Union[str, int]]) -> bytes:
+    if timestamp in (None, ""):
+        return b""
+    return f"{timestamp}.".encode()
+
+
+# Epoch values at or above this are milliseconds (1e11 seconds is the year 5138)
+_MILLISECONDS_THRESHOLD = 1e11
+
+
+def _timestamp_seconds(timestamp: Optional[Union[str, int]]) -> Optional[float]:
+    """
+    Epoch seconds of a timestamp header.
+
+    Accepts epoch seconds or epoch milliseconds (told apart by magnitude)
+    as numbers or digit strings, and ISO 8601 strings.
+    """
+    if isinstance(timestamp, str) and timestamp.strip().isdigit():
+        timestamp = int(timestamp.strip())
+    if isinstance(timestamp, (int, float)) and not isinstance(timestamp, bool):
+        return timestamp / 1000 if timestamp >= _MILLISECONDS_THRESHOLD else float(timestamp)
+    try:
+        parsed = _parse_datetime(timestamp)
+    except (TypeError, ValueError, OverflowError, OSError):
+        return None
+    if parsed is None:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+class WebhookVerifier:
+    """
+    Verifies webhook signatures for one secret.
+
+    The HMAC key schedule is computed once; each verification copies that
+    state and hashes the timestamp prefix and the body incrementally, so
+    ``bytes``, ``bytearray`` and ``memoryview`` bodies are never decoded or
+    concatenated.
+
+    With ``tolerance`` set, signatures whose timestamp is missing or more
+    than ``tolerance`` seconds away from the current time are rejected, so
+    a captured request cannot be replayed later. ``seen`` remembers event
+    IDs for ``is_replay`` to drop redeliveries of the same event.
+
+    Args:
+        secret: Webhook secret
+        tolerance: Maximum timestamp age in seconds (default: not checked).
+            Timestamps may be epoch seconds, epoch milliseconds or ISO 8601.
+        seen: Store of already delivered event IDs
+
+    Example:
+        >>> verifier = WebhookVerifier(secret, tolerance=300, seen=MemorySeenEvents())
+        >>> verifier.verify(body, headers["X-StockAlert-Signature"], headers.get("X-StockAlert-Timestamp"))
+    """
+
+    def __init__(
+        self,
+        secret: Secret,
+        tolerance: Optional[float] = None,
+        seen: Optional[SeenEvents] = None,
+    ) -> None:
+        if not secret:
+            raise ValueError("Webhook secret is required")
+        self._mac = hmac.new(_key_bytes(secret), digestmod=hashlib.sha256)
+        self.tolerance = tolerance
+        self.seen = seen
+
+    def digest(self, payload: Payload, timestamp: Optional[Union[str, int]] = None) -> bytes:
+        """Raw HMAC-SHA256 of ``payload`` as signed by StockAlert."""
+        mac = self._mac.copy()
+        prefix = _timestamp_prefix(timestamp)
+        if prefix:
+            mac.update(prefix)
+        mac.update(payload.encode("utf-8") if isinstance(payload, str) else payload)
+        return mac.digest()
+
+    def sign(self, payload: Payload, timestamp: Optional[Union[str, int]] = None) -> str:
+        """Signature header value for ``payload`` (useful for tests)."""
+        return SIGNATURE_PREFIX + self.digest(payload, timestamp).hex()
+
+    def verify(
+        self,
+        payload: Payload,
+        signature: Optional[str],
+        timestamp: Optional[Union[str, int]] = None,
+        now: Optional[float] = None,
+    ) -> bool:
+        """
+        Check a signature header.
+
+        Args:
+            payload: Raw request body
+            signature: ``X-StockAlert-Signature`` value, with or without
+                the ``sha256=`` prefix
+            timestamp: ``X-StockAlert-Timestamp`` value, if sent
+            now: Current epoch seconds for the tolerance check (default:
+                ``time.time()``)
+
+        Returns:
+            True if the signature is valid and, with ``tolerance`` set,
+            the timestamp is recent
+        """
+        expected = self._expected(payload, signature, timestamp, now)
+        return expected is not None and self._matches(payload, expected, timestamp)
+
+    def is_fresh(self, timestamp: Optional[Union[str, int]], now: Optional[float] = None) -> bool:
+        """Whether ``timestamp`` lies within ``tolerance`` seconds of ``now``."""
+        seconds = _timestamp_seconds(timestamp)
+        if seconds is None:
+            return False
+        if self.tolerance is None:
+            return True
+        current = time.time() if now is None else now
+        return abs(current - seconds) <= self.tolerance
+
+    def is_replay(self, event_id: Optional[str]) -> bool:
+        """
+        Record a delivered event ID and report whether it was seen before.
+
+        Always False when the verifier has no ``seen`` store.
+        """
+        if self.seen is None or not event_id:
+            return False
+        return not self.seen.add(event_id)
+
+    def forget(self, event_id: Optional[str]) -> None:
+        """Undo ``is_replay`` for an event that will be redelivered."""
+        if self.seen is not None and event_id:
+            self.seen.discard(event_id)
+
+    def _expected(
+        self,
+        payload: Payload,
+        signature: Optional[str],
+        timestamp: Optional[Union[str, int]],
+        now: Optional[float],
+    ) -> Optional[bytes]:
+        """Decoded signature, or None if the request fails the cheap checks."""
+        if not payload or not signature:
+            return None
+        if self.tolerance is not None and not self.is_fresh(timestamp, now):
+            return None
+        return _signature_bytes(signature)
+
+    def _matches(self, payload: Payload, expected: bytes, timestamp: Optional[Union[str, int]]) -> bool:
+        return hmac.compare_digest(self.digest(payload, timestamp), expected)
+
+
+class _Key:
+    __slots__ = ("key_id", "mac", "added_at", "last_used", "matches")
+
+    def __init__(self, key_id: str, mac: "hmac.HMAC", now: float) -> None:
+        self.key_id = key_id
+        self.mac = mac
+        self.added_at = now
+        self.last_used = now
+        self.matches = 0
+
+
+class RotatingWebhookVerifier(WebhookVerifier):
+    """
+    Verifies webhook signatures against several secrets during a rotation.
+
+    Every key's HMAC state is precomputed. Keys are tried most recently
+    matched first, so once senders have switched to the new secret a valid
+    request costs one HMAC again. ``match`` reports which key matched.
+
+    With ``retire_after`` set, a key that has not matched for that many
+    seconds is dropped, except the most recently added one, so the old
+    secret disappears on its own once the rotation is over. ``sign`` uses
+    the most recently added key.
+
+    Args:
+        secrets: Secrets oldest first, or a mapping of key ID to secret
+        retire_after: Seconds without a match before a key is retired
+        tolerance: Maximum timestamp age in seconds (default: not checked)
+        seen: Store of already delivered event IDs
+
+    Example:
+        >>> verifier = RotatingWebhookVerifier({"2025": old_secret, "2026": new_secret}, retire_after=7 * 86400)
+        >>> verifier.match(body, signature, timestamp)
+        '2026'
+    """
+
+    def __init__(
+        self,
+        secrets: Union[Sequence[Secret], Mapping[str, Secret]],
+        retire_after: Optional[float] = None,
+        tolerance: Optional[float] = None,
+        seen: Optional[SeenEvents] = None,
+    ) -> None:
+        items = list(secrets.items()) if isinstance(secrets, Mapping) else [(None, s) for s in secrets]
+        if not items:
+            raise ValueError("At least one webhook secret is required")
+        super().__init__(items[-1][1], tolerance=tolerance, seen=seen)
+        self.retire_after = retire_after
+        self.retired: List[str] = []
+        self._lock = threading.Lock()
+        # Replaced, never mutated, so verification can read it without the lock
+        self._keys: Tuple[_Key, ...] = ()
+        self._next_sweep = 0.0
+        for key_id, secret in items:
+            self.add_secret(secret, key_id)
+
+    @property
+    def key_ids(self) -> List[str]:
+        """Active key IDs in the order they are tried."""
+        return [key.key_id for key in self._keys]
+
+    def add_secret(self, secret: Secret, key_id: Optional[str] = None) -> str:
+        """
+        Start accepting ``secret`` and sign with it from now on.
+
+        Returns:
+            The key ID (a short fingerprint of the secret unless given)
+        """
+        if not secret:
+            raise ValueError("Webhook secret is required")
+        raw = _key_bytes(secret)
+        key_id = key_id or hashlib.sha256(raw).hexdigest()[:8]
+        mac = hmac.new(raw, digestmod=hashlib.sha256)
+        with self._lock:
+            others = tuple(key for key in self._keys if key.key_id != key_id)
+            key = _Key(key_id, mac, time.monotonic())
+            # A new key is tried after the current favourite until it matches
+            self._keys = others[:1] + (key,) + others[1:]
+            self._newest = key
+            self._mac = mac
+        return key_id
+
+    def remove_secret(self, key_id: str) -> None:
+        """Stop accepting the secret with ``key_id``."""
+        with self._lock:
+            keys = tuple(key for key in self._keys if key.key_id != key_id)
+            if not keys:
+                raise ValueError("Cannot remove the last webhook secret")
+            self._keys = keys
+            if self._newest.key_id == key_id:
+                self._newest = max(keys, key=lambda key: key.added_at)
+                self._mac = self._newest.mac
+
+    def match(
+        self,
+        payload: Payload,
+        signature: Optional[str],
+        timestamp: Optional[Union[str, int]] = None,
+        now: Optional[float] = None,
+    ) -> Optional[str]:
+        """
+        Check a signature header like ``verify`` and name the key that matched.
+
+        Returns:
+            The matching key ID, or None if the request is not valid
+        """
+        expected = self._expected(payload, signature, timestamp, now)
+        if expected is None:
+            return None
+        key = self._find(payload, expected, timestamp)
+        return key.key_id if key is not None else None
+
+    def _matches(self, payload: Payload, expected: bytes, timestamp: Optional[Union[str, int]]) -> bool:
+        return self._find(payload, expected, timestamp) is not None
+
+    def _find(self, payload: Payload, expected: bytes, timestamp: Optional[Union[str, int]]) -> Optional[_Key]:
+        prefix = _timestamp_prefix(timestamp)
+        body = payload.encode("utf-8") if isinstance(payload, str) else payload
+        keys = self._keys
+        found = None
+        for key in keys:
+            mac = key.mac.copy()
+            if prefix:
+                mac.update(prefix)
+            mac.update(body)
+            if hmac.compare_digest(mac.digest(), expected):
+                found = key
+                break
+
+        now = time.monotonic()
+        if found is not None:
+            found.last_used = now
+            found.matches += 1
+            if found is not keys[0]:
+                with self._lock:
+                    self._keys = (found,) + tuple(key for key in self._keys if key is not found)
+        if self.retire_after is not None and now >= self._next_sweep:
+            self._retire(now)
+        return found
+
+    def _retire(self, now: float) -> None:
+        assert self.retire_after is not None
+        with self._lock:
+            # Checked at most a few times per retirement window
+            self._next_sweep = now + min(self.retire_after / 10, 60.0)
+            cutoff = now - self.retire_after
+            keep = tuple(key for key in self._keys if key is self._newest or key.last_used > cutoff)
+            if len(keep) == len(self._keys):
+                return
+            for key in self._keys:
+                if key not in keep:
+                    self.retired.append(key.key_id)
+                    logger.info("Retired webhook secret %s after %.0fs without a match", key.key_id, now - key.last_used)
+            self._keys = keep
+
+
+def _key_bytes(secret: Secret) -> bytes:
+    return secret.encode("utf-8") if isinstance(secret, str) else bytes(secret)
+
+
+def _signature_bytes(signature: str) -> Optional[bytes]:
+    if signature.startswith(SIGNATURE_PREFIX):
+        signature = signature[len(SIGNATURE_PREFIX):]
+    try:
+        return bytes.fromhex(signature)
+    except ValueError:
+        return None
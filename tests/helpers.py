@@ -0,0 +1,129 @@
+"""Payload builders shared by the test modules."""
+import json
+
+from stockalert import WebhookVerifier
+from stockalert.types import WebhookPayload
+
+WEBHOOK_SECRET = "webhook_secret_123"
+WEBHOOK_TIMESTAMP = "1736180400000"
+
+
+def make_alert_payload(
+    alert_id: str = "alert_123",
+    symbol: str = "AAPL",
+    condition: str = "price_above",
+    status: str = "active",
+    **extra,
+) -> dict:
+    return {
+        "id": alert_id,
+        "symbol": symbol,
+        "condition": condition,
+        "threshold": 150.0,
+        "notification": "email",
+        "status": status,
+        "created_at": "2026-03-19T12:00:00Z",
+        "updated_at": "2026-03-19T12:00:00Z",
+        **extra,
+    }
+
+
+def make_listing(alerts, page: int = 1, limit: int = 100, total=None, total_pages: int = 1) -> dict:
+    return {
+        "data": alerts,
+        "meta": {
+            "pagination": {
+                "page": page,
+                "limit": limit,
+                "total": len(alerts) if total is None else total,
+                "total_pages": total_pages,
+            },
+        },
+    }
+
+
+def make_page_payload(page: int, total_pages: int, per_page: int = 2) -> dict:
+    alerts = [make_alert_payload(f"alert_{page}_{i}") for i in range(per_page)]
+    return make_listing(alerts, page, per_page, total_pages * per_page, total_pages)
+
+
+def make_subscription_payload() -> dict:
+    return {
+        "id": "sub_123",
+        "account_type": "premium",
+        "status": "active",
+        "is_early_bird": False,
+        "is_early_bird_eligible": True,
+        "is_premium": True,
+        "cancel_at_period_end": False,
+        "quotas": {"sms": 50},
+        "usage": {"count": 12},
+        "current_period": {
+            "start": "2026-03-01T00:00:00Z",
+            "end": "2026-04-01T00:00:00Z",
+        },
+        "alerts": {
+            "counts": {
+                "total": 7,
+                "by_status": {"active": 7, "paused": 0, "triggered": 0, "inactive": 0},
+            },
+            "quota": {"limit": None, "remaining": None, "unlimited": True},
+        },
+        "watchlist_items_count": 9,
+        "watchlist_quota": 100,
+    }
+
+
+def make_webhook_event(
+    event_id: str = "evt_1",
+    event: str = "alert.triggered",
+    symbol: str = "NVDA",
+    condition: str = "price_above",
+    alert_id: str = "a1",
+    timestamp="2026-03-19T12:00:00Z",
+    price: float = 100.0,
+) -> dict:
+    return {
+        "id": event_id,
+        "event": event,
+        "timestamp": timestamp,
+        "data": {
+            "alert": {"id": alert_id, "symbol": symbol, "condition": condition},
+            "stock": {"symbol": symbol, "price": price},
+        },
+    }
+
+
+def make_webhook_payload(*args, **kwargs) -> WebhookPayload:
+    return WebhookPayload(make_webhook_event(*args, **kwargs))
+
+
+def make_webhook_body(*args, **kwargs) -> bytes:
+    return json.dumps(make_webhook_event(*args, **kwargs)).encode()
+
+
+async def post_webhook(app, body: bytes, signature=None, timestamp=WEBHOOK_TIMESTAMP):
+    """Call the ASGI app with one POST and collect the response."""
+    if signature is None:
+        signature = WebhookVerifier(WEBHOOK_SECRET).sign(body, timestamp)
+    chunks = [body[:10], body[10:]]
+    messages = []
+
+    async def receive():
+        chunk = chunks.pop(0)
+        return {"type": "http.request", "body": chunk, "more_body": bool(chunks)}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "headers": [
+            (b"x-stockalert-signature", signature.encode()),
+            (b"x-stockalert-timestamp", timestamp.encode()),
+        ],
+    }
+    await app(scope, receive, send)
+    headers = dict(messages[0]["headers"])
+    return messages[0]["status"], headers, json.loads(messages[1]["body"])
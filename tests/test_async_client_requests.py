@@ -0,0 +1,164 @@
+"""Test async client HTTP request handling."""
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from stockalert import AsyncStockAlert, NetworkError, RateLimitError  # noqa: E402
+
+
+def install_transport(client, handler):
+    """Swap the client's httpx client for one backed by a mock transport."""
+    client._client = httpx.AsyncClient(
+        base_url="https://stockalert.pro/api/v1",
+        transport=httpx.MockTransport(handler),
+    )
+
+
+class TestAsyncClientRetries:
+    """Test async retry and backoff handling."""
+
+    @pytest.mark.asyncio
+    async def test_retries_server_errors_on_idempotent_methods(self):
+        """Test that GET requests are retried after a 5xx."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) < 3:
+                return httpx.Response(503, json={"error": "unavailable"})
+            return httpx.Response(200, json={"success": True, "data": {"id": "123"}})
+
+        async with AsyncStockAlert(api_key="sk_test_valid_key") as client:
+            install_transport(client, handler)
+            with patch("asyncio.sleep", new=AsyncMock()) as sleep:
+                result = await client._request("GET", "/alerts/123")
+
+        assert result == {"id": "123"}
+        assert len(calls) == 3
+        assert sleep.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_server_errors_on_post(self):
+        """Test that non-idempotent requests are not resent after a 5xx."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(500, json={"error": "boom"})
+
+        async with AsyncStockAlert(api_key="sk_test_valid_key") as client:
+            install_transport(client, handler)
+            with patch("asyncio.sleep", new=AsyncMock()):
+                with pytest.raises(Exception, match="boom"):
+                    await client._request("POST", "/alerts", json={})
+
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_honors_retry_after_on_rate_limit(self):
+        """Test that 429 responses are retried after Retry-After seconds."""
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "7"}, json={"error": "slow down"}),
+            httpx.Response(200, json={"success": True, "data": {"ok": True}}),
+        ]
+
+        async with AsyncStockAlert(api_key="sk_test_valid_key") as client:
+            install_transport(client, lambda request: responses.pop(0))
+            with patch("asyncio.sleep", new=AsyncMock()) as sleep:
+                result = await client._request("POST", "/alerts", json={})
+
+        assert result == {"ok": True}
+        assert sleep.await_count == 1
+        assert sleep.await_args.args[0] == pytest.approx(7.0, abs=0.5)
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_error_after_retries_exhausted(self):
+        """Test that a persistent 429 surfaces as RateLimitError."""
+        def handler(request):
+            return httpx.Response(429, headers={"Retry-After": "1"}, json={"error": "slow down"})
+
+        async with AsyncStockAlert(api_key="sk_test_valid_key", max_retries=1) as client:
+            install_transport(client, handler)
+            with patch("asyncio.sleep", new=AsyncMock()):
+                with pytest.raises(RateLimitError) as exc_info:
+                    await client._request("GET", "/alerts")
+
+        assert exc_info.value.retry_after == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises_network_error(self):
+        """Test that timeouts are retried and then surface as NetworkError."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        async with AsyncStockAlert(api_key="sk_test_valid_key", max_retries=2) as client:
+            install_transport(client, handler)
+            with patch("asyncio.sleep", new=AsyncMock()):
+                with pytest.raises(NetworkError, match="timeout"):
+                    await client._request("GET", "/alerts")
+
+        assert len(calls) == 3
+
+
+class TestAsyncClientTransport:
+    """Test async connection pool configuration."""
+
+    @pytest.mark.asyncio
+    async def test_pool_limits_are_passed_to_httpx(self):
+        """Test that pool limits and the HTTP/2 flag reach httpx.AsyncClient."""
+        client = AsyncStockAlert(api_key="sk_test_valid_key", max_connections=7, keepalive_expiry=30)
+
+        with patch("httpx.AsyncClient") as async_client:
+            async_client.return_value.aclose = AsyncMock()
+            async with client:
+                pass
+
+        kwargs = async_client.call_args.kwargs
+        assert kwargs["http2"] is False
+        assert kwargs["limits"].max_connections == 7
+        assert kwargs["limits"].keepalive_expiry == 30
+
+    def test_http2_requires_h2(self):
+        """Test that http2=True fails early with an install hint when h2 is missing."""
+        with patch("importlib.util.find_spec", return_value=None):
+            with pytest.raises(ImportError, match=r"stockalert\[http2\]"):
+                AsyncStockAlert(api_key="sk_test_valid_key", http2=True)
+
+
+class TestAsyncConditionalRequests:
+    """Test ETag revalidation in the async client."""
+
+    @pytest.mark.asyncio
+    async def test_not_modified_serves_cached_response(self):
+        """Test that a 304 reuses the cached list page."""
+        page = {"success": True, "data": [], "meta": {"pagination": {"page": 1}}}
+        seen_headers = []
+
+        def handler(request):
+            seen_headers.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"p1"':
+                return httpx.Response(304, headers={"ETag": '"p1"'})
+            return httpx.Response(200, headers={"ETag": '"p1"'}, json=page)
+
+        async with AsyncStockAlert(api_key="sk_test_valid_key") as client:
+            install_transport(client, handler)
+            first = await client.alerts.list(limit=10)
+            second = await client.alerts.list(limit=10)
+
+        assert seen_headers == [None, '"p1"']
+        assert second.meta == first.meta
+
+    @pytest.mark.asyncio
+    async def test_not_modified_without_cached_entry_refetches(self):
+        """Test that an unexpected 304 is retried without validators."""
+        page = {"success": True, "data": [{"id": "wh_1"}]}
+        responses = [httpx.Response(304), httpx.Response(200, json=page)]
+
+        async with AsyncStockAlert(api_key="sk_test_valid_key") as client:
+            install_transport(client, lambda request: responses.pop(0))
+            assert await client.webhooks.list() == [{"id": "wh_1"}]
@@ -0,0 +1,77 @@
+"""Test the columnar AlertBatch."""
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from stockalert import AlertBatch, StockAlert
+from stockalert.types import Alert
+from tests.helpers import make_alert_payload, make_page_payload
+
+
+def test_batch_round_trips_rows():
+    """Test that rows rebuild the original payloads and Alert objects."""
+    records = [
+        make_alert_payload("a1", "NVDA", "price_below", triggered_at="2026-03-20T15:00:00Z"),
+        make_alert_payload("a2", "AAPL", "new_high", threshold=None, parameters={"period": 52}),
+    ]
+
+    batch = AlertBatch(records)
+
+    assert len(batch) == 2
+    assert batch.to_dicts() == [
+        {**records[0], "created_at": "2026-03-19T12:00:00Z"},
+        {key: value for key, value in records[1].items() if value is not None},
+    ]
+    assert isinstance(batch[1], Alert)
+    assert batch[-1].parameters == {"period": 52}
+    assert batch[0].triggered_at == datetime(2026, 3, 20, 15, tzinfo=timezone.utc)
+
+
+def test_batch_columns_are_dictionary_encoded():
+    """Test column decoding, value counts and code-based filtering."""
+    batch = AlertBatch(
+        [
+            make_alert_payload("a1", "NVDA", "price_below"),
+            make_alert_payload("a2", "NVDA", "price_above", status="paused"),
+            make_alert_payload("a3", "AAPL", "price_below"),
+        ]
+    )
+
+    assert batch._strings["symbol"].values == ["NVDA", "AAPL"]
+    assert list(batch._strings["symbol"].codes) == [0, 0, 1]
+    assert batch.column("symbol") == ["NVDA", "NVDA", "AAPL"]
+    assert batch.column("last_metric_value") == [None, None, None]
+    assert batch.value_counts("status") == {"active": 2, "paused": 1}
+    assert batch.where(symbol="nvda", status="active").column("id") == ["a1"]
+    assert len(batch.where(symbol="TSLA")) == 0
+    assert batch[1:].column("id") == ["a2", "a3"]
+
+
+def test_concat_remaps_string_codes():
+    """Test that joining batches with different dictionaries keeps values."""
+    first = AlertBatch([make_alert_payload("a1", "NVDA", "price_below")])
+    second = AlertBatch([make_alert_payload("a2", "AAPL", "new_high"), make_alert_payload("a3", "NVDA", "new_high")])
+
+    batch = AlertBatch.concat([first, second])
+
+    assert batch.column("symbol") == ["NVDA", "AAPL", "NVDA"]
+    assert batch.column("condition") == ["price_below", "new_high", "new_high"]
+    assert batch.value_counts("symbol") == {"NVDA": 2, "AAPL": 1}
+
+
+def test_list_and_iterate_batches_return_columnar_pages():
+    """Test the columnar options on alerts.list and iterate_batches."""
+    client = StockAlert(api_key="sk_test_valid_key")
+
+    def fake_request(method, path, params=None, **kwargs):
+        return make_page_payload(params["page"], total_pages=3)
+
+    with patch.object(client.alerts, "_request", side_effect=fake_request):
+        response = client.alerts.list(columnar=True, limit=2, page=1)
+        pages = list(client.alerts.iterate_batches(concurrency=2, limit=2))
+
+    assert isinstance(response.data, AlertBatch)
+    assert response["data"][0]["id"] == "alert_1_0"
+    assert [len(page) for page in pages] == [2, 2, 2]
+    assert AlertBatch.concat(pages).column("id") == [
+        f"alert_{page}_{i}" for page in range(1, 4) for i in range(2)
+    ]
@@ -0,0 +1,108 @@
+"""Test response caching."""
+from unittest.mock import patch
+
+from stockalert import ResponseCache, StockAlert
+from tests.helpers import make_alert_payload, make_listing, make_subscription_payload
+
+
+def test_response_cache_expires_entries():
+    """Test per-endpoint TTLs."""
+    cache = ResponseCache(ttl=10, ttls={"alerts.list": 1})
+
+    with patch("stockalert.cache.time.monotonic", return_value=100.0):
+        cache.set("alerts.get", "a1", {"id": "a1"})
+        cache.set("alerts.list", "q", {"data": []})
+
+    with patch("stockalert.cache.time.monotonic", return_value=105.0):
+        assert cache.get("alerts.get", "a1") == {"id": "a1"}
+        assert cache.get("alerts.list", "q") is None
+
+
+def test_response_cache_evicts_least_recently_used():
+    """Test that the size bound evicts the least recently used entry."""
+    cache = ResponseCache(max_entries=2)
+    cache.set("alerts.get", "a1", 1)
+    cache.set("alerts.get", "a2", 2)
+    cache.get("alerts.get", "a1")
+    cache.set("alerts.get", "a3", 3)
+
+    assert cache.get("alerts.get", "a1") == 1
+    assert cache.get("alerts.get", "a2") is None
+    assert len(cache) == 2
+
+
+def test_response_cache_invalidates_whole_endpoint():
+    """Test that invalidating an endpoint drops all of its keys only."""
+    cache = ResponseCache()
+    cache.set("alerts.list", "q1", 1)
+    cache.set("alerts.list", "q2", 2)
+    cache.set("alerts.get", "a1", 3)
+
+    cache.invalidate("alerts.list")
+
+    assert cache.get("alerts.list", "q1") is None
+    assert cache.get("alerts.list", "q2") is None
+    assert cache.get("alerts.get", "a1") == 3
+
+
+def test_cached_results_are_isolated_from_callers():
+    """Test that mutating a returned or stored payload does not change the cache."""
+    client = StockAlert(api_key="sk_test_valid_key", cache=True)
+    payload = {
+        "id": "a1",
+        "symbol": "AAPL",
+        "condition": "price_above",
+        "notification": "email",
+        "status": "active",
+        "created_at": "2026-03-19T12:00:00Z",
+    }
+
+    with patch.object(client.alerts, "_request", return_value=payload) as request:
+        client.alerts.get("a1").to_dict()["status"] = "LOCALLY-MUTATED"
+        payload["symbol"] = "MSFT"
+        alert = client.alerts.get("a1")
+
+    assert request.call_count == 1
+    assert (alert.status, alert.symbol) == ("active", "AAPL")
+
+
+def test_list_primes_get_and_writes_invalidate():
+    """Test that list() serves later get() calls and writes invalidate them."""
+    client = StockAlert(api_key="sk_test_valid_key", cache=True)
+
+    with patch.object(client.alerts, "_request", return_value=make_listing([make_alert_payload()])) as request:
+        client.alerts.list(limit=1)
+        client.alerts.list(limit=1)
+        alert = client.alerts.get("alert_123")
+
+    assert alert.symbol == "AAPL"
+    assert request.call_count == 1
+
+    with patch.object(client.alerts, "_request", return_value={"alertId": "alert_123"}):
+        client.alerts.pause("alert_123")
+
+    assert client._transport.cache.get("alerts.get", "alert_123") is None
+    assert len(client._transport.cache) == 0
+
+
+def test_subscription_is_cached():
+    """Test that repeated get_subscription() calls hit the cache."""
+    client = StockAlert(api_key="sk_test_valid_key", cache=ResponseCache())
+
+    with patch.object(client.user, "_request", return_value=make_subscription_payload()) as request:
+        client.user.get_subscription()
+        subscription = client.user.get_subscription()
+
+    assert subscription.account_type == "premium"
+    assert request.call_count == 1
+
+
+def test_cache_is_disabled_by_default():
+    """Test that the response cache is opt-in."""
+    client = StockAlert(api_key="sk_test_valid_key")
+
+    with patch.object(client.alerts, "_request", return_value=make_listing([make_alert_payload()])) as request:
+        client.alerts.list(limit=1)
+        client.alerts.list(limit=1)
+
+    assert request.call_count == 2
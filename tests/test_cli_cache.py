@@ -0,0 +1,112 @@
+"""Test the CLI's on-disk alert cache."""
+import argparse
+from unittest.mock import patch
+
+import pytest
+
+from stockalert.cli import main as cli
+from stockalert.cli.cache import AlertCache, default_cache_path
+from tests.helpers import make_alert_payload, make_listing
+
+
+def test_cached_listing_is_replayed_within_max_age(tmp_path):
+    """Test that an identical listing is served from the cache."""
+    cache = AlertCache(str(tmp_path / "alerts.sqlite3"), max_age=60)
+    listing = make_listing([make_alert_payload("a1", "NVDA", "price_below")])
+
+    cache.put_listing({"limit": 10}, listing)
+
+    assert cache.get_listing({"limit": 10}) == listing
+    assert cache.get_alert("a1")["symbol"] == "NVDA"
+    assert cache.get_listing({"limit": 20}) is not None  # derived from a complete listing
+
+
+def test_complete_listing_answers_filtered_queries(tmp_path):
+    """Test that symbol/status filters are answered from the indexes."""
+    cache = AlertCache(str(tmp_path / "alerts.sqlite3"), max_age=60)
+    cache.put_listing(
+        {},
+        make_listing(
+            [
+                make_alert_payload("a1", "NVDA", "price_below"),
+                make_alert_payload("a2", "NVDA", "price_above", status="paused"),
+                make_alert_payload("a3", "AAPL", "price_below"),
+            ]
+        ),
+    )
+
+    result = cache.get_listing({"symbol": "NVDA", "status": "active"})
+
+    assert [alert["id"] for alert in result["data"]] == ["a1"]
+    assert result["meta"]["pagination"]["total"] == 1
+
+
+def test_derived_listing_keeps_api_order(tmp_path):
+    """Test that re-storing one alert does not move it within a derived listing."""
+    cache = AlertCache(str(tmp_path / "alerts.sqlite3"), max_age=60)
+    cache.put_listing(
+        {},
+        make_listing(
+            [
+                make_alert_payload("a3", "NVDA", "price_below"),
+                make_alert_payload("a1", "NVDA", "price_above"),
+                make_alert_payload("a2", "AAPL", "price_below"),
+            ]
+        ),
+    )
+    cache.put_alerts([make_alert_payload("a3", "NVDA", "price_below")])
+
+    result = cache.get_listing({"symbol": "NVDA"})
+
+    assert [alert["id"] for alert in result["data"]] == ["a3", "a1"]
+
+
+def test_stale_and_invalidated_entries_are_not_served(tmp_path):
+    """Test the staleness window and write invalidation."""
+    path = str(tmp_path / "alerts.sqlite3")
+    cache = AlertCache(path, max_age=60)
+    cache.put_listing({}, make_listing([make_alert_payload("a1", "NVDA", "price_below")]))
+
+    with patch("stockalert.cli.cache.time.time", return_value=10**10):
+        assert cache.get_alert("a1") is None
+        assert cache.get_listing({}) is None
+
+    cache.invalidate("a1")
+    assert cache.get_alert("a1") is None
+    assert cache.get_listing({}) is None
+
+
+def test_cmd_get_uses_cache_and_refresh_bypasses_it(tmp_path, monkeypatch, capsys):
+    """Test that `stockalert get` reads through the cache unless --refresh is given."""
+    monkeypatch.setenv("STOCKALERT_API_KEY", "sk_test_valid_key")
+    monkeypatch.setenv("STOCKALERT_CACHE_DIR", str(tmp_path))
+
+    with AlertCache(default_cache_path("sk_test_valid_key"), 60) as cache:
+        cache.put_alerts([make_alert_payload("a1", "NVDA", "price_below")])
+
+    args = argparse.Namespace(alert_id="a1", json=False, max_age=60, refresh=False)
+    with patch("stockalert.resources.alerts.AlertsResource.get") as get:
+        cli.cmd_get(args)
+    get.assert_not_called()
+    assert "Symbol: NVDA" in capsys.readouterr().out
+
+    args.refresh = True
+    with patch("stockalert.resources.alerts.AlertsResource._request") as request:
+        request.return_value = make_alert_payload("a1", "NVDA", "price_below", status="paused")
+        cli.cmd_get(args)
+    request.assert_called_once()
+    assert "Status: paused" in capsys.readouterr().out
+
+
+def test_invalid_max_age_env_is_a_usage_error(tmp_path, monkeypatch, capsys):
+    """Test that a non-numeric STOCKALERT_CACHE_MAX_AGE exits with a message, not a traceback."""
+    monkeypatch.setenv("STOCKALERT_API_KEY", "sk_test_valid_key")
+    monkeypatch.setenv("STOCKALERT_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("STOCKALERT_CACHE_MAX_AGE", "abc")
+
+    args = argparse.Namespace(alert_id="a1", json=False, max_age=None, refresh=False)
+    with pytest.raises(SystemExit) as exit_info:
+        cli.cmd_get(args)
+
+    assert exit_info.value.code == 2
+    assert "STOCKALERT_CACHE_MAX_AGE" in capsys.readouterr().err
@@ -38,3 +38,27 @@ def test_missing_async_client_raises_helpful_import_error():
 
     with pytest.raises(ImportError, match="requires httpx"):
         AsyncStockAlert(api_key="sk_test_valid_key")
+
+
+def test_client_resources_share_one_session():
+    """Test that the client and all resources share one connection pool."""
+    client = StockAlert(api_key="sk_test_valid_key", pool_maxsize=25)
+
+    assert client.alerts._session is client.session
+    assert client.user._session is client.session
+    assert client.webhooks._session is client.session
+    assert client.session.get_adapter("https://stockalert.pro")._pool_maxsize == 25
+
+
+def test_client_close_closes_shared_session():
+    """Test that leaving the context manager closes the shared transport."""
+    with StockAlert(api_key="sk_test_valid_key") as client:
+        transport = client._transport
+
+    assert transport.closed
+
+
+def test_client_keep_alive_can_be_disabled():
+    """Test that keep-alive can be turned off."""
+    client = StockAlert(api_key="sk_test_valid_key", keep_alive=False)
+    assert client.session.headers["Connection"] == "close"
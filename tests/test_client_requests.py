@@ -1,10 +1,11 @@
 """Test client HTTP request handling."""
+import json
 from unittest.mock import Mock, patch
 
 import pytest
 import requests
 
-from stockalert import NetworkError, RateLimitError, StockAlert
+from stockalert import APIError, NetworkError, RateLimitError, StockAlert
 
 
 class TestClientRequests:
@@ -75,3 +76,104 @@ class TestClientRequests:
             with patch("time.sleep"):  # Don't actually sleep in tests
                 result = client._request("GET", "/test")
                 assert result == {}
+
+
+class TestConditionalRequests:
+    """Test ETag revalidation of GET responses."""
+
+    def test_not_modified_serves_cached_alert(self):
+        """Test that a 304 reuses the cached body and sends If-None-Match."""
+        client = StockAlert(api_key="sk_test_key")
+        alert_payload = {
+            "id": "alert_1",
+            "symbol": "AAPL",
+            "condition": "price_above",
+            "threshold": 150.0,
+            "notification": "email",
+            "status": "active",
+            "created_at": "2026-03-19T12:00:00Z",
+        }
+
+        first = Mock()
+        first.ok = True
+        first.status_code = 200
+        first.headers = {"ETag": '"v1"'}
+        first.json.return_value = {"success": True, "data": alert_payload}
+        first.content = json.dumps(first.json.return_value).encode()
+
+        second = Mock()
+        second.ok = True
+        second.status_code = 304
+        second.headers = {"ETag": '"v1"'}
+        second.json.side_effect = ValueError("no body")
+
+        with patch.object(client.session, "request", side_effect=[first, second]) as request:
+            assert client.alerts.get("alert_1").symbol == "AAPL"
+            alert = client.alerts.get("alert_1")
+
+        assert alert.id == "alert_1"
+        assert request.call_args_list[0].kwargs["headers"] is None
+        assert request.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+    def test_not_modified_does_not_serve_caller_mutations(self):
+        """Test that mutating a returned body does not leak into later 304s."""
+        client = StockAlert(api_key="sk_test_key")
+
+        first = Mock()
+        first.ok = True
+        first.status_code = 200
+        first.headers = {"ETag": '"v1"'}
+        first.json.return_value = {"success": True, "data": [{"id": "wh_1"}]}
+        first.content = b'{"success": true, "data": [{"id": "wh_1"}]}'
+
+        not_modified = Mock()
+        not_modified.ok = True
+        not_modified.status_code = 304
+        not_modified.headers = {"ETag": '"v1"'}
+
+        with patch.object(client.session, "request", side_effect=[first, not_modified, not_modified]):
+            client.webhooks.list().append({"id": "injected"})
+            second = client.webhooks.list()
+            second[0]["id"] = "changed"
+            third = client.webhooks.list()
+
+        assert third == [{"id": "wh_1"}]
+
+    def test_not_modified_without_cached_entry_refetches(self):
+        """Test that a 304 with nothing cached retries without validators."""
+        client = StockAlert(api_key="sk_test_key")
+
+        not_modified = Mock()
+        not_modified.ok = True
+        not_modified.status_code = 304
+        not_modified.headers = {}
+        not_modified.json.side_effect = ValueError("no body")
+
+        full = Mock()
+        full.ok = True
+        full.status_code = 200
+        full.headers = {}
+        full.json.return_value = {"success": True, "data": [{"id": "wh_1"}]}
+
+        with patch.object(client.session, "request", side_effect=[not_modified, full]) as request:
+            assert client.webhooks.list() == [{"id": "wh_1"}]
+        assert request.call_count == 2
+
+        with patch.object(client.session, "request", side_effect=[not_modified, not_modified]):
+            with pytest.raises(APIError, match="304"):
+                client.webhooks.list()
+
+    def test_responses_without_validators_are_not_cached(self):
+        """Test that only responses with ETag/Last-Modified are kept."""
+        client = StockAlert(api_key="sk_test_key")
+
+        mock_response = Mock()
+        mock_response.ok = True
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.json.return_value = {"success": True, "data": []}
+
+        with patch.object(client.session, "request", return_value=mock_response):
+            client.webhooks.list()
+
+        assert len(client._transport.validators) == 0
@@ -0,0 +1,75 @@
+"""Test pluggable JSON codecs."""
+from unittest.mock import Mock, patch
+
+import pytest
+
+from stockalert import JSONCodec, StockAlert, ValidationError
+from stockalert.codec import resolve_codec
+
+
+def test_resolve_codec_defaults_to_stdlib():
+    """Test codec selection by name and fallback."""
+    assert type(resolve_codec(None)) is JSONCodec
+    assert type(resolve_codec("json")) is JSONCodec
+
+    codec = JSONCodec()
+    assert resolve_codec(codec) is codec
+
+    with pytest.raises(ValidationError, match="Unknown JSON codec"):
+        resolve_codec("yaml")
+
+    with patch("stockalert.codec._AUTO_ORDER", ("not_a_json_backend",)), patch.dict(
+        "stockalert.codec.CODECS", {"not_a_json_backend": Mock(side_effect=ImportError)}
+    ):
+        assert type(resolve_codec("auto")) is JSONCodec
+
+
+def test_stdlib_codec_encodes_compact_utf8_bytes():
+    """Test that request bodies are encoded straight to bytes."""
+    assert JSONCodec().dumps({"symbol": "NVDA", "note": "é"}) == '{"symbol":"NVDA","note":"é"}'.encode()
+
+
+def test_client_sends_and_decodes_with_orjson():
+    """Test that a selected backend encodes bodies and decodes responses."""
+    pytest.importorskip("orjson")
+    client = StockAlert(api_key="sk_test_valid_key", codec="orjson")
+
+    response = Mock()
+    response.ok = True
+    response.status_code = 200
+    response.headers = {}
+    response.content = b'{"success": true, "data": {"id": "alert_1"}}'
+
+    with patch.object(client.session, "request", return_value=response) as request:
+        result = client._request("POST", "/alerts", json={"symbol": "NVDA"})
+        webhook = client.webhooks.create(url="https://example.com/hook", events=["alert.triggered"])
+
+    assert result == {"id": "alert_1"}
+    assert webhook == {"id": "alert_1"}
+    assert request.call_args_list[0].kwargs["data"] == b'{"symbol":"NVDA"}'
+    assert isinstance(request.call_args_list[1].kwargs["data"], bytes)
+    response.json.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_client_uses_selected_codec():
+    """Test that the async client encodes and decodes with the codec."""
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("orjson")
+    from stockalert import AsyncStockAlert
+
+    bodies = []
+
+    def handler(request):
+        bodies.append(request.content)
+        return httpx.Response(200, content=b'{"success": true, "data": {"ok": true}}')
+
+    async with AsyncStockAlert(api_key="sk_test_valid_key", codec="orjson") as client:
+        client._client = httpx.AsyncClient(
+            base_url="https://stockalert.pro/api/v1",
+            transport=httpx.MockTransport(handler),
+        )
+        result = await client._request("POST", "/alerts", json={"symbol": "NVDA"})
+
+    assert result == {"ok": True}
+    assert bodies == [b'{"symbol":"NVDA"}']
@@ -0,0 +1,73 @@
+"""Test the local alert mirror."""
+from unittest.mock import patch
+
+from stockalert import StockAlert
+from stockalert.exceptions import NotFoundError
+from stockalert.types import Alert
+from tests.helpers import make_alert_payload, make_listing
+
+
+def test_mirror_indexes_alerts_for_local_queries():
+    """Test that mirror() loads everything and answers indexed queries."""
+    client = StockAlert(api_key="sk_test_valid_key")
+    listing = make_listing(
+        [
+            make_alert_payload("a1", "NVDA", "price_below"),
+            make_alert_payload("a2", "NVDA", "price_above"),
+            make_alert_payload("a3", "NVDA", "price_below", status="paused"),
+            make_alert_payload("a4", "AAPL", "price_below"),
+        ]
+    )
+
+    with patch.object(client.alerts, "_request", return_value=listing):
+        mirror = client.alerts.mirror()
+
+    assert len(mirror) == 4
+    assert [a.id for a in mirror.query(symbol="nvda", status="active", condition="price_below")] == ["a1"]
+    assert {a.id for a in mirror.query(condition="price_below")} == {"a1", "a3", "a4"}
+    assert mirror.query(symbol="TSLA") == []
+
+
+def test_mirror_refresh_applies_only_changes():
+    """Test that refresh re-indexes changed alerts and drops deleted ones."""
+    client = StockAlert(api_key="sk_test_valid_key")
+    before = make_listing([make_alert_payload("a1", "NVDA", "price_below"), make_alert_payload("a2", "AAPL", "new_high")])
+    after = make_listing(
+        [
+            make_alert_payload("a1", "NVDA", "price_below", status="triggered", triggered_at="2026-03-20T15:00:00Z"),
+            make_alert_payload("a3", "MSFT", "price_above"),
+        ]
+    )
+
+    with patch.object(client.alerts, "_request", side_effect=[before, after]):
+        mirror = client.alerts.mirror()
+        changes = mirror.refresh()
+
+    assert changes == {"added": 1, "updated": 1, "removed": 1}
+    assert mirror.query(status="active") == [mirror.get("a3")]
+    assert mirror.query(symbol="NVDA", status="triggered")[0].id == "a1"
+    assert "a2" not in mirror
+
+
+def test_mirror_filtered_refresh_refetches_alerts_that_left_the_filter():
+    """Test that alerts missing from a filtered refresh are fetched individually."""
+    client = StockAlert(api_key="sk_test_valid_key")
+    initial = make_listing([make_alert_payload("a1", "NVDA", "price_below"), make_alert_payload("a2", "AAPL", "new_high")])
+
+    def fake_request(method, path, params=None, **kwargs):
+        if path == "/alerts":
+            return make_listing([])
+        if path == "/alerts/a1":
+            return make_alert_payload("a1", "NVDA", "price_below", status="paused")
+        raise NotFoundError("Alert not found")
+
+    with patch.object(client.alerts, "_request", return_value=initial):
+        mirror = client.alerts.mirror()
+
+    with patch.object(client.alerts, "_request", side_effect=fake_request):
+        changes = mirror.refresh(status="active")
+
+    assert changes == {"added": 0, "updated": 1, "removed": 1}
+    assert isinstance(mirror.get("a1"), Alert)
+    assert mirror.get("a1").status == "paused"
+    assert "a2" not in mirror
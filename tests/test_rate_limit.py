@@ -0,0 +1,106 @@
+"""Test client-side rate limiting."""
+from unittest.mock import Mock, patch
+
+from stockalert import StockAlert
+from stockalert.rate_limit import RateLimiter
+
+NOW = 1_736_180_000.0
+
+
+def make_headers(limit: int, remaining: int, reset_in: float) -> dict:
+    return {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(int((NOW + reset_in) * 1000)),
+    }
+
+
+@patch("stockalert.rate_limit.time.time", return_value=NOW)
+def test_limiter_is_transparent_until_budget_is_known(_time):
+    """Test that requests are not delayed before any headers were seen."""
+    limiter = RateLimiter()
+    assert limiter.reserve() == 0
+    assert limiter.state == {"limit": None, "remaining": None, "reset": None}
+
+
+@patch("stockalert.rate_limit.time.time", return_value=NOW)
+def test_limiter_learns_budget_and_waits_for_reset(_time):
+    """Test that the limiter paces requests once the budget is spent."""
+    limiter = RateLimiter()
+    limiter.update(make_headers(limit=30, remaining=2, reset_in=20))
+
+    assert limiter.state["remaining"] == 2
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == 20
+    # A request beyond the next full window waits for the one after it.
+    for _ in range(29):
+        limiter.reserve()
+    assert limiter.reserve() == 80
+
+
+def test_limiter_refills_after_reset():
+    """Test that the whole budget is restored when the window resets."""
+    limiter = RateLimiter()
+    with patch("stockalert.rate_limit.time.time", return_value=NOW):
+        limiter.update(make_headers(limit=30, remaining=0, reset_in=10))
+    with patch("stockalert.rate_limit.time.time", return_value=NOW + 11):
+        assert limiter.reserve() == 0
+        assert limiter.state["remaining"] == 29
+
+
+@patch("stockalert.rate_limit.time.time", return_value=NOW)
+def test_limiter_trusts_server_when_its_window_resets_first(_time):
+    """Test that a server-side reset ahead of the local clock restores the budget."""
+    limiter = RateLimiter()
+    limiter.update(make_headers(limit=100, remaining=1, reset_in=5))
+    limiter.reserve()
+    limiter.update(make_headers(limit=100, remaining=0, reset_in=5))
+    assert limiter.state["remaining"] == 0
+
+    # Server already in its next window while the local one has 5 s left
+    limiter.update(make_headers(limit=100, remaining=99, reset_in=65))
+    assert limiter.state["remaining"] == 99
+    assert limiter.reserve() == 0
+
+    # Within a window, the smaller local count still wins
+    limiter.reserve()
+    limiter.reserve()
+    limiter.update(make_headers(limit=100, remaining=98, reset_in=65))
+    assert limiter.state["remaining"] == 96
+
+
+@patch("stockalert.rate_limit.time.time", return_value=NOW)
+def test_limiter_penalize_blocks_requests(_time):
+    """Test that a 429 holds requests until Retry-After passes."""
+    limiter = RateLimiter()
+    limiter.penalize(15)
+    assert limiter.reserve() == 15
+
+
+def test_client_exposes_rate_limit_from_response_headers():
+    """Test that the sync client feeds response headers into the limiter."""
+    client = StockAlert(api_key="sk_test_valid_key")
+
+    mock_response = Mock()
+    mock_response.ok = True
+    mock_response.status_code = 200
+    mock_response.headers = make_headers(limit=30, remaining=29, reset_in=60)
+    mock_response.json.return_value = {"success": True, "data": {"id": "123"}}
+
+    with patch("stockalert.rate_limit.time.time", return_value=NOW):
+        with patch.object(client.session, "request", return_value=mock_response):
+            client.webhooks.get("123")
+
+        assert client.rate_limit["limit"] == 30
+        assert client.rate_limit["remaining"] == 29
+        assert client.rate_limit["reset"] == NOW + 60
+
+
+def test_shared_limiter_across_clients():
+    """Test that one limiter instance can pace several clients."""
+    limiter = RateLimiter()
+    first = StockAlert(api_key="sk_test_valid_key", rate_limiter=limiter)
+    second = StockAlert(api_key="sk_test_valid_key", rate_limiter=limiter)
+
+    assert first.alerts._transport.rate_limiter is second.user._transport.rate_limiter
@@ -2,8 +2,9 @@
 from unittest.mock import AsyncMock, patch
 
 import pytest
+import requests
 
-from stockalert import AsyncStockAlert, StockAlert
+from stockalert import APIError, AsyncStockAlert, StockAlert, ValidationError
 from stockalert.types import Alert, PaginatedResponse, UserSubscription
 
 
@@ -116,3 +117,245 @@ async def test_async_user_get_subscription_returns_typed_object():
 
     assert isinstance(subscription, UserSubscription)
     assert subscription.watchlist_quota == 100
+
+
+@pytest.mark.asyncio
+async def test_async_webhooks_route_through_async_request():
+    """Test that async webhook calls use the shared httpx client, not requests."""
+    pytest.importorskip("httpx")
+
+    async with AsyncStockAlert(api_key="sk_test_valid_key") as client:
+        request = AsyncMock(return_value=[{"id": "wh_1"}])
+        with patch.object(client, "_request", new=request):
+            webhooks = await client.webhooks.list()
+            await client.webhooks.create("https://example.com/hook")
+
+    assert webhooks == [{"id": "wh_1"}]
+    request.assert_any_await("GET", "/webhooks")
+    request.assert_any_await(
+        "POST", "/webhooks", json={"url": "https://example.com/hook", "events": ["alert.triggered"]}
+    )
+    assert not hasattr(client.webhooks, "_session")
+
+
+def make_page_payload(page: int, total_pages: int, per_page: int = 2) -> dict:
+    return {
+        "data": [make_alert_payload(f"alert_{page}_{i}") for i in range(per_page)],
+        "meta": {
+            "pagination": {
+                "page": page,
+                "limit": per_page,
+                "total": total_pages * per_page,
+                "total_pages": total_pages,
+            },
+        },
+    }
+
+
+def test_alerts_iterate_concurrently_preserves_page_order():
+    """Test that concurrent iteration fetches every page and yields in order."""
+    client = StockAlert(api_key="sk_test_valid_key")
+    requested_pages = []
+
+    def fake_request(method, path, params=None, **kwargs):
+        requested_pages.append(params["page"])
+        return make_page_payload(params["page"], total_pages=5)
+
+    with patch.object(client.alerts, "_request", side_effect=fake_request):
+        ids = [alert.id for alert in client.alerts.iterate(concurrency=3, limit=2)]
+
+    assert ids == [f"alert_{page}_{i}" for page in range(1, 6) for i in range(2)]
+    assert sorted(requested_pages) == [1, 2, 3, 4, 5]
+
+
+def test_alerts_iterate_rejects_invalid_concurrency():
+    """Test that concurrency must be positive."""
+    client = StockAlert(api_key="sk_test_valid_key")
+
+    with pytest.raises(ValidationError, match="concurrency"):
+        next(client.alerts.iterate(concurrency=0))
+
+
+def test_alerts_keep_raw_false_drops_source_dicts():
+    """Test that list, get and iterate pass keep_raw through to Alert."""
+    client = StockAlert(api_key="sk_test_valid_key")
+
+    def fake_request(method, path, params=None, **kwargs):
+        if path == "/alerts/alert_123":
+            return make_alert_payload()
+        return make_page_payload(params.get("page", 1), total_pages=2)
+
+    with patch.object(client.alerts, "_request", side_effect=fake_request):
+        listed = client.alerts.list(keep_raw=False).data
+        fetched = client.alerts.get("alert_123", keep_raw=False)
+        iterated = list(client.alerts.iterate(concurrency=2, keep_raw=False))
+        kept = client.alerts.get("alert_123")
+
+    assert len(iterated) == 4
+    for alert in listed + iterated + [fetched]:
+        assert alert._raw_data is None
+    assert fetched.to_dict()["symbol"] == "AAPL"
+    assert kept._raw_data == make_alert_payload()
+
+
+@pytest.mark.asyncio
+async def test_async_alerts_keep_raw_false_drops_source_dicts():
+    """Test that the async resource passes keep_raw through to Alert."""
+    pytest.importorskip("httpx")
+
+    async def fake_request(method, path, params=None, **kwargs):
+        if path == "/alerts/alert_123":
+            return make_alert_payload()
+        return make_page_payload(params.get("page", 1), total_pages=2)
+
+    async with AsyncStockAlert(api_key="sk_test_valid_key") as client:
+        with patch.object(client, "_request", new=AsyncMock(side_effect=fake_request)):
+            listed = (await client.alerts.list(keep_raw=False)).data
+            fetched = await client.alerts.get("alert_123", keep_raw=False)
+            iterated = [alert async for alert in client.alerts.iterate(keep_raw=False)]
+
+    assert len(iterated) == 4
+    for alert in listed + iterated + [fetched]:
+        assert alert._raw_data is None
+    assert fetched.to_dict()["symbol"] == "AAPL"
+
+
+@pytest.mark.asyncio
+async def test_async_alerts_iterate_prefetches_pages_in_order():
+    """Test that async prefetching yields every page in order."""
+    pytest.importorskip("httpx")
+
+    async def fake_request(method, path, params=None, **kwargs):
+        return make_page_payload(params["page"], total_pages=4)
+
+    async with AsyncStockAlert(api_key="sk_test_valid_key") as client:
+        with patch.object(client, "_request", new=AsyncMock(side_effect=fake_request)):
+            ids = [alert.id async for alert in client.alerts.iterate(concurrency=2, limit=2)]
+
+    assert ids == [f"alert_{page}_{i}" for page in range(1, 5) for i in range(2)]
+
+
+@pytest.mark.asyncio
+async def test_async_alerts_iterate_cancels_prefetch_on_early_stop():
+    """Test that outstanding page fetches are cancelled when the consumer stops."""
+    pytest.importorskip("httpx")
+    import asyncio
+
+    cancelled = []
+
+    async def fake_request(method, path, params=None, **kwargs):
+        if params["page"] > 1:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(params["page"])
+                raise
+        return make_page_payload(params["page"], total_pages=10)
+
+    async with AsyncStockAlert(api_key="sk_test_valid_key") as client:
+        with patch.object(client, "_request", new=AsyncMock(side_effect=fake_request)):
+            iterator = client.alerts.iterate(concurrency=3, limit=2)
+            first = await iterator.__anext__()
+            await asyncio.sleep(0)
+            await iterator.aclose()
+
+    assert first.id == "alert_1_0"
+    assert sorted(cancelled) == [2, 3, 4]
+
+
+def test_alerts_bulk_create_reports_per_item_results():
+    """Test that bulk_create validates up front and isolates failures."""
+    client = StockAlert(api_key="sk_test_valid_key")
+    sent = []
+
+    def fake_request(method, path, json_data=None, **kwargs):
+        sent.append(json_data["symbol"])
+        if json_data["symbol"] == "FAIL":
+            raise APIError("Quota exceeded", 403)
+        return make_alert_payload(f"alert_{json_data['symbol']}")
+
+    items = [
+        {"symbol": "aapl", "condition": "price_above", "threshold": 200},
+        {"symbol": "MSFT", "condition": "price_above"},  # missing threshold
+        {"symbol": "FAIL", "condition": "price_below", "threshold": 10},
+    ]
+    with patch.object(client.alerts, "_request", side_effect=fake_request):
+        results = client.alerts.bulk_create(items, concurrency=2)
+
+    assert [result.ok for result in results] == [True, False, False]
+    assert results[0].result.id == "alert_AAPL"
+    assert isinstance(results[1].error, ValidationError)
+    assert isinstance(results[2].error, APIError)
+    assert sorted(sent) == ["AAPL", "FAIL"]
+    # Inputs are not mutated
+    assert items[0]["symbol"] == "aapl"
+
+
+def test_alerts_bulk_pause_rejects_missing_ids_without_sending():
+    """Test that bulk ID operations report missing IDs per item."""
+    client = StockAlert(api_key="sk_test_valid_key")
+
+    with patch.object(
+        client.alerts, "_request", return_value={"alertId": "a1", "status": "paused"}
+    ) as request:
+        results = client.alerts.bulk_pause(["a1", ""])
+
+    assert results[0].result == {"alertId": "a1", "status": "paused"}
+    assert isinstance(results[1].error, ValidationError)
+    request.assert_called_once_with("POST", "/alerts/a1/pause")
+
+
+@pytest.mark.asyncio
+async def test_async_alerts_bulk_delete():
+    """Test async bulk deletes return per-item results."""
+    pytest.importorskip("httpx")
+
+    async def fake_request(method, path, **kwargs):
+        if path.endswith("missing"):
+            raise APIError("Not found", 404)
+        return {"deleted": True}
+
+    async with AsyncStockAlert(api_key="sk_test_valid_key") as client:
+        with patch.object(client, "_request", new=AsyncMock(side_effect=fake_request)):
+            results = await client.alerts.bulk_delete(["a1", "missing", "a2"])
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert results[1].error.status_code == 404
+
+
+def test_alerts_bulk_keeps_results_when_an_item_raises_a_non_sdk_error():
+    """Test that unexpected exceptions are reported per item, not raised."""
+    client = StockAlert(api_key="sk_test_valid_key")
+
+    def fake_request(method, path, **kwargs):
+        if "/a2/" in path:
+            raise requests.exceptions.ChunkedEncodingError("connection broken")
+        if "/a3/" in path:
+            raise ValueError("bad JSON")
+        return {"alertId": path.split("/")[2], "status": "paused"}
+
+    with patch.object(client.alerts, "_request", side_effect=fake_request):
+        results = client.alerts.bulk_pause(["a1", "a2", "a3", "a4"], concurrency=2)
+
+    assert [result.ok for result in results] == [True, False, False, True]
+    assert isinstance(results[1].error, requests.exceptions.ChunkedEncodingError)
+    assert isinstance(results[2].error, ValueError)
+    assert results[3].result["alertId"] == "a4"
+
+
+@pytest.mark.asyncio
+async def test_async_alerts_bulk_keeps_results_when_an_item_raises_a_non_sdk_error():
+    """Test the async per-item isolation of unexpected exceptions."""
+    pytest.importorskip("httpx")
+
+    async def fake_request(method, path, **kwargs):
+        if path.endswith("a2"):
+            raise RuntimeError("unexpected")
+        return {"deleted": True}
+
+    async with AsyncStockAlert(api_key="sk_test_valid_key") as client:
+        with patch.object(client, "_request", new=AsyncMock(side_effect=fake_request)):
+            results = await client.alerts.bulk_delete(["a1", "a2", "a3"])
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, RuntimeError)
@@ -0,0 +1,142 @@
+"""Test coalescing of identical in-flight GET requests."""
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+
+from stockalert import APIError, StockAlert
+from stockalert.singleflight import SingleFlight
+from tests.helpers import make_alert_payload
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def test_single_flight_shares_results_and_errors():
+    """Test that waiters get the leader's result or exception."""
+    flights = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def slow(value):
+        calls.append(value)
+        release.wait(2)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        ok = [executor.submit(flights.do, "ok", lambda: slow("result")) for _ in range(3)]
+        failing = [executor.submit(flights.do, "bad", lambda: slow(APIError("boom", 500))) for _ in range(3)]
+        wait_for(lambda: flights.shared == 4)
+        release.set()
+
+        assert [future.result() for future in ok] == ["result"] * 3
+        for future in failing:
+            with pytest.raises(APIError, match="boom"):
+                future.result()
+
+    assert len(calls) == 2
+    assert len(flights) == 0
+
+
+def test_single_flight_shares_copies_with_waiters():
+    """Test that ``share`` hands each waiter its own copy of the result."""
+    flights = SingleFlight()
+    release = threading.Event()
+
+    def slow():
+        release.wait(2)
+        return ["result"]
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(flights.do, "key", slow, list) for _ in range(3)]
+        wait_for(lambda: flights.shared == 2)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert results == [["result"]] * 3
+    assert len({id(result) for result in results}) == 3
+
+
+def test_concurrent_gets_share_one_http_call():
+    """Test that concurrent alerts.get calls for one ID are coalesced."""
+    client = StockAlert(api_key="sk_test_valid_key")
+    release = threading.Event()
+
+    response = Mock()
+    response.ok = True
+    response.status_code = 200
+    response.headers = {}
+    response.json.return_value = {"success": True, "data": make_alert_payload("alert_1")}
+    response.content = json.dumps(response.json.return_value).encode()
+
+    def slow_request(**kwargs):
+        release.wait(2)
+        return response
+
+    with patch.object(client.session, "request", side_effect=slow_request) as request:
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(client.alerts.get, "alert_1") for _ in range(5)]
+            wait_for(lambda: client._transport.flights.shared == 4)
+            release.set()
+            alerts = [future.result() for future in futures]
+
+        client.alerts.get("alert_1")
+
+    assert {alert.id for alert in alerts} == {"alert_1"}
+    assert request.call_count == 2  # one coalesced call, then one new call
+
+    # Every waiter gets its own objects
+    alerts[0].to_dict()["status"] = "changed"
+    assert [alert.to_dict()["status"] for alert in alerts[1:]] == ["active"] * 4
+
+
+def test_coalescing_can_be_disabled():
+    """Test the coalesce_requests switch."""
+    client = StockAlert(api_key="sk_test_valid_key", coalesce_requests=False)
+
+    assert client._transport.flights is None
+
+
+@pytest.mark.asyncio
+async def test_async_concurrent_gets_share_one_request():
+    """Test that concurrent async GETs share a request and its errors."""
+    pytest.importorskip("httpx")
+    import asyncio
+
+    from stockalert import AsyncStockAlert
+
+    calls = []
+
+    async def fake_send(method, path, params, json_data, auth_mode):
+        calls.append(path)
+        await asyncio.sleep(0.01)
+        if path.endswith("missing"):
+            raise APIError("Alert not found", 404)
+        payload = {"success": True, "data": make_alert_payload(path.rsplit("/", 1)[1])}
+        return payload, json.dumps(payload).encode()
+
+    async with AsyncStockAlert(api_key="sk_test_valid_key") as client:
+        with patch.object(client, "_send_request", side_effect=fake_send):
+            cancelled = asyncio.ensure_future(client.alerts.get("alert_1"))
+            others = [client.alerts.get("alert_1") for _ in range(3)]
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            alerts = await asyncio.gather(*others)
+
+            missing = await asyncio.gather(
+                *[client.alerts.get("missing") for _ in range(3)], return_exceptions=True
+            )
+
+    assert [alert.id for alert in alerts] == ["alert_1"] * 3
+    assert len({id(alert.to_dict()) for alert in alerts}) == 3
+    assert all(isinstance(error, APIError) for error in missing)
+    assert calls == ["/alerts/alert_1", "/alerts/missing"]
@@ -0,0 +1,127 @@
+"""Test incremental parsing of streamed responses."""
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from stockalert import APIError, StockAlert
+from stockalert.streaming import EnvelopeParser
+from stockalert.types import Alert
+from tests.helpers import make_page_payload
+
+
+def feed_in_chunks(parser, text, size):
+    items = []
+    for start in range(0, len(text), size):
+        items.extend(parser.feed(text[start:start + size]))
+    items.extend(parser.feed("", final=True))
+    return items
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 4096])
+def test_parser_yields_items_across_any_chunk_boundary(size):
+    """Test that elements and envelope members survive arbitrary splits."""
+    payload = {
+        "success": True,
+        "data": [{"id": "a1", "threshold": 123.5}, 42, "x", None, [1, 2]],
+        "meta": {"pagination": {"page": 1, "total_pages": 3}},
+    }
+    parser = EnvelopeParser()
+
+    items = feed_in_chunks(parser, json.dumps(payload, indent=1), size)
+
+    assert items == payload["data"]
+    assert parser.envelope == {"success": True, "meta": payload["meta"]}
+    assert parser.done
+
+
+def test_parser_returns_items_before_the_document_ends():
+    """Test that a complete element is available before the body finishes."""
+    parser = EnvelopeParser()
+
+    assert parser.feed('{"data": [{"id": "a1"}, {"id": "a') == [{"id": "a1"}]
+    assert parser.feed('2"}], "meta": {}}') == [{"id": "a2"}]
+
+
+def test_parser_does_not_split_numbers_at_chunk_boundaries():
+    """Test that a number ending a chunk waits for the rest of its digits."""
+    parser = EnvelopeParser()
+
+    assert parser.feed('{"data": [12') == []
+    assert parser.feed("34, 5]}") == [1234, 5]
+
+
+def test_parser_rejects_truncated_and_malformed_documents():
+    """Test error reporting for bad bodies."""
+    with pytest.raises(ValueError, match="Truncated"):
+        EnvelopeParser().feed('{"data": [1, 2', final=True)
+    with pytest.raises(ValueError):
+        EnvelopeParser().feed('["data"]')
+
+
+def make_streamed_response(payload, chunk_size=5):
+    body = json.dumps(payload).encode()
+    response = Mock()
+    response.ok = True
+    response.status_code = 200
+    response.headers = {}
+    response.iter_content.side_effect = lambda size: (
+        body[start:start + chunk_size] for start in range(0, len(body), chunk_size)
+    )
+    return response
+
+
+def test_stream_yields_alerts_and_releases_the_connection():
+    """Test alerts.stream parsing, meta and connection cleanup."""
+    client = StockAlert(api_key="sk_test_valid_key")
+    response = make_streamed_response(make_page_payload(1, total_pages=4, per_page=3))
+
+    with patch.object(client.session, "request", return_value=response) as request:
+        page = client.alerts.stream(symbol="aapl", limit=3)
+        alerts = list(page)
+
+    assert [alert.id for alert in alerts] == ["alert_1_0", "alert_1_1", "alert_1_2"]
+    assert all(isinstance(alert, Alert) for alert in alerts)
+    assert page.total_pages == 4
+    assert request.call_args.kwargs["stream"] is True
+    assert request.call_args.kwargs["params"]["symbol"] == "AAPL"
+    response.close.assert_called()
+
+
+def test_stream_history_raises_unsuccessful_envelopes():
+    """Test that a success=false body is reported after streaming."""
+    client = StockAlert(api_key="sk_test_valid_key")
+    response = make_streamed_response({"success": False, "data": [], "error": {"message": "Nope"}})
+
+    with patch.object(client.session, "request", return_value=response):
+        with pytest.raises(APIError, match="Nope"):
+            list(client.alerts.stream_history("alert_1"))
+
+
+@pytest.mark.asyncio
+async def test_async_stream_parses_chunks_as_they_arrive():
+    """Test that the async client streams and parses the body."""
+    httpx = pytest.importorskip("httpx")
+    from stockalert import AsyncStockAlert
+
+    body = json.dumps(make_page_payload(2, total_pages=2, per_page=2)).encode()
+
+    class Chunks(httpx.AsyncByteStream):
+        async def __aiter__(self):
+            for start in range(0, len(body), 7):
+                yield body[start:start + 7]
+
+    def handler(request):
+        assert request.url.params["page"] == "2"
+        return httpx.Response(200, stream=Chunks())
+
+    async with AsyncStockAlert(api_key="sk_test_valid_key") as client:
+        client._client = httpx.AsyncClient(
+            base_url="https://stockalert.pro/api/v1",
+            transport=httpx.MockTransport(handler),
+        )
+        async with await client.alerts.stream(page=2, limit=2) as page:
+            ids = [alert.id async for alert in page]
+
+    assert ids == ["alert_2_0", "alert_2_1"]
+    assert page.pagination["page"] == 2
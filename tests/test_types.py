@@ -1,7 +1,15 @@
 """Test type definitions."""
+import pickle
 from datetime import datetime
+from unittest.mock import patch
 
-from stockalert.types import Alert, PaginatedResponse, UserSubscription, WebhookPayload
+from stockalert.types import (
+    Alert,
+    PaginatedResponse,
+    UserSubscription,
+    WebhookPayload,
+    _parse_datetime,
+)
 
 
 def test_alert_initialization():
@@ -113,3 +121,49 @@ def test_paginated_response_preserves_dict_style_access():
     assert response["data"][0]["id"] == "test-123"
     assert response.get("meta", {})["pagination"]["page"] == 1
     assert response.to_dict()["meta"]["rate_limit"]["remaining"] == 29
+
+
+def test_alert_parses_datetimes_lazily():
+    """Test that Alert is slotted and defers datetime parsing until access."""
+    data = {
+        "id": "test-123",
+        "symbol": "AAPL",
+        "condition": "price_above",
+        "threshold": 150.0,
+        "notification": "email",
+        "status": "active",
+        "created_at": "2024-01-01T00:00:00Z",
+        "last_evaluated_at": "2024-01-02T00:00:00Z",
+    }
+
+    with patch("stockalert.types._parse_datetime", wraps=_parse_datetime) as parse:
+        alert = Alert(data)
+        assert parse.call_count == 0
+        assert alert.updated_at == alert.created_at
+        assert alert.last_triggered is None
+        assert alert.created_at.year == 2024
+        calls = parse.call_count
+
+    assert calls == 2  # created_at and triggered_at, each parsed once
+    assert not hasattr(alert, "__dict__")
+    assert alert.last_evaluated_at.day == 2
+
+
+def test_alert_without_raw_data_round_trips():
+    """Test that keep_raw=False rebuilds to_dict() from the fields."""
+    data = {
+        "id": "test-123",
+        "symbol": "AAPL",
+        "condition": "price_above",
+        "threshold": 150.0,
+        "notification": "email",
+        "status": "triggered",
+        "created_at": "2024-01-01T00:00:00Z",
+        "triggered_at": "2024-01-01T01:00:00Z",
+        "stock": {"symbol": "AAPL", "last_price": 155.0},
+    }
+
+    alert = Alert(data, keep_raw=False)
+
+    assert alert.to_dict() == data
+    assert pickle.loads(pickle.dumps(alert)).triggered_at == alert.triggered_at
@@ -4,6 +4,7 @@ import pytest
 from stockalert.client import StockAlert
 from stockalert.exceptions import ValidationError
 from stockalert.resources.alerts import AlertsResource
+from stockalert.validation import CONDITIONS, RULES
 
 
 def make_resource() -> AlertsResource:
@@ -127,3 +128,49 @@ def test_client_validation():
 
     with pytest.raises(ValidationError, match="Invalid API key format"):
         StockAlert(api_key="invalid_key")
+
+
+def test_rule_table_covers_every_condition():
+    """Test that every AlertCondition has a declared rule."""
+    assert set(RULES) == set(CONDITIONS)
+
+
+def test_validate_many_reports_every_error_per_item():
+    """Test bulk pre-validation without modifying the items."""
+    resource = make_resource()
+    items = [
+        {"symbol": "aapl", "condition": "price_above", "threshold": 200},
+        {"symbol": "TOOLONGSYMBOL", "condition": "rsi_limit", "threshold": 150, "notification": "fax"},
+        {},
+        {
+            "symbol": "MSFT",
+            "condition": "insider_transactions",
+            "threshold": 0,
+            "parameters": {"direction": "up", "windowDays": 0},
+        },
+    ]
+
+    problems = resource.validate_many(items)
+
+    assert sorted(problems) == [1, 2, 3]
+    assert problems[1] == [
+        "Symbol must be 1-10 chars: A-Z, 0-9, dot or hyphen",
+        "Notification must be one of: email, sms",
+        "RSI threshold must be between 0 and 100",
+    ]
+    assert problems[2] == ["Symbol is required", "Condition is required"]
+    assert problems[3] == [
+        "insider_transactions threshold must be greater than 0",
+        "insider_transactions direction must be buy, sell or both",
+        "insider_transactions windowDays must be a positive integer",
+    ]
+    assert items[0]["symbol"] == "aapl"
+
+
+def test_create_validation_normalizes_symbol():
+    """Test that single-item validation still upper-cases the symbol."""
+    data = {"symbol": " nvda ", "condition": "new_high"}
+
+    make_resource()._validate_create_request(data)
+
+    assert data["symbol"] == "NVDA"
@@ -0,0 +1,168 @@
+"""Test webhook event routing."""
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from stockalert import WebhookDispatcher, WebhookPayload
+from stockalert.webhooks import WebhookReceiver
+from tests.helpers import WEBHOOK_SECRET, make_webhook_body, make_webhook_payload, post_webhook
+
+
+def test_routes_by_event_symbol_and_condition():
+    """Test that every matching route runs, most specific first."""
+    dispatcher = WebhookDispatcher()
+    calls = []
+
+    def record(name):
+        return lambda payload: calls.append(name)
+
+    dispatcher.on("alert.triggered", record("event"))
+    dispatcher.on("alert.triggered", record("symbol"), symbol="nvda")
+    dispatcher.on("alert.triggered", record("other condition"), condition="price_below")
+    dispatcher.on("alert.triggered", record("both"), symbol="NVDA", condition="price_above")
+    dispatcher.on("*", record("any"))
+
+    routes = dispatcher.match(make_webhook_payload())
+    assert [(route.symbol, route.condition) for route in routes[:3]] == [
+        ("NVDA", "price_above"),
+        ("NVDA", None),
+        (None, None),
+    ]
+    assert routes[3].event == "*"
+
+    with dispatcher:
+        for future in dispatcher.dispatch(make_webhook_payload()):
+            future.result()
+        assert [future.result() for future in dispatcher.dispatch(make_webhook_payload(event="alert.created"))] == [None]
+
+    assert sorted(calls) == ["any", "any", "both", "event", "symbol"]
+    assert dispatcher.unrouted == 0
+
+
+def test_event_only_routes_do_not_normalize_data():
+    """Test that routing on event alone leaves payload data untouched."""
+    dispatcher = WebhookDispatcher()
+    dispatcher.on("alert.triggered", lambda payload: None)
+
+    with patch.object(WebhookPayload, "_normalize_data") as normalize:
+        assert len(dispatcher.match(make_webhook_payload())) == 1
+        assert dispatcher.match(make_webhook_payload(event="alert.deleted")) == []
+
+    normalize.assert_not_called()
+
+
+def test_thread_pool_respects_route_concurrency_and_records_stats():
+    """Test per-route limits, failures and latency stats on the thread pool."""
+    dispatcher = WebhookDispatcher(max_workers=8)
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    @dispatcher.on("alert.triggered", concurrency=2)
+    def limited(payload):
+        with lock:
+            running.append(payload.id)
+            peak.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(payload.id)
+        if payload.id == "evt_3":
+            raise RuntimeError("boom")
+        return payload.id
+
+    with dispatcher:
+        futures = [dispatcher.dispatch(make_webhook_payload(event_id=f"evt_{i}"))[0] for i in range(6)]
+        results = [future.exception() or future.result() for future in futures]
+
+    route = dispatcher.routes[0]
+    assert max(peak) == 2
+    assert isinstance(results[3], RuntimeError)
+    assert results[:3] == ["evt_0", "evt_1", "evt_2"]
+    assert (route.stats.calls, route.stats.failures, route.in_flight) == (6, 1, 0)
+    assert route.stats.max_seconds >= route.stats.mean_seconds > 0
+
+
+@pytest.mark.asyncio
+async def test_dispatch_async_limits_coroutines_and_isolates_failures():
+    """Test asyncio dispatch with a concurrency limit and a failing route."""
+    dispatcher = WebhookDispatcher()
+    active = []
+    peak = []
+
+    @dispatcher.on("alert.triggered", concurrency=1)
+    async def serial(payload):
+        active.append(payload.id)
+        peak.append(len(active))
+        await asyncio.sleep(0.001)
+        active.remove(payload.id)
+        return payload.id
+
+    @dispatcher.on("alert.triggered", symbol="NVDA")
+    def failing(payload):
+        raise ValueError("bad")
+
+    results = await asyncio.gather(*(dispatcher.dispatch_async(make_webhook_payload(event_id=f"evt_{i}")) for i in range(3)))
+    dispatcher.close()
+
+    assert peak == [1, 1, 1]
+    assert [result[1] for result in results] == ["evt_0", "evt_1", "evt_2"]
+    assert all(isinstance(result[0], ValueError) for result in results)
+    assert dispatcher.routes[1].stats.failures == 3
+    assert await dispatcher.dispatch_async(make_webhook_payload(event="alert.deleted")) == []
+    assert dispatcher.unrouted == 1
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_is_a_receiver_handler():
+    """Test plugging the dispatcher into WebhookReceiver."""
+    dispatcher = WebhookDispatcher()
+    handled = []
+
+    @dispatcher.on("alert.triggered", symbol="NVDA")
+    async def on_nvda(payload):
+        handled.append(payload.id)
+
+    app = WebhookReceiver(WEBHOOK_SECRET, dispatcher)
+    status, _, _ = await post_webhook(app, make_webhook_body("evt_9"))
+    await app.stop()
+
+    assert status == 200
+    assert handled == ["evt_9"]
+    assert app.stats["processed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_shared_by_thread_pool_and_async_dispatch():
+    """Test that one limit covers dispatch(), dispatch_async() and cancelled waiters."""
+    dispatcher = WebhookDispatcher(max_workers=4)
+    lock = threading.Lock()
+    running = []
+    peak = []
+    handled = []
+
+    @dispatcher.on("alert.triggered", concurrency=1)
+    def limited(payload):
+        with lock:
+            running.append(payload.id)
+            peak.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(payload.id)
+            handled.append(payload.id)
+        return payload.id
+
+    threaded = dispatcher.dispatch(make_webhook_payload(event_id="evt_thread"))
+    cancelled = asyncio.ensure_future(dispatcher.dispatch_async(make_webhook_payload(event_id="evt_cancelled")))
+    awaited = asyncio.ensure_future(dispatcher.dispatch_async(make_webhook_payload(event_id="evt_async")))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    assert await awaited == ["evt_async"]
+    assert threaded[0].result(timeout=2) == "evt_thread"
+    assert max(peak) == 1
+    assert sorted(handled) == ["evt_async", "evt_thread"]
+    assert dispatcher.routes[0].in_flight == 0
+    dispatcher.close()
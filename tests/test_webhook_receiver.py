@@ -0,0 +1,84 @@
+"""Test the ASGI webhook receiver."""
+import asyncio
+
+import pytest
+
+from stockalert.webhooks import WebhookReceiver
+from tests.helpers import WEBHOOK_SECRET, make_webhook_body, post_webhook
+
+
+@pytest.mark.asyncio
+async def test_receiver_acks_before_handling_and_processes_in_background():
+    """Test that webhooks are acknowledged first and handled by workers."""
+    handled = []
+    release = asyncio.Event()
+
+    async def handler(payload):
+        await release.wait()
+        handled.append(payload.id)
+
+    app = WebhookReceiver(WEBHOOK_SECRET, handler, workers=2)
+
+    status, _, body = await post_webhook(app, make_webhook_body("evt_1"))
+    assert (status, body) == (200, {"received": True})
+    assert handled == []
+
+    release.set()
+    await app.stop()
+    assert handled == ["evt_1"]
+    assert app.stats["processed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_receiver_rejects_bad_requests():
+    """Test signature, payload and size checks."""
+    app = WebhookReceiver(WEBHOOK_SECRET, lambda payload: None, max_body_size=1000)
+
+    assert (await post_webhook(app, make_webhook_body(), signature="sha256=00"))[0] == 401
+    assert (await post_webhook(app, b'{"event": "x"}'))[0] == 400
+    legacy = b'{"id": "e", "event": "alert.triggered", "timestamp": 1, "data": {"alert_id": "a1"}}'
+    assert (await post_webhook(app, legacy))[0] == 400
+    assert (await post_webhook(app, b" " * 2000))[0] == 413
+    assert app.stats["rejected"] == 4
+    await app.stop()
+
+
+@pytest.mark.asyncio
+async def test_receiver_applies_backpressure_when_queue_is_full():
+    """Test that a full queue answers 503 with Retry-After."""
+    release = asyncio.Event()
+
+    async def handler(payload):
+        await release.wait()
+
+    app = WebhookReceiver(WEBHOOK_SECRET, handler, workers=1, queue_size=1, enqueue_timeout=0.01)
+
+    assert (await post_webhook(app, make_webhook_body("evt_1")))[0] == 200  # taken by the worker
+    await asyncio.sleep(0)
+    assert (await post_webhook(app, make_webhook_body("evt_2")))[0] == 200  # queued
+    status, headers, _ = await post_webhook(app, make_webhook_body("evt_3"))
+
+    assert status == 503
+    assert headers[b"retry-after"] == b"1"
+    assert app.stats["throttled"] == 1
+
+    release.set()
+    await app.stop()
+    assert app.stats["processed"] == 2
+
+
+@pytest.mark.asyncio
+async def test_receiver_runs_sync_handlers_in_executor_and_logs_failures(caplog):
+    """Test plain function handlers and failure accounting."""
+    def handler(payload):
+        if payload.id == "evt_bad":
+            raise RuntimeError("boom")
+
+    app = WebhookReceiver(WEBHOOK_SECRET, handler)
+    await post_webhook(app, make_webhook_body("evt_ok"))
+    await post_webhook(app, make_webhook_body("evt_bad"))
+    await app.stop()
+
+    assert app.stats["processed"] == 1
+    assert app.stats["failed"] == 1
+    assert "evt_bad" in caplog.text
@@ -0,0 +1,136 @@
+"""Test webhook timestamp tolerance and duplicate detection."""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from stockalert import MemorySeenEvents, SQLiteSeenEvents, WebhookVerifier
+from stockalert.resources.webhooks import WebhooksResource
+from stockalert.webhooks import SeenEvents, WebhookReceiver
+from tests.helpers import WEBHOOK_SECRET, make_webhook_body, post_webhook
+
+NOW = 1736180400.0
+
+
+def test_tolerance_rejects_stale_and_missing_timestamps():
+    """Test that only recent timestamps pass when a tolerance is set."""
+    verifier = WebhookVerifier(WEBHOOK_SECRET, tolerance=300)
+    body = b'{"event":"alert.triggered"}'
+
+    # Epoch milliseconds, epoch seconds (as strings or numbers) and ISO 8601
+    for timestamp in ("1736180400000", "1736180200000", "1736180400", 1736180200, "2025-01-06T16:20:00Z"):
+        signature = verifier.sign(body, timestamp)
+        assert verifier.verify(body, signature, timestamp, now=NOW) is True
+
+    for old in ("1736180000000", "1736180000", 1736180000):
+        assert verifier.verify(body, verifier.sign(body, old), old, now=NOW) is False
+    stale = "1736180000000"
+    assert verifier.verify(body, verifier.sign(body), None, now=NOW) is False
+    assert verifier.verify(body, verifier.sign(body, "soon"), "soon", now=NOW) is False
+
+    # Without a tolerance the timestamp is only part of the signed message
+    assert WebhookVerifier(WEBHOOK_SECRET).verify(body, verifier.sign(body, stale), stale) is True
+
+
+def test_verify_signature_accepts_tolerance():
+    """Test the tolerance option of the static helper."""
+    body = '{"event":"alert.triggered"}'
+    stale = "1736180000000"
+    signature = WebhookVerifier(WEBHOOK_SECRET).sign(body, stale)
+
+    assert WebhooksResource.verify_signature(body, signature, WEBHOOK_SECRET, stale) is True
+    assert WebhooksResource.verify_signature(body, signature, WEBHOOK_SECRET, stale, tolerance=300) is False
+
+
+def test_seen_events_is_abstract():
+    """Test that stores must implement the whole interface."""
+    with pytest.raises(TypeError):
+        SeenEvents()
+
+    class Partial(SeenEvents):
+        def add(self, event_id):
+            return True
+
+    with pytest.raises(TypeError):
+        Partial()
+
+
+def test_memory_seen_events_expire_and_stay_bounded():
+    """Test TTL expiry and size eviction of the in-memory store."""
+    seen = MemorySeenEvents(ttl=10, max_entries=3)
+
+    with patch("stockalert.webhooks.replay.time.monotonic", return_value=100.0):
+        assert [seen.add(event_id) for event_id in ("a", "b", "a", "c", "d")] == [True, True, False, True, True]
+        assert "a" not in seen  # evicted as the oldest
+        assert len(seen) == 3
+
+    with patch("stockalert.webhooks.replay.time.monotonic", return_value=111.0):
+        assert "b" not in seen
+        assert seen.add("b") is True
+        assert len(seen) == 1
+
+
+def test_sqlite_seen_events_are_shared_between_connections(tmp_path):
+    """Test that two stores on one file agree on which IDs are new."""
+    path = str(tmp_path / "state" / "seen.db")
+
+    with SQLiteSeenEvents(path, ttl=60) as first, SQLiteSeenEvents(path, ttl=60) as second:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda store: store.add("evt_1"), [first, second] * 4))
+        assert results.count(True) == 1
+        assert "evt_1" in second
+
+        second.discard("evt_1")
+        assert first.add("evt_1") is True
+
+    with SQLiteSeenEvents(path, ttl=60) as reopened:
+        assert "evt_1" in reopened
+        with patch("stockalert.webhooks.replay.time.time", return_value=time.time() + 61):
+            assert "evt_1" not in reopened
+            assert reopened.add("evt_1") is True
+
+
+@pytest.mark.asyncio
+async def test_receiver_acknowledges_duplicates_without_handling():
+    """Test that redelivered events are acked but handled only once."""
+    handled = []
+
+    async def handler(payload):
+        handled.append(payload.id)
+
+    verifier = WebhookVerifier(WEBHOOK_SECRET, seen=MemorySeenEvents())
+    app = WebhookReceiver(verifier, handler)
+
+    first, _, _ = await post_webhook(app, make_webhook_body("evt_1"))
+    again, _, body = await post_webhook(app, make_webhook_body("evt_1"))
+    other, _, _ = await post_webhook(app, make_webhook_body("evt_2"))
+    await app.stop()
+
+    assert (first, again, other) == (200, 200, 200)
+    assert body == {"received": True, "duplicate": True}
+    assert handled == ["evt_1", "evt_2"]
+    assert app.stats["duplicates"] == 1
+
+
+@pytest.mark.asyncio
+async def test_receiver_forgets_events_it_could_not_queue():
+    """Test that a throttled event is not treated as a duplicate later."""
+    release = asyncio.Event()
+
+    async def handler(payload):
+        await release.wait()
+
+    verifier = WebhookVerifier(WEBHOOK_SECRET, seen=MemorySeenEvents())
+    app = WebhookReceiver(verifier, handler, workers=1, queue_size=1, enqueue_timeout=0.01)
+
+    assert (await post_webhook(app, make_webhook_body("evt_1")))[0] == 200
+    await asyncio.sleep(0)  # worker takes evt_1
+    assert (await post_webhook(app, make_webhook_body("evt_2")))[0] == 200
+    assert (await post_webhook(app, make_webhook_body("evt_3")))[0] == 503
+
+    release.set()
+    await app.stop()
+    assert (await post_webhook(app, make_webhook_body("evt_3")))[0] == 200
+    await app.stop()
@@ -0,0 +1,75 @@
+"""Test multi-secret webhook verification."""
+from unittest.mock import patch
+
+import pytest
+
+from stockalert import RotatingWebhookVerifier, WebhookVerifier
+from stockalert.resources.webhooks import WebhooksResource
+
+BODY = b'{"event":"alert.triggered"}'
+TIMESTAMP = "1736180400000"
+
+
+def signed_with(secret):
+    return WebhookVerifier(secret).sign(BODY, TIMESTAMP)
+
+
+def test_reports_matching_key_and_tries_it_first():
+    """Test that the last matching key moves to the front."""
+    verifier = RotatingWebhookVerifier({"old": "secret_old", "new": "secret_new"})
+
+    assert verifier.key_ids == ["old", "new"]
+    assert verifier.match(BODY, signed_with("secret_old"), TIMESTAMP) == "old"
+    assert verifier.match(BODY, signed_with("secret_new"), TIMESTAMP) == "new"
+    assert verifier.key_ids == ["new", "old"]
+    assert verifier.verify(BODY, signed_with("secret_old"), TIMESTAMP) is True
+    assert verifier.match(BODY, signed_with("secret_other"), TIMESTAMP) is None
+    assert verifier.match(BODY, "sha256=zz", TIMESTAMP) is None
+
+    # Signing uses the most recently added secret
+    assert verifier.sign(BODY, TIMESTAMP) == signed_with("secret_new")
+
+
+def test_added_keys_get_fingerprint_ids_and_can_be_removed():
+    """Test adding and removing secrets at runtime."""
+    verifier = RotatingWebhookVerifier(["secret_a"])
+    key_a = verifier.key_ids[0]
+    key_b = verifier.add_secret("secret_b")
+
+    assert len(key_b) == 8 and key_b != key_a
+    assert verifier.match(BODY, signed_with("secret_b"), TIMESTAMP) == key_b
+
+    verifier.remove_secret(key_b)
+    assert verifier.match(BODY, signed_with("secret_b"), TIMESTAMP) is None
+    assert verifier.sign(BODY, TIMESTAMP) == signed_with("secret_a")
+    with pytest.raises(ValueError):
+        verifier.remove_secret(key_a)
+    with pytest.raises(ValueError):
+        RotatingWebhookVerifier([])
+
+
+def test_unused_old_keys_retire_automatically():
+    """Test retirement of keys that stopped matching, but never the newest."""
+    with patch("stockalert.webhooks.verifier.time.monotonic", return_value=1000.0):
+        verifier = RotatingWebhookVerifier({"old": "secret_old", "new": "secret_new"}, retire_after=100)
+        assert verifier.match(BODY, signed_with("secret_new"), TIMESTAMP) == "new"
+
+    with patch("stockalert.webhooks.verifier.time.monotonic", return_value=1050.0):
+        assert verifier.match(BODY, signed_with("secret_old"), TIMESTAMP) == "old"
+
+    with patch("stockalert.webhooks.verifier.time.monotonic", return_value=1200.0):
+        assert verifier.match(BODY, signed_with("secret_old"), TIMESTAMP) == "old"
+
+    with patch("stockalert.webhooks.verifier.time.monotonic", return_value=1400.0):
+        assert verifier.match(BODY, signed_with("secret_new"), TIMESTAMP) == "new"
+        assert verifier.key_ids == ["new"]
+        assert verifier.retired == ["old"]
+        assert verifier.match(BODY, signed_with("secret_old"), TIMESTAMP) is None
+
+
+def test_verify_signature_accepts_several_secrets():
+    """Test the static helper during a rotation."""
+    signature = signed_with("secret_new")
+
+    assert WebhooksResource.verify_signature(BODY, signature, ["secret_old", "secret_new"], TIMESTAMP)
+    assert not WebhooksResource.verify_signature(BODY, signature, ["secret_old"], TIMESTAMP)
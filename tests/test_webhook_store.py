@@ -0,0 +1,95 @@
+"""Test the append-only webhook event store."""
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+from stockalert import WebhookDispatcher, WebhookEventStore
+from tests.helpers import make_webhook_payload
+
+START_MS = 1773921600000
+MINUTE_MS = 60_000
+
+
+def fill(store):
+    for index in range(30):
+        store.append(
+            make_webhook_payload(
+                f"evt_{index}",
+                symbol=("NVDA", "TSLA", "AAPL")[index % 3],
+                alert_id=f"a{index % 5}",
+                timestamp=START_MS + index * MINUTE_MS,
+                price=100.0 + index,
+            )
+        )
+
+
+def test_scans_by_symbol_alert_and_time_range(tmp_path):
+    """Test index lookups and range scans."""
+    with WebhookEventStore(str(tmp_path), segment_size=2048) as store:
+        fill(store)
+
+        assert len(store) == 30
+        assert len(os.listdir(tmp_path)) > 1  # rolled over to new segments
+        assert store.symbols == ["AAPL", "NVDA", "TSLA"]
+        assert [p.id for p in store.scan(symbol="tsla")][:3] == ["evt_1", "evt_4", "evt_7"]
+        assert [p.id for p in store.scan(symbol="TSLA", alert_id="a1")] == ["evt_1", "evt_16"]
+        assert store.count(alert_id="a0") == 6
+        assert store.count(symbol="MSFT") == 0
+
+        start = datetime(2026, 3, 19, 12, 10, tzinfo=timezone.utc)
+        window = list(store.scan(start=start, end="2026-03-19T12:15:00Z"))
+        assert [p.id for p in window] == ["evt_10", "evt_11", "evt_12", "evt_13", "evt_14"]
+        assert store.count(symbol="NVDA", start=start) == 6
+
+        payload = store.get(29)
+        assert payload.data["stock"]["price"] == 129.0
+        assert payload.timestamp == datetime(2026, 3, 19, 12, 29, tzinfo=timezone.utc)
+        with pytest.raises(IndexError):
+            store.get(30)
+
+
+def test_out_of_order_timestamps_fall_back_to_filtering(tmp_path):
+    """Test range scans when events were not appended in time order."""
+    with WebhookEventStore(str(tmp_path)) as store:
+        store.append(make_webhook_payload("evt_5", timestamp=START_MS + 5 * MINUTE_MS))
+        store.append(make_webhook_payload("evt_1", timestamp=START_MS + 1 * MINUTE_MS))
+        store.append(make_webhook_payload("evt_3", timestamp=START_MS + 3 * MINUTE_MS))
+
+        assert [p.id for p in store.scan(start=START_MS + 2 * MINUTE_MS)] == ["evt_5", "evt_3"]
+
+
+def test_reopen_rebuilds_index_and_ignores_torn_write(tmp_path):
+    """Test recovery from the segment headers after a crash mid-append."""
+    with WebhookEventStore(str(tmp_path), segment_size=4096) as store:
+        fill(store)
+        last_segment = store._segments[-1]
+        end = last_segment.end
+
+    # Simulate a torn record: header present, body partly written
+    path = last_segment.path
+    with open(path, "r+b") as segment:
+        segment.seek(end)
+        segment.write(b"\x40\x00\x00\x00\x01\x02\x03\x04" + b"\x00" * 12 + b'{"id": ')
+
+    with WebhookEventStore(str(tmp_path), segment_size=4096) as store:
+        assert len(store) == 30
+        assert store.count(symbol="AAPL") == 10
+        store.append(make_webhook_payload("evt_30", symbol="MSFT", timestamp=START_MS + 30 * MINUTE_MS))
+
+    with WebhookEventStore(str(tmp_path), segment_size=4096) as store:
+        assert len(store) == 31
+        assert [p.id for p in store.scan(symbol="MSFT")] == ["evt_30"]
+
+
+def test_replay_into_dispatcher(tmp_path):
+    """Test replaying a filtered range through the dispatcher."""
+    seen = []
+    dispatcher = WebhookDispatcher(max_workers=2)
+    dispatcher.on("alert.triggered", lambda payload: seen.append(payload.id), symbol="NVDA")
+
+    with dispatcher, WebhookEventStore(str(tmp_path)) as store:
+        fill(store)
+        assert store.replay(dispatcher, symbol="NVDA", end="2026-03-19T12:10:00Z") == 4
+
+    assert sorted(seen) == ["evt_0", "evt_3", "evt_6", "evt_9"]
@@ -1,7 +1,13 @@
 """Test webhook functionality."""
 import hashlib
 import hmac
+import io
+import json
+from unittest.mock import patch
 
+import pytest
+
+from stockalert import WebhookVerifier
 from stockalert.resources.webhooks import WebhooksResource
 from stockalert.types import WebhookPayload
 
@@ -43,6 +49,32 @@ class TestWebhooks:
         assert not WebhooksResource.verify_signature(payload, signature, secret)
         assert not WebhooksResource.verify_signature("", signature, secret)
 
+    def test_verify_signature_accepts_bytes_secret(self):
+        """Test that a bytes secret is one key, not a list of secrets."""
+        payload = b'{"event":"alert.triggered"}'
+        timestamp = "1736180400000"
+        signature = WebhookVerifier("webhook_secret").sign(payload, timestamp)
+
+        assert WebhooksResource.verify_signature(payload, signature, b"webhook_secret", timestamp)
+        assert not WebhooksResource.verify_signature(payload, signature, b"other_secret", timestamp)
+
+    def test_verifier_accepts_buffers_without_copying(self):
+        """Test the precomputed verifier with every supported body type."""
+        body = b'{"event":"alert.triggered","data":{}}'
+        verifier = WebhookVerifier("webhook_secret_123")
+        expected = "sha256=" + hmac.new(
+            b"webhook_secret_123", b"1736180400000." + body, hashlib.sha256
+        ).hexdigest()
+
+        for payload in (body, bytearray(body), memoryview(body), body.decode()):
+            assert verifier.verify(payload, expected, "1736180400000")
+            assert verifier.verify(payload, expected[7:], 1736180400000)
+
+        assert verifier.sign(body, "1736180400000") == expected
+        assert not verifier.verify(body, expected, "1736180400001")
+        assert not verifier.verify(body, "sha256=not-hex", "1736180400000")
+        assert not verifier.verify(memoryview(b""), expected)
+
     def test_webhook_payload_normalizes_legacy_data(self):
         """Test that legacy flat webhook payloads are normalized."""
         payload = WebhookPayload(
@@ -64,3 +96,63 @@ class TestWebhooks:
         assert payload.data["alert"]["id"] == "test-123"
         assert payload.data["alert"]["notification"] == "email"
         assert payload.data["stock"]["price"] == 155.0
+
+    def test_webhook_payload_normalizes_lazily(self):
+        """Test that data and timestamp are only processed on first access."""
+        raw = {
+            "id": "evt_1",
+            "event": "alert.triggered",
+            "timestamp": "2024-01-01T00:00:00Z",
+            "data": {"alert_id": "a1", "symbol": "AAPL", "condition": "new_high", "status": "triggered"},
+        }
+
+        with patch.object(WebhookPayload, "_normalize_data", wraps=WebhookPayload._normalize_data) as normalize:
+            payload = WebhookPayload(raw)
+            assert payload.event == "alert.triggered"
+            assert normalize.call_count == 0
+            assert payload.data is payload.data
+            assert normalize.call_count == 1
+
+        assert not hasattr(payload, "__dict__")
+        assert payload.timestamp.year == 2024
+        assert payload.to_dict()["timestamp"] == "2024-01-01T00:00:00Z"
+        assert payload.to_dict()["data"]["alert"]["symbol"] == "AAPL"
+
+    def test_parse_many_reads_ndjson(self):
+        """Test NDJSON parsing from bytes, text and file objects."""
+        events = [
+            {"id": f"evt_{i}", "event": "alert.triggered", "timestamp": 1736180400000 + i, "data": {"alert": {}}}
+            for i in range(3)
+        ]
+        ndjson = "\n".join(json.dumps(event) for event in events) + "\n\n"
+
+        for source in (ndjson, ndjson.encode(), io.BytesIO(ndjson.encode()), io.StringIO(ndjson)):
+            assert [payload.id for payload in WebhookPayload.parse_many(source)] == ["evt_0", "evt_1", "evt_2"]
+
+        with pytest.raises(ValueError, match="line 2: .*symbol"):
+            bad = {"id": "evt_x", "event": "alert.triggered", "timestamp": 1, "data": {"alert_id": "a1"}}
+            list(WebhookPayload.parse_many(ndjson.splitlines()[0] + "\n" + json.dumps(bad)))
+
+        with pytest.raises(ValueError, match="line 5"):
+            list(WebhookPayload.parse_many(ndjson + '{"id": "evt_3"}\n', codec="json"))
+
+        # Unicode line separators may appear unescaped inside JSON strings
+        note = "a\u2028b\x85c\x0cd"
+        line = json.dumps({**events[0], "data": {"alert": {"note": note}}}, ensure_ascii=False)
+        for source in (line, line.encode()):
+            assert [payload.data["alert"]["note"] for payload in WebhookPayload.parse_many(source)] == [note]
+
+    def test_webhook_payload_rejects_malformed_data_up_front(self):
+        """Test that structural problems fail at construction, not on access."""
+        base = {"id": "evt_1", "event": "alert.triggered", "timestamp": "2024-01-01T00:00:00Z"}
+
+        for data, error in [
+            ("not an object", TypeError),
+            ({"alert": ["a1"]}, TypeError),
+            ({"alert_id": "a1", "symbol": "AAPL"}, KeyError),
+        ]:
+            with pytest.raises(error):
+                WebhookPayload({**base, "data": data})
+
+        with pytest.raises(TypeError):
+            WebhookPayload({**base, "timestamp": None, "data": {"alert": {}}})